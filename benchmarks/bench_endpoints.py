@@ -0,0 +1,497 @@
+"""Drive every entity router through the ASGI app on a generated SQLite dataset.
+
+    python benchmarks/bench_endpoints.py --scale 0.1
+    python benchmarks/bench_endpoints.py --scale 1 --database /tmp/full.db
+    python benchmarks/bench_endpoints.py --compare benchmarks/results/old.json
+
+--scale 1 is 50 business units, 2k projects, 200k tasks and 2M task
+statuses. --database keeps the seeded file so later runs skip seeding.
+For each router the list, get, create, update and archive endpoints are
+timed in that order. The report gives throughput, p50/p95/p99 latency
+and the tracemalloc peak of one request. Results are written as JSON,
+keyed by git commit, for comparison across commits.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import httpx
+from dataset import ROOT, create_schema, ids, seed
+from sqlalchemy import create_engine, select
+
+
+FULL_SIZES = {
+    "employees": 5000,
+    "business_units": 50,
+    "projects": 2000,
+    "deliverables": 20000,
+    "tasks": 200000,
+    "task_statuses": 2000000,
+    "issues": 50000,
+    "issue_activities": 200000,
+}
+
+PATHS = {
+    "list": "/",
+    "get": "/{id}",
+    "create": "/",
+    "update": "/{id}",
+    "archive": "/{id}/archive",
+}
+
+START = "2026-02-01T00:00:00"
+END = "2026-03-01T00:00:00"
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    index = max(int(round(pct / 100 * len(ordered) + 0.5)) - 1, 0)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+def split_ids(values, reserved):
+    """Keep the tail of every id list for archive calls so get/update never
+    touch an archived row."""
+    reserved = min(reserved, len(values) // 2)
+    return values[: len(values) - reserved], values[len(values) - reserved :]
+
+
+class Routers:
+    def __init__(self, sizes, engine, rng, reserved, operator):
+        self.rng = rng
+        self.operator = operator
+        self.pool = {}
+        self.archive_pool = {}
+        for name in sizes:
+            self.pool[name], self.archive_pool[name] = split_ids(
+                ids(sizes, name), reserved
+            )
+        self.pool["task_types"] = [f"TT{i}" for i in range(8)]
+        self.archive_pool["task_types"] = []
+        from main import models
+
+        # vw_task_status_latest only holds the latest status of each task, so
+        # get/update target ids that are visible through it.
+        with engine.connect() as conn:
+            self.status_tasks = dict(
+                conn.execute(
+                    select(
+                        models.TaskStatusView.task_status_id,
+                        models.TaskStatusView.task_id,
+                    )
+                    .where(
+                        models.TaskStatusView.task_status_id.notin_(
+                            self.archive_pool["task_statuses"]
+                        )
+                    )
+                    .limit(500)
+                ).all()
+            )
+        self.counter = 0
+
+    def pick(self, name):
+        return self.rng.choice(self.pool[name])
+
+    def new_id(self, prefix):
+        self.counter += 1
+        return f"Z{prefix}{self.counter:07}"
+
+    def specs(self):
+        """(router, prefix, id pool, create payload, update payload[, ids])"""
+        pick, new_id, operator = self.pick, self.new_id, self.operator
+        status_ids = list(self.status_tasks)
+        return [
+            (
+                "Employee",
+                "/api/Employees",
+                "employees",
+                lambda: (
+                    lambda e: {
+                        "employee_id": e,
+                        "employee_full_name": f"Bench {e}",
+                        "employee_email_address": f"{e.lower()}@example.com",
+                        "password": "bench-password",
+                    }
+                )(new_id("E")),
+                lambda id: {
+                    "employee_full_name": f"Employee {id}",
+                    "employee_email_address": f"{id.lower()}@example.com",
+                },
+            ),
+            (
+                "BusinessUnit",
+                "/api/BusinessUnit",
+                "business_units",
+                lambda: {
+                    "business_unit_id": new_id("B"),
+                    "business_unit_name": "Bench unit",
+                    "business_unit_description": "",
+                    "business_unit_head_id": pick("employees"),
+                },
+                lambda id: {"business_unit_description": "Updated"},
+            ),
+            (
+                "EmployeeBusinessUnit",
+                "/api/EmployeesBusinessUnit",
+                "business_units",
+                lambda: {},
+                lambda id: {},
+            ),
+            (
+                "Project",
+                "/api/Projects",
+                "projects",
+                lambda: {
+                    "project_id": new_id("P"),
+                    "business_unit_id": pick("business_units"),
+                    "project_name": "Bench project",
+                    "project_description": "",
+                    "delivery_manager_id": pick("employees"),
+                    "baseline_start_date": START,
+                    "baseline_end_date": END,
+                    "planned_start_date": START,
+                    "planned_end_date": END,
+                },
+                lambda id: {"project_description": "Updated"},
+            ),
+            (
+                "Deliverable",
+                "/api/Deliverables",
+                "deliverables",
+                lambda: {
+                    "deliverable_id": new_id("D"),
+                    "project_id": pick("projects"),
+                    "deliverable_name": "Bench deliverable",
+                    "deliverable_description": "",
+                    "priority": "Medium",
+                    "baseline_start_date": START,
+                    "baseline_end_date": END,
+                    "planned_start_date": START,
+                    "planned_end_date": END,
+                },
+                lambda id: {"priority": "Low"},
+            ),
+            (
+                "Task",
+                "/api/Tasks",
+                "tasks",
+                lambda: {
+                    "task_id": new_id("T"),
+                    "deliverable_id": pick("deliverables"),
+                    "task_name": "Bench task",
+                    "task_description": "Created by the endpoint benchmark",
+                    "task_type_id": pick("task_types"),
+                    "priority": "High",
+                    "baseline_start_date": START,
+                    "baseline_end_date": END,
+                    "planned_start_date": START,
+                    "planned_end_date": END,
+                    "effort_estimated_in_hours": "8",
+                    "assignee_id": pick("employees"),
+                    "reviewer_id": pick("employees"),
+                },
+                lambda id: {
+                    "task_id": id,
+                    "task_type_id": pick("task_types"),
+                    "business_unit_id": None,
+                    "business_unit_head_id": None,
+                    "priority": "Low",
+                    "updated_by": operator,
+                    "updated_by_name": operator,
+                    "entity_status": "Active",
+                },
+            ),
+            (
+                "TaskType",
+                "/api/TaskType",
+                "task_types",
+                lambda: {
+                    "task_type_id": new_id("Y"),
+                    "task_type_Name": "Bench type",
+                    "task_type_description": "",
+                },
+                lambda id: {"task_type_description": "Updated"},
+            ),
+            (
+                "TaskStatus",
+                "/api/TaskStatus",
+                "task_statuses",
+                lambda: {
+                    "task_status_id": new_id("S"),
+                    "task_id": pick("tasks"),
+                    "action_date": START,
+                    "progress": "50",
+                    "hours_spent": "4",
+                    "remarks": "Benchmark update",
+                },
+                lambda id: {
+                    "task_status_id": id,
+                    "task_id": self.status_tasks[id],
+                    "business_unit_id": "",
+                    "business_unit_head_id": "",
+                    "project_id": "",
+                    "created_by_name": operator,
+                    "updated_at": START,
+                    "updated_by": operator,
+                    "updated_by_name": operator,
+                    "entity_status": "Active",
+                },
+                status_ids,
+            ),
+            (
+                "Issue",
+                "/api/Issues",
+                "issues",
+                lambda: {
+                    "issue_id": new_id("I"),
+                    "task_id": pick("tasks"),
+                    "issue_title": "Bench issue",
+                    "issue_description": "",
+                    "action_owner_id": pick("employees"),
+                    "issue_priority": "High",
+                    "issue_status": "Open",
+                },
+                lambda id: {
+                    "business_unit_id": None,
+                    "project_id": None,
+                    "deliverable_id": None,
+                    "task_id": None,
+                    "issue_id": None,
+                    "action_owner_id": None,
+                    "issue_title": "Updated",
+                    "updated_at": START,
+                    "updated_by": operator,
+                    "updated_by_name": operator,
+                    "entity_status": "Active",
+                },
+            ),
+            (
+                "IssueActivity",
+                "/api/IssueActivities",
+                "issue_activities",
+                lambda: {
+                    "issue_activity_id": new_id("A"),
+                    "issue_id": pick("issues"),
+                    "comment_by": pick("employees"),
+                    "comment": "Benchmark comment",
+                },
+                lambda id: {"comment": "Updated"},
+            ),
+        ]
+
+
+async def run_endpoint(client, method, make_request, count, concurrency):
+    latencies = []
+    statuses = {}
+    remaining = iter(range(count))
+
+    async def worker():
+        for _ in remaining:
+            path, payload = make_request()
+            start = time.perf_counter()
+            response = await client.request(method, path, json=payload)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    path, payload = make_request()
+    tracemalloc.start()
+    await client.request(method, path, json=payload)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    errors = sum(n for code, n in statuses.items() if code >= 400)
+    return {
+        "requests": count,
+        "errors": errors,
+        "status_counts": {str(code): n for code, n in sorted(statuses.items())},
+        "throughput_rps": round(count / elapsed, 2) if elapsed else None,
+        "mean_ms": round(sum(latencies) / len(latencies), 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+        "peak_memory_bytes": peak,
+    }
+
+
+async def run(args, sizes, engine):
+    from main.main import app
+    from routers.login import create_access_token
+
+    operator = ids(sizes, "employees")[0]
+    token = create_access_token({"sub": f"{operator.lower()}@example.com"})
+    rng = random.Random(args.seed)
+    per_router = args.requests + 1
+    routers = Routers(sizes, engine, rng, per_router, operator)
+    results = []
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=None,
+    ) as client:
+        for spec in routers.specs():
+            router, prefix, pool, create, update = spec[:5]
+            target_ids = spec[5] if len(spec) > 5 else routers.pool[pool]
+            archive_ids = iter(routers.archive_pool[pool])
+            operations = [
+                ("list", "GET", lambda: (f"{prefix}/", None), args.heavy_requests),
+                (
+                    "get",
+                    "GET",
+                    lambda: (f"{prefix}/{rng.choice(target_ids)}", None),
+                    args.requests,
+                ),
+                (
+                    "create",
+                    "POST",
+                    lambda: (f"{prefix}/", create()),
+                    args.heavy_requests,
+                ),
+                (
+                    "update",
+                    "PUT",
+                    lambda: (lambda id: (f"{prefix}/{id}", update(id)))(
+                        rng.choice(target_ids)
+                    ),
+                    args.requests,
+                ),
+            ]
+            if routers.archive_pool[pool]:
+                operations.append(
+                    (
+                        "archive",
+                        "PATCH",
+                        lambda: (f"{prefix}/{next(archive_ids)}/archive", None),
+                        min(args.heavy_requests, len(routers.archive_pool[pool]) - 1),
+                    )
+                )
+            for operation, method, make_request, count in operations:
+                if count <= 0:
+                    continue
+                result = await run_endpoint(
+                    client, method, make_request, count, args.concurrency
+                )
+                result.update(
+                    {
+                        "router": router,
+                        "operation": operation,
+                        "method": method,
+                        "path": prefix + PATHS[operation],
+                    }
+                )
+                results.append(result)
+                print(
+                    f"{router:<21} {operation:<8} {result['throughput_rps']:>9} rps "
+                    f"p50 {result['p50_ms']:>9.2f} p95 {result['p95_ms']:>9.2f} "
+                    f"p99 {result['p99_ms']:>9.2f} ms  peak "
+                    f"{result['peak_memory_bytes'] / 1e6:>7.1f} MB  "
+                    f"errors {result['errors']}"
+                )
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(previous_path, report):
+    with open(previous_path) as f:
+        previous = json.load(f)
+    before = {(r["router"], r["operation"]): r for r in previous["results"]}
+    print(f"\nagainst {previous['git_commit']} (p95 ms, throughput rps):")
+    for result in report["results"]:
+        old = before.get((result["router"], result["operation"]))
+        if old is None:
+            continue
+        change = (result["p95_ms"] - old["p95_ms"]) / old["p95_ms"] * 100
+        print(
+            f"{result['router']:<21} {result['operation']:<8} "
+            f"p95 {old['p95_ms']:>9.2f} -> {result['p95_ms']:>9.2f} ({change:+6.1f}%)  "
+            f"rps {old['throughput_rps']} -> {result['throughput_rps']}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=0.1)
+    parser.add_argument("--database", help="SQLite file to reuse between runs")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument(
+        "--heavy-requests",
+        type=int,
+        default=5,
+        help="requests for list, create and archive, which return whole tables",
+    )
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    args = parser.parse_args()
+
+    sizes = {name: max(int(n * args.scale), 1) for name, n in FULL_SIZES.items()}
+    path = args.database or os.path.join(tempfile.mkdtemp(), "endpoints.db")
+    fresh = not os.path.exists(path)
+    url = f"sqlite:///{path}"
+    os.environ["DATABASE_URL"] = url
+    sys.path.insert(0, ROOT)
+    engine = create_engine(url)
+    if fresh:
+        started = time.perf_counter()
+        create_schema(url)
+        seed(engine, sizes, args.seed)
+        print(f"seeded {path} in {time.perf_counter() - started:.1f} s")
+    print("dataset:", ", ".join(f"{name}={n}" for name, n in sizes.items()))
+
+    results = asyncio.run(run(args, sizes, engine))
+    commit = git_commit()
+    report = {
+        "git_commit": commit,
+        "recorded_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "dataset": sizes,
+        "settings": {
+            "requests": args.requests,
+            "heavy_requests": args.heavy_requests,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"endpoints-{commit}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=1)
+    print(f"wrote {output}")
+    if args.compare:
+        compare(args.compare, report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+"""Compare the vw_task join against base-table reads enriched from refcache.
+
+    python benchmarks/bench_reference_cache.py --tasks 50000
+
+Builds a throwaway SQLite database, creates vw_task from main.views, then
+times both list paths end to end (query + TaskViewBase validation).
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.orm import sessionmaker
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import models, refcache, schemas, views  # noqa: E402
+
+
+BASE_TABLES = [
+    models.Employee,
+    models.BusinessUnit,
+    models.Project,
+    models.Deliverable,
+    models.TaskType,
+    models.Task,
+]
+
+
+def seed(engine, n_tasks, rng):
+    now = datetime(2026, 1, 1)
+    audit = {
+        "created_at": now,
+        "created_by": "E00000",
+        "updated_at": now,
+        "updated_by": "E00000",
+        "entity_status": "Active",
+    }
+    n_employees = max(n_tasks // 50, 10)
+    n_bus = 50
+    n_projects = max(n_tasks // 100, n_bus)
+    n_deliverables = max(n_tasks // 10, n_projects)
+    employees = [f"E{i:05}" for i in range(n_employees)]
+    rows = {
+        models.Employee: [
+            dict(employee_id=e, employee_full_name=f"Employee {e}", **audit)
+            for e in employees
+        ],
+        models.BusinessUnit: [
+            dict(
+                business_unit_id=f"B{i:04}",
+                business_unit_name=f"Unit {i}",
+                business_unit_head_id=rng.choice(employees),
+                business_unit_description="",
+                **audit,
+            )
+            for i in range(n_bus)
+        ],
+        models.Project: [
+            dict(
+                project_id=f"P{i:05}",
+                business_unit_id=f"B{i % n_bus:04}",
+                project_name=f"Project {i}",
+                project_description="",
+                delivery_manager_id=rng.choice(employees),
+                **audit,
+            )
+            for i in range(n_projects)
+        ],
+        models.Deliverable: [
+            dict(
+                deliverable_id=f"D{i:06}",
+                project_id=f"P{i % n_projects:05}",
+                deliverable_name=f"Deliverable {i}",
+                deliverable_description="",
+                priority="Medium",
+                **audit,
+            )
+            for i in range(n_deliverables)
+        ],
+        models.TaskType: [
+            dict(
+                task_type_id=f"TT{i}",
+                task_type_Name=f"Type {i}",
+                task_type_description="",
+                **audit,
+            )
+            for i in range(8)
+        ],
+        models.Task: [
+            dict(
+                task_id=f"T{i:07}",
+                deliverable_id=f"D{rng.randrange(n_deliverables):06}",
+                task_name=f"Task {i}",
+                task_description="Lorem ipsum " * 8,
+                task_type_id=f"TT{rng.randrange(8)}",
+                priority="High",
+                baseline_start_date=now,
+                baseline_end_date=now + timedelta(days=10),
+                planned_start_date=now,
+                planned_end_date=now + timedelta(days=10),
+                effort_estimated_in_hours="16",
+                assignee_id=rng.choice(employees),
+                reviewer_id=rng.choice(employees),
+                **audit,
+            )
+            for i in range(n_tasks)
+        ],
+    }
+    with engine.begin() as conn:
+        for model, values in rows.items():
+            conn.execute(insert(model.__table__), values)
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(
+        engine, tables=[model.__table__ for model in BASE_TABLES]
+    )
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"CREATE VIEW vw_task AS {views.view_sql('vw_task', engine.dialect)}")
+        )
+    seed(engine, args.tasks, random.Random(42))
+    Session = sessionmaker(bind=engine)
+    adapter = TypeAdapter(List[schemas.TaskViewBase])
+
+    def view_path():
+        with Session() as db:
+            rows = (
+                db.query(models.TaskView)
+                .filter(models.TaskView.entity_status == "Active")
+                .all()
+            )
+            adapter.validate_python(rows, from_attributes=True)
+
+    def cache_path():
+        with Session() as db:
+            tasks = (
+                db.query(models.Task)
+                .filter(models.Task.entity_status == "Active")
+                .all()
+            )
+            adapter.validate_python(refcache.enrich_tasks(db, tasks))
+
+    with Session() as db:
+        refcache.cache.prime(db)
+    results = {
+        "view join": timed(view_path, args.repeat),
+        "refcache enrichment": timed(cache_path, args.repeat),
+    }
+    print(f"{args.tasks} tasks, {args.repeat} runs")
+    for name, (median, best) in results.items():
+        print(f"  {name:<22} median {median:8.1f} ms   best {best:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
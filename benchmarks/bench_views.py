@@ -0,0 +1,108 @@
+"""Time every vw_* view on a generated SQLite database.
+
+    python benchmarks/bench_views.py --scale 1
+
+For each view this reports a full `entity_status = 'Active'` scan and a
+batch of primary-key lookups. vw_task_status_latest is also compared with
+the equivalent ROW_NUMBER() formulation.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from dataset import DEFAULT_SIZES, create_schema, seed
+from sqlalchemy import create_engine, func, select
+
+from main import models
+from main.views import task_status, task_status_latest_view
+
+
+VIEW_MODELS = [
+    (models.EmployeeView, "employee_id"),
+    (models.BusinessUnitView, "business_unit_id"),
+    (models.EmployeeBusinessUnitView, "employee_id"),
+    (models.ProjectView, "project_id"),
+    (models.DeliverableView, "deliverable_id"),
+    (models.TaskView, "task_id"),
+    (models.TaskTypeView, "task_type_id"),
+    (models.TaskStatusView, "task_status_id"),
+    (models.IssueView, "issue_id"),
+    (models.IssueActivityView, "issue_activity_id"),
+]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def window_latest():
+    ranked = (
+        select(
+            task_status,
+            func.row_number()
+            .over(
+                partition_by=task_status.c.task_id,
+                order_by=(
+                    task_status.c.action_date.desc(),
+                    task_status.c.task_status_id.desc(),
+                ),
+            )
+            .label("rn"),
+        )
+        .where(task_status.c.entity_status == "Active")
+        .subquery()
+    )
+    return select(ranked).where(ranked.c.rn == 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--lookups", type=int, default=200)
+    args = parser.parse_args()
+
+    url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'views.db')}"
+    create_schema(url)
+    engine = create_engine(url)
+    sizes = {name: max(int(n * args.scale), 1) for name, n in DEFAULT_SIZES.items()}
+    seed(engine, sizes)
+    print("dataset:", ", ".join(f"{name}={n}" for name, n in sizes.items()))
+    print(f"{'view':<28} {'rows':>8} {'scan ms':>10} {'lookup ms':>10}")
+
+    rng = random.Random(7)
+    with engine.connect() as conn:
+        for view, pk in VIEW_MODELS:
+            table = view.__table__
+            scan = select(table).where(table.c.entity_status == "Active")
+            ids = conn.execute(select(table.c[pk])).scalars().all()
+            sample = [rng.choice(ids) for _ in range(args.lookups)] if ids else []
+            rows = len(ids)
+            scan_ms = timed(lambda: conn.execute(scan).all(), args.repeat)
+
+            def lookups():
+                for value in sample:
+                    conn.execute(select(table).where(table.c[pk] == value)).all()
+
+            lookup_ms = timed(lookups, args.repeat)
+            print(f"{table.name:<28} {rows:>8} {scan_ms:>10.1f} {lookup_ms:>10.1f}")
+
+        anti_join_ms = timed(
+            lambda: conn.execute(task_status_latest_view()).all(), args.repeat
+        )
+        window_ms = timed(lambda: conn.execute(window_latest()).all(), args.repeat)
+    print(f"latest status, NOT EXISTS anti-join: {anti_join_ms:.1f} ms")
+    print(f"latest status, ROW_NUMBER() window:  {window_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
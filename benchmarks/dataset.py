@@ -0,0 +1,35 @@
+"""Benchmark datasets, generated with main.sample_data."""
+
+import os
+import sys
+
+from alembic import command
+from alembic.config import Config
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main.sample_data import generate, ids  # noqa: E402, F401
+
+
+DEFAULT_SIZES = {
+    "employees": 500,
+    "business_units": 20,
+    "projects": 200,
+    "deliverables": 2000,
+    "tasks": 20000,
+    "task_statuses": 100000,
+    "issues": 5000,
+    "issue_activities": 20000,
+}
+
+
+def create_schema(url):
+    config = Config(os.path.join(ROOT, "alembic.ini"))
+    config.attributes["url"] = url
+    command.upgrade(config, "head")
+
+
+def seed(engine, sizes=None, seed_value=42):
+    return generate(engine, {**DEFAULT_SIZES, **(sizes or {})}, seed=seed_value)
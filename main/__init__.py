@@ -0,0 +1,4 @@
+import time
+
+
+IMPORT_STARTED = time.perf_counter()
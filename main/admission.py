@@ -0,0 +1,195 @@
+"""Admission control in front of the routers.
+
+Every request outside EXEMPT_PREFIXES is put in a priority class and takes
+a number of in-flight slots. Both come from the route table the app passes
+in, keyed by method and path. Unlisted writes are "critical" and other
+unlisted requests "read", each with one slot. A route that holds several
+pooled connections at once, like the dashboard, takes that many slots. A
+class may only start while the slots in flight, plus its own, fit within
+its share of the global limit. That limit defaults to the database pool
+capacity, so bulk reads can never take the connections a write or login
+needs. A request that does not fit is turned away at once with 503, so
+nothing queues behind a saturated pool.
+
+Each caller also has a token bucket: the employee from the bearer token,
+or the client address for anonymous requests. Behind a load balancer that
+address only means something when uvicorn resolves X-Forwarded-For from
+trusted proxies (`--proxy-headers` with FORWARDED_ALLOW_IPS, as the
+Dockerfile sets). The bucket refills at ADMISSION_RATE tokens per second
+up to ADMISSION_BURST, and a bulk request costs BULK_COST tokens. An empty
+bucket gets 429. Both refusals carry Retry-After.
+
+Everything runs on the event loop, so the counters need no lock.
+"""
+
+import json
+import math
+import os
+import time
+
+from fastapi import HTTPException
+
+
+MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "0"))
+DEFAULT_MAX_IN_FLIGHT = 15
+RATE = float(os.getenv("ADMISSION_RATE", "20"))
+BURST = float(os.getenv("ADMISSION_BURST", "40"))
+BULK_COST = 4
+MAX_BUCKETS = 10000
+
+# Share of the in-flight limit each class may fill.
+SHARES = {"critical": 1.0, "read": 0.8, "bulk": 0.5}
+COSTS = {"critical": 1, "read": 1, "bulk": BULK_COST}
+
+EXEMPT_PREFIXES = (
+    "/health/",
+    "/ready",
+    "/metrics",
+    "/debug/",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+    "/api/events",
+)
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def priority(method, path, routes):
+    """(class, slots) for a request, from `routes` or the method's default."""
+    route = routes.get((method, path))
+    if route is not None:
+        return route
+    return ("critical" if method in WRITE_METHODS else "read"), 1
+
+
+class TokenBuckets:
+    def __init__(self, rate=RATE, burst=BURST, max_buckets=MAX_BUCKETS):
+        self.rate = rate
+        self.burst = burst
+        self.max_buckets = max_buckets
+        self._buckets = {}
+
+    def take(self, key, cost, now=None):
+        """Spend `cost` tokens; returns 0, or seconds until they are there."""
+        now = time.monotonic() if now is None else now
+        tokens, updated = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        if tokens < cost:
+            self._buckets[key] = (tokens, now)
+            return (cost - tokens) / self.rate
+        self._buckets[key] = (tokens - cost, now)
+        if len(self._buckets) > self.max_buckets:
+            self._prune(now)
+        return 0
+
+    def _prune(self, now):
+        # A bucket that has refilled completely is the same as no bucket.
+        full = now - self.burst / self.rate
+        for key in [k for k, (_, updated) in self._buckets.items() if updated < full]:
+            del self._buckets[key]
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+async def _refuse(send, status_code, detail, retry_after):
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+class AdmissionControl:
+    def __init__(self, max_in_flight=None, buckets=None):
+        self.buckets = buckets or TokenBuckets()
+        self.in_flight = 0
+        self.in_flight_by_class = dict.fromkeys(SHARES, 0)
+        self.rejected = {"rate_limited": 0, "overloaded": 0}
+        self.set_limit(max_in_flight)
+
+    def set_limit(self, max_in_flight=None):
+        self.max_in_flight = MAX_IN_FLIGHT or max_in_flight or DEFAULT_MAX_IN_FLIGHT
+        self.limits = {
+            name: max(1, int(self.max_in_flight * share))
+            for name, share in SHARES.items()
+        }
+
+    def admit(self, name, caller, slots=1):
+        """None when admitted, else (status, detail, retry_after).
+
+        A request wider than its class limit is admitted only when it can
+        have the whole limit to itself.
+        """
+        wait = self.buckets.take(caller, COSTS[name])
+        if wait:
+            self.rejected["rate_limited"] += 1
+            return 429, "Rate limit exceeded", wait
+        if self.in_flight + min(slots, self.limits[name]) > self.limits[name]:
+            self.rejected["overloaded"] += 1
+            return 503, "Server is busy, retry shortly", 1
+        self.in_flight += slots
+        self.in_flight_by_class[name] += slots
+        return None
+
+    def release(self, name, slots=1):
+        self.in_flight -= slots
+        self.in_flight_by_class[name] -= slots
+
+    def stats(self):
+        return {
+            "max_in_flight": self.max_in_flight,
+            "limits": self.limits,
+            "in_flight": self.in_flight,
+            "in_flight_by_class": dict(self.in_flight_by_class),
+            "rejected": dict(self.rejected),
+            "buckets": len(self.buckets),
+        }
+
+
+control = AdmissionControl()
+
+
+class AdmissionMiddleware:
+    def __init__(
+        self, app, decode_token, routes=None, max_in_flight=None, control=control
+    ):
+        self.app = app
+        self.decode_token = decode_token
+        self.routes = routes or {}
+        self.control = control
+        if max_in_flight is not None:
+            control.set_limit(max_in_flight)
+
+    def caller(self, scope):
+        authorization = dict(scope["headers"]).get(b"authorization", b"")
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                return "employee:" + self.decode_token(token).lower()
+            except HTTPException:
+                pass
+        client = scope.get("client")
+        return "client:" + (client[0] if client else "unknown")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"].startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        name, slots = priority(scope["method"], scope["path"], self.routes)
+        refusal = self.control.admit(name, self.caller(scope), slots)
+        if refusal is not None:
+            await _refuse(send, *refusal)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.control.release(name, slots)
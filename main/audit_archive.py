@@ -0,0 +1,282 @@
+"""Move audit_log rows older than the retention window to gzip JSONL files.
+
+    python -m main.audit_archive --months 12
+
+Rows are archived in (changed_at, audit_id) order into monthly partitions
+under AUDIT_ARCHIVE_DIR, one gzip segment file per batch and month
+(audit_log_YYYY-MM_<first key>.jsonl.gz). manifest.json records each
+partition's segments, row count and time span plus the watermark, the last
+archived key. Every row at or below the watermark is in a listed segment,
+so a run interrupted between writing a batch and deleting it only has to
+delete on the next run; segments written but never listed are removed
+before archiving resumes. Run it from a single scheduler.
+"""
+
+import argparse
+import gzip
+import json
+import os
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+from main import models
+
+from .entities import audit_names, canonical_entity_type
+from .utils import now_utc
+
+
+ARCHIVE_DIR = os.getenv("AUDIT_ARCHIVE_DIR", "audit_archive")
+RETENTION_MONTHS = int(os.getenv("AUDIT_RETENTION_MONTHS", "12"))
+BATCH_SIZE = 5000
+
+COLUMNS = [column.key for column in models.AuditLog.__table__.columns]
+
+
+def _manifest_path(archive_dir):
+    return os.path.join(archive_dir, "manifest.json")
+
+
+def load_manifest(archive_dir=None):
+    path = _manifest_path(archive_dir or ARCHIVE_DIR)
+    if not os.path.exists(path):
+        return {"watermark": None, "partitions": {}}
+    with open(path) as f:
+        return json.load(f)
+
+
+def _save_manifest(archive_dir, manifest):
+    path = _manifest_path(archive_dir)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(path + ".tmp", path)
+
+
+def watermark(manifest):
+    if not manifest["watermark"]:
+        return None
+    changed_at, audit_id = manifest["watermark"]
+    return datetime.fromisoformat(changed_at), audit_id
+
+
+def retention_cutoff(months, now=None):
+    now = now or now_utc()
+    month_index = now.year * 12 + now.month - 1 - months
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _after(key):
+    changed_at, audit_id = key
+    return or_(
+        models.AuditLog.changed_at > changed_at,
+        and_(
+            models.AuditLog.changed_at == changed_at,
+            models.AuditLog.audit_id > audit_id,
+        ),
+    )
+
+
+def _serialize(row):
+    record = {column: getattr(row, column) for column in COLUMNS}
+    record["changed_at"] = row.changed_at.isoformat() if row.changed_at else None
+    return record
+
+
+def _files(partition):
+    # Manifests written before segment files recorded a single "file".
+    return partition.get("files") or [partition["file"]]
+
+
+def _remove_orphans(archive_dir, manifest):
+    """Delete segments a crashed run wrote but never recorded."""
+    known = {name for p in manifest["partitions"].values() for name in _files(p)}
+    for entry in os.scandir(archive_dir):
+        if entry.name.startswith("audit_log_") and entry.name not in known:
+            os.remove(entry.path)
+
+
+def _append(archive_dir, manifest, rows):
+    """Write each month's rows as a new segment, then record it.
+
+    A segment is written to a temp file and renamed into place, and the
+    manifest only lists it once _save_manifest runs. A crash in between
+    leaves an unlisted file that the next run deletes before archiving the
+    same rows again, so no row is ever archived twice.
+    """
+    by_month = {}
+    for row in rows:
+        by_month.setdefault(row.changed_at.strftime("%Y-%m"), []).append(row)
+    for month, month_rows in by_month.items():
+        first = month_rows[0]
+        name = (
+            f"audit_log_{month}_{first.changed_at:%d%H%M%S%f}_{first.audit_id}.jsonl.gz"
+        )
+        path = os.path.join(archive_dir, name)
+        with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+            for row in month_rows:
+                f.write(json.dumps(_serialize(row), separators=(",", ":")) + "\n")
+        os.replace(path + ".tmp", path)
+        partition = manifest["partitions"].setdefault(
+            month, {"files": [], "rows": 0, "first": first.changed_at.isoformat()}
+        )
+        if "file" in partition:
+            partition["files"] = [partition.pop("file")]
+        partition["files"].append(name)
+        partition["rows"] += len(month_rows)
+        partition["last"] = month_rows[-1].changed_at.isoformat()
+
+
+def _delete_through(db, key):
+    deleted = 0
+    while True:
+        ids = [
+            audit_id
+            for (audit_id,) in db.query(models.AuditLog.audit_id)
+            .filter(~_after(key))
+            .order_by(models.AuditLog.changed_at, models.AuditLog.audit_id)
+            .limit(BATCH_SIZE)
+        ]
+        if not ids:
+            return deleted
+        db.query(models.AuditLog).filter(models.AuditLog.audit_id.in_(ids)).delete(
+            synchronize_session=False
+        )
+        db.commit()
+        deleted += len(ids)
+
+
+def archive(db, months=None, archive_dir=None, batch_size=None):
+    archive_dir = archive_dir or ARCHIVE_DIR
+    batch_size = batch_size or BATCH_SIZE
+    cutoff = retention_cutoff(RETENTION_MONTHS if months is None else months)
+    os.makedirs(archive_dir, exist_ok=True)
+    manifest = load_manifest(archive_dir)
+    _remove_orphans(archive_dir, manifest)
+    archived = 0
+    deleted = 0
+    key = watermark(manifest)
+    if key:
+        deleted += _delete_through(db, key)
+    while True:
+        query = db.query(models.AuditLog).filter(models.AuditLog.changed_at < cutoff)
+        if key:
+            query = query.filter(_after(key))
+        rows = (
+            query.order_by(models.AuditLog.changed_at, models.AuditLog.audit_id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+        _append(archive_dir, manifest, rows)
+        key = (rows[-1].changed_at, rows[-1].audit_id)
+        manifest["watermark"] = [key[0].isoformat(), key[1]]
+        _save_manifest(archive_dir, manifest)
+        db.query(models.AuditLog).filter(
+            models.AuditLog.audit_id.in_([row.audit_id for row in rows])
+        ).delete(synchronize_session=False)
+        db.commit()
+        archived += len(rows)
+        deleted += len(rows)
+    return {"archived": archived, "deleted": deleted, "cutoff": cutoff}
+
+
+def _lines(archive_dir, partition):
+    for name in _files(partition):
+        with gzip.open(os.path.join(archive_dir, name), "rt", encoding="utf-8") as f:
+            yield from f
+
+
+def _matches(record, names, entity_id, changed_by, changed_from, changed_to):
+    if names is not None and record["entity_type"] not in names:
+        return False
+    if entity_id is not None and record["entity_id"] != entity_id:
+        return False
+    if changed_by is not None and record["changed_by"] != changed_by:
+        return False
+    if changed_from is not None and record["changed_at"] < changed_from:
+        return False
+    if changed_to is not None and record["changed_at"] >= changed_to:
+        return False
+    return True
+
+
+def read_archived(
+    entity_type=None,
+    entity_id=None,
+    changed_by=None,
+    changed_from=None,
+    changed_to=None,
+    after=None,
+    descending=False,
+    archive_dir=None,
+):
+    """Yield archived rows as dicts in (changed_at, audit_id) order.
+
+    Partitions whose span falls outside the requested range, or wholly
+    before (after, when descending) the cursor key, are not opened.
+    """
+    archive_dir = archive_dir or ARCHIVE_DIR
+    manifest = load_manifest(archive_dir)
+    names = None
+    if entity_type:
+        names = set(audit_names(canonical_entity_type(entity_type)))
+    partitions = sorted(manifest["partitions"].items(), reverse=descending)
+    for _, partition in partitions:
+        first = datetime.fromisoformat(partition["first"])
+        last = datetime.fromisoformat(partition["last"])
+        if changed_to is not None and first >= changed_to:
+            continue
+        if changed_from is not None and last < changed_from:
+            continue
+        if after is not None:
+            if not descending and last < after[0]:
+                continue
+            if descending and first > after[0]:
+                continue
+        records = []
+        for line in _lines(archive_dir, partition):
+            record = json.loads(line)
+            record["changed_at"] = datetime.fromisoformat(record["changed_at"])
+            if not _matches(
+                record, names, entity_id, changed_by, changed_from, changed_to
+            ):
+                continue
+            if after is not None:
+                record_key = (record["changed_at"], record["audit_id"])
+                if descending and record_key >= after:
+                    continue
+                if not descending and record_key <= after:
+                    continue
+            records.append(record)
+        records.sort(
+            key=lambda record: (record["changed_at"], record["audit_id"]),
+            reverse=descending,
+        )
+        yield from records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--months", type=int, default=RETENTION_MONTHS)
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        result = archive(db, args.months, args.archive_dir, args.batch_size)
+    finally:
+        db.close()
+    print(
+        f"archived {result['archived']} rows, deleted {result['deleted']} rows "
+        f"older than {result['cutoff']:%Y-%m-%d} into {args.archive_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import threading
+from collections import OrderedDict
+from datetime import timedelta
+
+from sqlalchemy import func
+
+from main import models
+
+from .utils import now_utc, parse_hours
+from .workload import as_date
+
+
+MAX_CACHED_SCOPES = 256
+
+_cache = OrderedDict()
+_lock = threading.Lock()
+
+
+def _progress_fraction(value):
+    return min(max(parse_hours(value), 0.0), 100.0) / 100.0
+
+
+def _point(day, completed, total):
+    return {
+        "day": day,
+        "completed_effort": round(completed, 2),
+        "remaining_effort": round(max(total - completed, 0.0), 2),
+    }
+
+
+def _replay(rows, efforts, progress, completed):
+    """Apply status rows (sorted by action_date) to the running state.
+
+    Yields (action_date, completed) after each row so callers can close
+    out every day with a single pass over the sorted history.
+    """
+    for task_id, action_date, value in rows:
+        effort = efforts.get(task_id, 0.0)
+        fraction = _progress_fraction(value)
+        completed += effort * (fraction - progress.get(task_id, 0.0))
+        progress[task_id] = fraction
+        yield as_date(action_date), completed
+
+
+def _status_rows(db, task_ids, *criteria):
+    return (
+        db.query(
+            models.TaskStatus.task_id,
+            models.TaskStatus.action_date,
+            models.TaskStatus.progress,
+        )
+        .filter(
+            models.TaskStatus.task_id.in_(task_ids),
+            models.TaskStatus.entity_status == "Active",
+            models.TaskStatus.action_date.isnot(None),
+            *criteria,
+        )
+        .order_by(models.TaskStatus.action_date, models.TaskStatus.task_status_id)
+    )
+
+
+def _closed_days(db, task_ids, efforts, total, first_day, today):
+    progress = {}
+    completed = 0.0
+    points = []
+    day = first_day
+    rows = _status_rows(db, task_ids, models.TaskStatus.action_date < today)
+    for action_date, completed_after in _replay(
+        rows.yield_per(1000), efforts, progress, completed
+    ):
+        while day < action_date:
+            points.append(_point(day, completed, total))
+            day += timedelta(days=1)
+        completed = completed_after
+    while day < today:
+        points.append(_point(day, completed, total))
+        day += timedelta(days=1)
+    return points, progress, completed
+
+
+def burndown_series(db, scope, scope_id, task_criteria):
+    """Daily completed/remaining effort for the active tasks matching criteria.
+
+    Days before today are cached per scope together with the per-task
+    progress at the end of yesterday; the entry is reused while the task set
+    and the fingerprint of the closed status history are unchanged, so only
+    today's bucket is recomputed on a cache hit.
+    """
+    today = now_utc().date()
+    tasks = (
+        db.query(
+            models.Task.task_id,
+            models.Task.effort_estimated_in_hours,
+            models.Task.planned_start_date,
+        )
+        .filter(models.Task.entity_status == "Active", *task_criteria)
+        .order_by(models.Task.task_id)
+        .all()
+    )
+    efforts = {task_id: parse_hours(effort) for task_id, effort, _ in tasks}
+    total = sum(efforts.values())
+    task_ids = (
+        db.query(models.Task.task_id)
+        .filter(models.Task.entity_status == "Active", *task_criteria)
+        .scalar_subquery()
+    )
+    closed_count, closed_updated_at, first_status = (
+        db.query(
+            func.count(models.TaskStatus.task_status_id),
+            func.max(models.TaskStatus.updated_at),
+            func.min(models.TaskStatus.action_date),
+        )
+        .filter(
+            models.TaskStatus.task_id.in_(task_ids),
+            models.TaskStatus.entity_status == "Active",
+            models.TaskStatus.action_date < today,
+        )
+        .one()
+    )
+    fingerprint = (hash(tuple(tasks)), closed_count, closed_updated_at)
+
+    key = (scope, scope_id)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is not None:
+            _cache.move_to_end(key)
+    if entry is None or entry["as_of"] != today or entry["fingerprint"] != fingerprint:
+        starts = [as_date(start) for _, _, start in tasks if start is not None]
+        if first_status is not None:
+            starts.append(as_date(first_status))
+        first_day = min([today] + starts)
+        points, progress, completed = _closed_days(
+            db, task_ids, efforts, total, first_day, today
+        )
+        entry = {
+            "as_of": today,
+            "fingerprint": fingerprint,
+            "points": points,
+            "progress": progress,
+            "completed": completed,
+        }
+        with _lock:
+            _cache[key] = entry
+            _cache.move_to_end(key)
+            while len(_cache) > MAX_CACHED_SCOPES:
+                _cache.popitem(last=False)
+
+    completed = entry["completed"]
+    today_rows = _status_rows(db, task_ids, models.TaskStatus.action_date >= today)
+    for _, completed in _replay(
+        today_rows.all(), efforts, dict(entry["progress"]), completed
+    ):
+        pass
+    return {
+        "scope": scope,
+        "scope_id": scope_id,
+        "total_effort": round(total, 2),
+        "points": entry["points"] + [_point(today, completed, total)],
+    }
@@ -1,8 +1,13 @@
 import uuid
+from datetime import datetime, timedelta
 
-from main import models
+from fastapi import HTTPException, status
+from sqlalchemy import event, inspect, tuple_, update
 
-from .utils import now_utc
+from main import events, models, refcache, response_cache
+
+from .entities import ENTITY_BY_TABLE
+from .utils import as_naive_utc, decode_cursor, encode_cursor, now_utc
 
 
 def audit_log(
@@ -17,6 +22,7 @@ def audit_log(
 ):
     if not field_changed:
         field_changed = "All"
+    changed_at = now_utc()
     al = models.AuditLog(
         audit_id=str(uuid.uuid4()),
         entity_type=entity_type,
@@ -26,7 +32,201 @@ def audit_log(
         old_value=old_value,
         new_value=new_value,
         changed_by=changed_by,
-        changed_at=now_utc(),
+        changed_at=changed_at,
     )
     db.add(al)
     db.commit()
+    try:
+        events.publish_change(db, entity_type, entity_id, action, changed_at)
+    except Exception:
+        pass
+
+
+WRITTEN_KEY = "written_entity_types"
+
+
+def _record(session, tables):
+    names = {ENTITY_BY_TABLE.get(table.name) for table in tables} - {None}
+    if names:
+        session.info.setdefault(WRITTEN_KEY, set()).update(names)
+
+
+def _after_flush(session, flush_context):
+    _record(
+        session,
+        (
+            instance.__table__
+            for instance in (*session.new, *session.dirty, *session.deleted)
+        ),
+    )
+
+
+def _on_execute(state):
+    if state.is_insert or state.is_update or state.is_delete:
+        _record(state.session, [state.statement.table])
+
+
+def _after_commit(session):
+    for entity_type in session.info.pop(WRITTEN_KEY, ()):
+        refcache.cache.invalidate(entity_type)
+        response_cache.cache.invalidate(entity_type)
+
+
+def _after_rollback(session):
+    session.info.pop(WRITTEN_KEY, None)
+
+
+def invalidate_on_commit(session_factory):
+    """Drop cached rows for every entity table a session's commit wrote.
+
+    ORM flushes and Core INSERT/UPDATE/DELETE statements run through the
+    session are recorded as they happen, so the caches follow the write
+    itself rather than the audit row that may or may not come after it.
+    """
+    for name, listener in (
+        ("after_flush", _after_flush),
+        ("do_orm_execute", _on_execute),
+        ("after_commit", _after_commit),
+        ("after_rollback", _after_rollback),
+    ):
+        if not event.contains(session_factory, name, listener):
+            event.listen(session_factory, name, listener)
+
+
+def update_entity(db, key_column, entity_id, values, entity_type, changed_by):
+    """UPDATE one row by key and commit it together with its audit row.
+
+    Only the supplied columns are written, in a single conditional UPDATE;
+    RETURNING (where the dialect has it) or the rowcount tells whether the
+    row exists. Returns False without writing anything when it does not.
+    """
+    table = key_column.table
+    values = {key: value for key, value in values.items() if key in table.c}
+    values["updated_at"] = now_utc()
+    values["updated_by"] = changed_by
+    statement = update(table).where(key_column == entity_id).values(values)
+    if db.get_bind().dialect.update_returning:
+        found = db.execute(statement.returning(key_column)).first() is not None
+    else:
+        found = db.execute(statement).rowcount > 0
+    if not found:
+        db.rollback()
+        return False
+    audit_log(
+        db,
+        entity_type,
+        values.get(key_column.key, entity_id),
+        "Update",
+        changed_by=changed_by,
+    )
+    return True
+
+
+def patch_entity(
+    db,
+    view,
+    key_column,
+    entity_id,
+    changes,
+    entity_type,
+    changed_by,
+    partial_view=False,
+):
+    """Apply a sparse patch, writing only the columns whose value differs.
+
+    The current values are read from the view row that is also the
+    response, so a patch that changes nothing costs that one read and no
+    writes. Returns None when no row has that key.
+
+    With `partial_view` the view holds only some of the table's rows
+    (vw_task_status_latest has each task's latest status), so the current
+    values come from the table. The response is then the view row when
+    the view has one, else the table row.
+    """
+    source = key_column.class_ if partial_view else view
+    row = db.query(source).filter(getattr(source, key_column.key) == entity_id).first()
+    if row is None:
+        return None
+    changed = {}
+    for key, value in changes.items():
+        if isinstance(value, datetime):
+            value = as_naive_utc(value)
+        if key not in source.__table__.c or getattr(row, key) != value:
+            changed[key] = value
+    if changed:
+        if not update_entity(
+            db, key_column, entity_id, changed, entity_type, changed_by
+        ):
+            return None
+        entity_id = changed.get(key_column.key, entity_id)
+    elif not partial_view:
+        return row
+    view_row = db.query(view).filter(getattr(view, key_column.key) == entity_id).first()
+    if view_row is not None or not partial_view:
+        return view_row
+    return db.query(source).filter(key_column == entity_id).first()
+
+
+def fetch_by_ids(db, view, key_column, ids):
+    """View rows for `ids` in request order, from one WHERE key IN (...)."""
+    ids = list(dict.fromkeys(ids))
+    view_key = getattr(view, key_column.key)
+    rows = {
+        getattr(row, key_column.key): row
+        for row in db.query(view).filter(view_key.in_(ids))
+    }
+    return {
+        "items": [rows[entity_id] for entity_id in ids if entity_id in rows],
+        "missing_ids": [entity_id for entity_id in ids if entity_id not in rows],
+    }
+
+
+WATERMARK_OVERLAP = timedelta(seconds=5)
+DELTA_PAGE_SIZE = 500
+MAX_DELTA_PAGE_SIZE = 5000
+
+
+def view_delta(db, view, pk_column, updated_since, cursor=None, limit=DELTA_PAGE_SIZE):
+    """Rows changed after `updated_since`, a page at a time.
+
+    Pages are keyset-ordered on (updated_at, primary key). The watermark is
+    fixed by the first page and carried in the cursor, so every page of one
+    sync returns the same value for the client's next `updated_since`.
+    """
+    keys = [getattr(view, column.key) for column in inspect(view).primary_key]
+    order = [view.updated_at, *keys]
+    query = db.query(view)
+    if cursor:
+        values = decode_cursor(cursor, len(order) + 1)
+        try:
+            position = [datetime.fromisoformat(values[0]), *values[1:-1]]
+            watermark = datetime.fromisoformat(values[-1])
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor.",
+            )
+        query = query.filter(tuple_(*order) > tuple_(*position))
+    else:
+        watermark = now_utc() - WATERMARK_OVERLAP
+        query = query.filter(view.updated_at > as_naive_utc(updated_since))
+    rows = query.order_by(*order).limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            last.updated_at.isoformat(),
+            *(getattr(last, key.key) for key in keys),
+            watermark.isoformat(),
+        )
+    return {
+        "items": [row for row in rows if row.entity_status == "Active"],
+        "archived_ids": [
+            getattr(row, pk_column.key)
+            for row in rows
+            if row.entity_status == "Archived"
+        ],
+        "watermark": watermark,
+        "next_cursor": next_cursor,
+    }
@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+from sqlalchemy import or_
+from starlette.concurrency import run_in_threadpool
+
+from main import models
+
+from .project_tree import CLOSED_ISSUE_STATUSES
+
+
+def assigned_tasks(db, employee_id, limit):
+    return (
+        db.query(models.TaskView)
+        .filter(
+            models.TaskView.assignee_id == employee_id,
+            models.TaskView.entity_status == "Active",
+        )
+        .order_by(models.TaskView.planned_end_date, models.TaskView.task_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def review_tasks(db, employee_id, limit):
+    return (
+        db.query(models.TaskView)
+        .filter(
+            models.TaskView.reviewer_id == employee_id,
+            models.TaskView.entity_status == "Active",
+        )
+        .order_by(models.TaskView.planned_end_date, models.TaskView.task_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def owned_issues(db, employee_id, limit):
+    return (
+        db.query(models.IssueView)
+        .filter(
+            models.IssueView.action_owner_id == employee_id,
+            models.IssueView.entity_status == "Active",
+            or_(
+                models.IssueView.issue_status.is_(None),
+                models.IssueView.issue_status.notin_(CLOSED_ISSUE_STATUSES),
+            ),
+        )
+        .order_by(models.IssueView.updated_at.desc(), models.IssueView.issue_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def recent_statuses(db, employee_id, limit):
+    rows = (
+        db.query(
+            models.TaskStatus.task_status_id,
+            models.TaskStatus.task_id,
+            models.Task.task_name,
+            models.TaskStatus.action_date,
+            models.TaskStatus.hours_spent,
+            models.TaskStatus.progress,
+            models.TaskStatus.remarks,
+            models.TaskStatus.created_at,
+        )
+        .outerjoin(models.Task, models.Task.task_id == models.TaskStatus.task_id)
+        .filter(
+            models.TaskStatus.created_by == employee_id,
+            models.TaskStatus.entity_status == "Active",
+        )
+        .order_by(
+            models.TaskStatus.action_date.desc(),
+            models.TaskStatus.task_status_id.desc(),
+        )
+        .limit(limit)
+        .all()
+    )
+    return [dict(row._mapping) for row in rows]
+
+
+SECTIONS = {
+    "assigned_tasks": assigned_tasks,
+    "review_tasks": review_tasks,
+    "owned_issues": owned_issues,
+    "recent_statuses": recent_statuses,
+}
+
+
+def _load_section(session_factory, name, employee_id, limit):
+    db = session_factory()
+    try:
+        start = time.perf_counter()
+        rows = SECTIONS[name](db, employee_id, limit)
+        return rows, round((time.perf_counter() - start) * 1000, 3)
+    finally:
+        db.close()
+
+
+async def load_dashboard(session_factory, employee_id, limit):
+    """Run every section on its own pooled session at the same time.
+
+    Each section is one indexed query, so the dashboard takes about as long
+    as its slowest section and holds len(SECTIONS) connections meanwhile.
+    """
+    results = await asyncio.gather(
+        *(
+            run_in_threadpool(_load_section, session_factory, name, employee_id, limit)
+            for name in SECTIONS
+        )
+    )
+    dashboard = {"timings_ms": {}}
+    for name, (rows, elapsed) in zip(SECTIONS, results):
+        dashboard[name] = rows
+        dashboard["timings_ms"][name] = elapsed
+    return dashboard
@@ -1,7 +1,13 @@
+import os
+import time
+
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import sessionmaker
 
+from main import metrics, profiling
+
 
 load_dotenv()
 
@@ -10,14 +16,39 @@ DB_PASSWORD = "Meganathisekaran001"
 DB_HOST = "delivery-tracker-data.c38wmw064mzj.ap-south-1.rds.amazonaws.com"
 DB_NAME = "delivery_tracker_dev"
 
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
-engine = create_engine(DATABASE_URL)
+DATABASE_URL = os.getenv(
+    "DATABASE_URL",
+    f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}",
+)
+
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+
+connect_args = {}
+pool_args = {"pool_size": POOL_SIZE, "max_overflow": MAX_OVERFLOW}
+if DATABASE_URL.startswith("sqlite"):
+    connect_args["check_same_thread"] = False
+    if ":memory:" in DATABASE_URL or DATABASE_URL in ("sqlite://", "sqlite:///"):
+        # In-memory SQLite uses a single shared connection, not a QueuePool.
+        pool_args = {}
+
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **pool_args)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+metrics.instrument_engine(
+    engine, capacity=POOL_SIZE + MAX_OVERFLOW if pool_args else None
+)
 
 
 def get_db():
+    profiling.claim_thread()
     db = SessionLocal()
     try:
+        start = time.perf_counter()
+        try:
+            db.connection()
+            metrics.registry.observe_checkout(time.perf_counter() - start)
+        except DBAPIError:
+            db.rollback()
         yield db
     finally:
         db.close()
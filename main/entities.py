@@ -0,0 +1,79 @@
+from typing import Any, NamedTuple
+
+from main import models, schemas
+
+
+class Entity(NamedTuple):
+    model: Any
+    view: Any
+    pk: str
+    view_schema: Any
+
+
+ENTITIES = {
+    "Employee": Entity(
+        models.Employee, models.EmployeeView, "employee_id", schemas.EmployeeViewBase
+    ),
+    "BusinessUnit": Entity(
+        models.BusinessUnit,
+        models.BusinessUnitView,
+        "business_unit_id",
+        schemas.BusinessUnitViewBase,
+    ),
+    "EmployeeBusinessUnit": Entity(
+        models.EmployeeBusinessUnit,
+        models.EmployeeBusinessUnitView,
+        "business_unit_id",
+        schemas.EmployeeBusinessUnitViewBase,
+    ),
+    "Project": Entity(
+        models.Project, models.ProjectView, "project_id", schemas.ProjectViewBase
+    ),
+    "Deliverable": Entity(
+        models.Deliverable,
+        models.DeliverableView,
+        "deliverable_id",
+        schemas.DeliverableViewBase,
+    ),
+    "Task": Entity(models.Task, models.TaskView, "task_id", schemas.TaskViewBase),
+    "TaskType": Entity(
+        models.TaskType, models.TaskTypeView, "task_type_id", schemas.TaskTypeViewBase
+    ),
+    "TaskStatus": Entity(
+        models.TaskStatus,
+        models.TaskStatusView,
+        "task_status_id",
+        schemas.TaskStatusViewBase,
+    ),
+    "Issue": Entity(models.Issue, models.IssueView, "issue_id", schemas.IssueViewBase),
+    "IssueActivity": Entity(
+        models.IssueActivity,
+        models.IssueActivityView,
+        "issue_activity_id",
+        schemas.IssueActivityViewBase,
+    ),
+}
+
+ENTITY_BY_TABLE = {
+    entity.model.__tablename__: name for name, entity in ENTITIES.items()
+}
+
+# Create paths log these entity types with a space in the name.
+AUDIT_ALIASES = {
+    "Business Unit": "BusinessUnit",
+    "Employee Business Unit": "EmployeeBusinessUnit",
+}
+
+
+def canonical_entity_type(entity_type):
+    return AUDIT_ALIASES.get(entity_type, entity_type)
+
+
+def audit_names(entity_type):
+    return [entity_type] + [
+        alias for alias, name in AUDIT_ALIASES.items() if name == entity_type
+    ]
+
+
+def row_to_dict(row):
+    return {column.key: getattr(row, column.key) for column in row.__table__.columns}
@@ -0,0 +1,116 @@
+import asyncio
+import os
+import threading
+
+from .entities import ENTITIES, canonical_entity_type
+
+
+QUEUE_SIZE = int(os.getenv("EVENT_QUEUE_SIZE", "100"))
+
+
+class Subscriber:
+    def __init__(self, loop, entity_types=None, project_id=None):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.entity_types = entity_types
+        self.project_id = project_id
+        self.dropped = False
+
+    def wants(self, event):
+        if self.entity_types and event["entity_type"] not in self.entity_types:
+            return False
+        if self.project_id and event.get("project_id") != self.project_id:
+            return False
+        return True
+
+
+class EventBroker:
+    """Fan change events out to connected subscribers.
+
+    publish() may be called from worker threads; delivery happens on each
+    subscriber's event loop. A subscriber whose queue is full is dropped
+    rather than allowed to back up the publisher.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    @property
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    @property
+    def subscriber_count(self):
+        return len(self._subscribers)
+
+    @property
+    def needs_project(self):
+        return any(sub.project_id for sub in list(self._subscribers))
+
+    def subscribe(self, entity_types=None, project_id=None):
+        subscriber = Subscriber(asyncio.get_running_loop(), entity_types, project_id)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            if subscriber.wants(event):
+                try:
+                    subscriber.loop.call_soon_threadsafe(self._offer, subscriber, event)
+                except RuntimeError:
+                    self.unsubscribe(subscriber)
+
+    def _offer(self, subscriber, event):
+        if subscriber.dropped:
+            return
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            subscriber.dropped = True
+            self.unsubscribe(subscriber)
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(None)
+
+
+broker = EventBroker()
+
+
+def resolve_project_id(db, entity_type, entity_id):
+    if entity_type == "Project":
+        return entity_id
+    entity = ENTITIES.get(entity_type)
+    if entity is None or not hasattr(entity.view, "project_id"):
+        return None
+    row = (
+        db.query(entity.view.project_id)
+        .filter(getattr(entity.view, entity.pk) == entity_id)
+        .first()
+    )
+    return row[0] if row else None
+
+
+def publish_change(db, entity_type, entity_id, action, changed_at):
+    if not broker.has_subscribers:
+        return
+    entity_type = canonical_entity_type(entity_type)
+    project_id = None
+    if broker.needs_project:
+        project_id = resolve_project_id(db, entity_type, entity_id)
+    broker.publish(
+        {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "action": action,
+            "project_id": project_id,
+            "changed_at": changed_at.isoformat(),
+        }
+    )
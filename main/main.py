@@ -1,18 +1,41 @@
-from fastapi import FastAPI
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
+from main import IMPORT_STARTED, crud, events
+from main.admission import AdmissionMiddleware
+from main.dashboard import SECTIONS
+from main.database import SessionLocal, engine
+from main.entities import ENTITIES
+from main.metrics import MetricsMiddleware, registry
+from main.profiling import ADMIN_EMAILS, ProfilingMiddleware
+from main.response_cache import ResponseCacheMiddleware
+from main.warmup import Warmup
 from routers import (
+    audit_log,
     business_unit,
+    changes,
     deliverable,
     employee,
     employee_business_unit,
+    health,
     issue,
     issue_activity,
     login,
+    me,
     project,
+    search,
     task,
     task_status,
     task_type,
+    workload,
 )
 
 
@@ -31,48 +54,181 @@ openapi_tags = [
     },
     {"name": "Issue", "description": "Track issues related to deliverables"},
     {"name": "IssueActivity", "description": "Track activities on issues"},
+    {"name": "Me", "description": "The signed-in employee's own work"},
+    {"name": "Workload", "description": "Employee allocation and capacity"},
+    {"name": "Search", "description": "Full-text search across tasks and issues"},
+    {"name": "Changes", "description": "Incremental change feed from the audit log"},
+    {"name": "Events", "description": "Server-sent change notifications"},
+    {"name": "AuditLog", "description": "Query the audit trail"},
+    {"name": "Health", "description": "Liveness, readiness and runtime stats"},
 ]
 
-app = FastAPI(
-    title="Delivery Tracker API",
-    description="API for managing delivery tracker tables.",
-    version="v1.0",
-    openapi_tags=openapi_tags,
-)
 
-origins = [
-    "*",
-]
+EVENT_HEARTBEAT_SECONDS = 15
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# List endpoints served from the response cache, by the entity they list.
+CACHED_LISTS = {
+    "/api/Employees/": "Employee",
+    "/api/EmployeesBusinessUnit/": "EmployeeBusinessUnit",
+    "/api/BusinessUnit/": "BusinessUnit",
+    "/api/Projects/": "Project",
+    "/api/Deliverables/": "Deliverable",
+    "/api/Tasks/": "Task",
+    "/api/TaskType/": "TaskType",
+    "/api/TaskStatus/": "TaskStatus",
+    "/api/Issues/": "Issue",
+    "/api/IssueActivities/": "IssueActivity",
+}
 
-app.include_router(employee.router, prefix="/api/Employees", tags=["Employee"])
-app.include_router(login.router, prefix="/api/login", tags=["Login"])
-app.include_router(
-    employee_business_unit.router,
-    prefix="/api/EmployeesBusinessUnit",
-    tags=["EmployeeBusinessUnit"],
-)
-app.include_router(
-    business_unit.router, prefix="/api/BusinessUnit", tags=["BusinessUnit"]
-)
-app.include_router(project.router, prefix="/api/Projects", tags=["Project"])
-app.include_router(deliverable.router, prefix="/api/Deliverables", tags=["Deliverable"])
-app.include_router(task.router, prefix="/api/Tasks", tags=["Task"])
-app.include_router(task_type.router, prefix="/api/TaskType", tags=["TaskType"])
-app.include_router(task_status.router, prefix="/api/TaskStatus", tags=["TaskStatus"])
-app.include_router(issue.router, prefix="/api/Issues", tags=["Issue"])
-app.include_router(
-    issue_activity.router, prefix="/api/IssueActivities", tags=["IssueActivity"]
-)
+
+# Admission class and in-flight slots for routes that are not a plain
+# one-connection read or write; see main.admission.
+ADMISSION_ROUTES = {
+    **{("GET", path): ("bulk", 1) for path in CACHED_LISTS},
+    ("POST", "/api/Employees/batch"): ("bulk", 1),
+    ("POST", "/api/BusinessUnit/batch"): ("bulk", 1),
+    ("POST", "/api/Projects/batch"): ("bulk", 1),
+    ("POST", "/api/Deliverables/batch"): ("bulk", 1),
+    ("POST", "/api/Tasks/batch"): ("bulk", 1),
+    ("POST", "/api/TaskType/batch"): ("bulk", 1),
+    ("POST", "/api/TaskStatus/batch"): ("bulk", 1),
+    ("POST", "/api/Issues/batch"): ("bulk", 1),
+    ("POST", "/api/IssueActivities/batch"): ("bulk", 1),
+    ("GET", "/api/Workload/"): ("bulk", 1),
+    ("GET", "/api/search/"): ("bulk", 1),
+    ("GET", "/api/changes/"): ("bulk", 1),
+    ("GET", "/api/AuditLogs/"): ("bulk", 1),
+    # The sections run at once, each on its own pooled connection.
+    ("GET", "/api/me/dashboard"): ("read", len(SECTIONS)),
+}
+
+
+async def stream_events(
+    request: Request,
+    entity_types: Optional[str] = None,
+    project_id: Optional[str] = None,
+):
+    types = None
+    if entity_types:
+        types = {name.strip() for name in entity_types.split(",") if name.strip()}
+        unknown = types - set(ENTITIES)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported entity types: {', '.join(sorted(unknown))}",
+            )
+    subscriber = events.broker.subscribe(types, project_id)
+
+    async def event_stream():
+        try:
+            yield "retry: 5000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), timeout=EVENT_HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keep-alive\n\n"
+                    continue
+                if event is None:
+                    yield "event: dropped\ndata: {}\n\n"
+                    break
+                yield f"event: change\ndata: {json.dumps(event)}\n\n"
+        finally:
+            events.broker.unsubscribe(subscriber)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
-@app.get("/")
 def root():
     return {"message": "Delivery Tracker API - running test"}
+
+
+def ready(request: Request):
+    warmup = request.app.state.warmup
+    return JSONResponse(warmup.status(), status_code=200 if warmup.ready else 503)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    task = asyncio.create_task(run_in_threadpool(app.state.warmup.run, app))
+    yield
+    task.cancel()
+
+
+def create_app():
+    crud.invalidate_on_commit(SessionLocal)
+    app = FastAPI(
+        lifespan=lifespan,
+        title="Delivery Tracker API",
+        description="API for managing delivery tracker tables.",
+        version="v1.0",
+        openapi_tags=openapi_tags,
+    )
+
+    app.add_middleware(
+        AdmissionMiddleware,
+        decode_token=login.decode_access_token,
+        routes=ADMISSION_ROUTES,
+        max_in_flight=registry.pool_stats().get("capacity"),
+    )
+    app.add_middleware(ResponseCacheMiddleware, paths=CACHED_LISTS)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    if ADMIN_EMAILS:
+        app.add_middleware(ProfilingMiddleware, decode_token=login.decode_access_token)
+    app.add_middleware(MetricsMiddleware)
+
+    app.include_router(employee.router, prefix="/api/Employees", tags=["Employee"])
+    app.include_router(login.router, prefix="/api/login", tags=["Login"])
+    app.include_router(
+        employee_business_unit.router,
+        prefix="/api/EmployeesBusinessUnit",
+        tags=["EmployeeBusinessUnit"],
+    )
+    app.include_router(
+        business_unit.router, prefix="/api/BusinessUnit", tags=["BusinessUnit"]
+    )
+    app.include_router(project.router, prefix="/api/Projects", tags=["Project"])
+    app.include_router(
+        deliverable.router, prefix="/api/Deliverables", tags=["Deliverable"]
+    )
+    app.include_router(task.router, prefix="/api/Tasks", tags=["Task"])
+    app.include_router(task_type.router, prefix="/api/TaskType", tags=["TaskType"])
+    app.include_router(
+        task_status.router, prefix="/api/TaskStatus", tags=["TaskStatus"]
+    )
+    app.include_router(issue.router, prefix="/api/Issues", tags=["Issue"])
+    app.include_router(
+        issue_activity.router, prefix="/api/IssueActivities", tags=["IssueActivity"]
+    )
+    app.include_router(me.router, prefix="/api/me", tags=["Me"])
+    app.include_router(workload.router, prefix="/api/Workload", tags=["Workload"])
+    app.include_router(search.router, prefix="/api/search", tags=["Search"])
+    app.include_router(changes.router, prefix="/api/changes", tags=["Changes"])
+    app.include_router(audit_log.router, prefix="/api/AuditLogs", tags=["AuditLog"])
+    app.get("/api/events", tags=["Events"])(stream_events)
+    app.get("/")(root)
+    app.get("/ready", include_in_schema=False)(ready)
+    app.include_router(health.router, tags=["Health"])
+
+    app.state.warmup = Warmup(
+        engine, SessionLocal, login.hash_password, import_seconds=IMPORT_SECONDS
+    )
+    return app
+
+
+IMPORT_SECONDS = round(time.perf_counter() - IMPORT_STARTED, 4)
+
+app = create_app()
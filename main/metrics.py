@@ -0,0 +1,231 @@
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event
+
+from .profiling import claim_thread
+from .querylog import RequestStats, observe, request_stats
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Registry:
+    """Counters and histograms kept in plain dicts behind one lock.
+
+    Every label tuple is bounded by the route table, so memory does not grow
+    with traffic; the request path does one dict update per metric.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}
+        self.latency = {}
+        self.db_queries = {}
+        self.db_seconds = {}
+        self.checkout = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0]
+        self.pool = None
+        self.capacity = None
+
+    def observe_request(self, method, route, status_code, seconds, stats):
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            key = (method, route, status_code)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            histogram = self.latency.get((method, route))
+            if histogram is None:
+                histogram = self.latency[(method, route)] = [
+                    [0] * (len(LATENCY_BUCKETS) + 1),
+                    0.0,
+                ]
+            histogram[0][bucket] += 1
+            histogram[1] += seconds
+            if stats.queries:
+                key = (method, route)
+                self.db_queries[key] = self.db_queries.get(key, 0) + stats.queries
+                self.db_seconds[key] = (
+                    self.db_seconds.get(key, 0.0) + stats.query_seconds
+                )
+
+    def observe_checkout(self, seconds):
+        bucket = bisect_left(LATENCY_BUCKETS, seconds)
+        with self._lock:
+            self.checkout[0][bucket] += 1
+            self.checkout[1] += seconds
+
+    def pool_stats(self):
+        with self._lock:
+            checkouts = sum(self.checkout[0])
+            wait = self.checkout[1]
+        stats = {
+            "checkouts": checkouts,
+            "avg_checkout_wait_ms": (
+                round(wait / checkouts * 1000, 3) if checkouts else None
+            ),
+        }
+        pool = self.pool
+        if pool is not None:
+            for attr in ("size", "checkedout", "checkedin", "overflow"):
+                if hasattr(pool, attr):
+                    stats[attr] = getattr(pool, attr)()
+        stats["capacity"] = self.capacity
+        return stats
+
+    def render(self):
+        with self._lock:
+            requests = dict(self.requests)
+            latency = {k: (list(v[0]), v[1]) for k, v in self.latency.items()}
+            db_queries = dict(self.db_queries)
+            db_seconds = dict(self.db_seconds)
+            checkout = (list(self.checkout[0]), self.checkout[1])
+        lines = [
+            "# HELP http_requests_total Requests by route and status.",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route, code), count in sorted(requests.items()):
+            labels = _labels(method=method, route=route, status=code)
+            lines.append(f"http_requests_total{{{labels}}} {count}")
+        lines += [
+            "# HELP http_request_duration_seconds Request latency by route.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, route), (counts, total) in sorted(latency.items()):
+            lines += _histogram(
+                "http_request_duration_seconds",
+                _labels(method=method, route=route),
+                counts,
+                total,
+            )
+        lines += [
+            "# HELP db_queries_total SQL statements executed by route.",
+            "# TYPE db_queries_total counter",
+        ]
+        for (method, route), count in sorted(db_queries.items()):
+            labels = _labels(method=method, route=route)
+            lines.append(f"db_queries_total{{{labels}}} {count}")
+        lines += [
+            "# HELP db_query_seconds_total Time spent executing SQL by route.",
+            "# TYPE db_query_seconds_total counter",
+        ]
+        for (method, route), seconds in sorted(db_seconds.items()):
+            labels = _labels(method=method, route=route)
+            lines.append(f"db_query_seconds_total{{{labels}}} {seconds:.6f}")
+        lines += [
+            "# HELP db_pool_checkout_wait_seconds Time spent waiting for a pooled connection.",
+            "# TYPE db_pool_checkout_wait_seconds histogram",
+        ]
+        lines += _histogram("db_pool_checkout_wait_seconds", "", *checkout)
+        pool = self.pool
+        if pool is not None:
+            for name, attr, help_text in (
+                ("db_pool_size", "size", "Configured pool size."),
+                ("db_pool_checked_out", "checkedout", "Connections in use."),
+                ("db_pool_checked_in", "checkedin", "Idle pooled connections."),
+                ("db_pool_overflow", "overflow", "Connections beyond pool_size."),
+            ):
+                if hasattr(pool, attr):
+                    lines += [
+                        f"# HELP {name} {help_text}",
+                        f"# TYPE {name} gauge",
+                        f"{name} {getattr(pool, attr)()}",
+                    ]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _histogram(name, labels, counts, total):
+    lines = []
+    cumulative = 0
+    prefix = f"{labels}," if labels else ""
+    for bound, count in zip(LATENCY_BUCKETS, counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+    cumulative += counts[-1]
+    lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {cumulative}')
+    suffix = f"{{{labels}}}" if labels else ""
+    lines.append(f"{name}_sum{suffix} {total:.6f}")
+    lines.append(f"{name}_count{suffix} {cumulative}")
+    return lines
+
+
+registry = Registry()
+
+
+def instrument_engine(engine, capacity=None):
+    registry.pool = engine.pool
+    registry.capacity = capacity
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, params, context, many):
+        claim_thread()
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, params, context, many):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        observe(statement, params, many, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context):
+        if context.connection is not None:
+            starts = context.connection.info.get("query_start")
+            if starts:
+                starts.pop()
+
+
+class MetricsMiddleware:
+    def __init__(self, app, path="/metrics"):
+        self.app = app
+        self.path = path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == self.path:
+            body = registry.render().encode()
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/plain; version=0.0.4; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode()),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        stats = RequestStats(scope)
+        token = request_stats.set(stats)
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_stats.reset(token)
+            route = scope.get("route")
+            registry.observe_request(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status_code,
+                time.perf_counter() - start,
+                stats,
+            )
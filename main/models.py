@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, DateTime, String
+from sqlalchemy import Column, Date, DateTime, Index, String
 from sqlalchemy.ext.declarative import declarative_base
 
 from .utils import now_utc
@@ -15,7 +15,7 @@ class Employee(Base):
     password = Column(String(100))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -42,7 +42,7 @@ class BusinessUnit(Base):
     business_unit_description = Column(String(4000))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -69,7 +69,7 @@ class EmployeeBusinessUnit(Base):
     business_unit_id = Column(String(10))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -105,7 +105,7 @@ class Project(Base):
     planned_end_date = Column(DateTime, default=now_utc())
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -136,6 +136,7 @@ class ProjectView(Base):
 
 class Deliverable(Base):
     __tablename__ = "deliverable"
+    __table_args__ = (Index("ix_deliverable_project_id", "project_id"),)
     deliverable_id = Column(String(10), primary_key=True, index=True)
     project_id = Column(String(10))
     deliverable_name = Column(String(100))
@@ -147,7 +148,7 @@ class Deliverable(Base):
     planned_end_date = Column(DateTime, default=now_utc())
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -181,6 +182,11 @@ class DeliverableView(Base):
 
 class Task(Base):
     __tablename__ = "task"
+    __table_args__ = (
+        Index("ix_task_deliverable_id", "deliverable_id"),
+        Index("ix_task_assignee_id", "assignee_id"),
+        Index("ix_task_reviewer_id", "reviewer_id"),
+    )
     task_id = Column(String(10), primary_key=True, index=True)
     deliverable_id = Column(String(10))
     task_name = Column(String(100))
@@ -196,7 +202,7 @@ class Task(Base):
     reviewer_id = Column(String(10))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -244,7 +250,7 @@ class TaskType(Base):
     task_type_description = Column(String(4000))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -265,6 +271,10 @@ class TaskTypeView(Base):
 
 class TaskStatus(Base):
     __tablename__ = "task_status"
+    __table_args__ = (
+        Index("ix_task_status_task_id_action_date", "task_id", "action_date"),
+        Index("ix_task_status_created_by_action_date", "created_by", "action_date"),
+    )
     task_status_id = Column(String(10), primary_key=True, index=True)
     task_id = Column(String(10))
     action_date = Column(Date)
@@ -274,7 +284,7 @@ class TaskStatus(Base):
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
 
 
@@ -308,6 +318,10 @@ class TaskStatusView(Base):
 
 class Issue(Base):
     __tablename__ = "issue"
+    __table_args__ = (
+        Index("ix_issue_task_id", "task_id"),
+        Index("ix_issue_action_owner_id", "action_owner_id"),
+    )
     issue_id = Column(String(10), primary_key=True, index=True)
     task_id = Column(String(10))
     issue_title = Column(String(100))
@@ -317,7 +331,7 @@ class Issue(Base):
     issue_status = Column(String(100))
     created_at = Column(DateTime, default=now_utc())
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     entity_status = Column(String(10), default="Active")
 
@@ -354,13 +368,16 @@ class IssueView(Base):
 
 class IssueActivity(Base):
     __tablename__ = "issue_activity"
+    __table_args__ = (
+        Index("ix_issue_activity_issue_id_comment_at", "issue_id", "comment_at"),
+    )
     issue_activity_id = Column(String(10), primary_key=True, index=True)
     issue_id = Column(String(10))
     comment_by = Column(String(10))
     comment_at = Column(DateTime, default=now_utc())
     comment = Column(String(4000))
     created_by = Column(String(10))
-    updated_at = Column(DateTime, default=now_utc())
+    updated_at = Column(DateTime, default=now_utc(), index=True)
     updated_by = Column(String(10))
     created_at = Column(DateTime, default=now_utc())
     entity_status = Column(String(10), default="Active")
@@ -397,7 +414,22 @@ class IssueActivityView(Base):
 
 class AuditLog(Base):
     __tablename__ = "audit_log"
-    audit_id = Column(String(10), primary_key=True, index=True)
+    __table_args__ = (
+        Index("ix_audit_log_changed_at_audit_id", "changed_at", "audit_id"),
+        Index(
+            "ix_audit_log_entity_id_changed_at", "entity_id", "changed_at", "audit_id"
+        ),
+        Index(
+            "ix_audit_log_entity_type_changed_at",
+            "entity_type",
+            "changed_at",
+            "audit_id",
+        ),
+        Index(
+            "ix_audit_log_changed_by_changed_at", "changed_by", "changed_at", "audit_id"
+        ),
+    )
+    audit_id = Column(String(36), primary_key=True, index=True)
     entity_type = Column(String(100))
     entity_id = Column(String(10))
     action = Column(String(100))
@@ -0,0 +1,333 @@
+"""Profile a single request on demand.
+
+An admin whose email is listed in PROFILE_ADMIN_EMAILS sends `X-Profile: 1`
+along with their bearer token. That request runs under a stack sampler
+covering the event loop thread and the worker threads that served it (a
+thread joins the profile when it opens the request's session or runs one
+of its queries). The report gives wall time, SQL time from the request's
+query stats, estimated pydantic/JSON serialization time and the hottest
+functions. It is written to PROFILE_DIR with the collapsed stacks (for
+flamegraph.pl or speedscope) and served at /debug/profiles/<id>[.folded];
+the id comes back in the X-Profile-Id response header.
+
+A worker thread only counts for a profile while it works for that
+request: once it claims another request's session or query, or the
+profiled request ends, it is no longer sampled.
+
+Without admin emails the middleware is not installed, and the only hooks
+left on the request path are a ContextVar lookup per session and query.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+from contextvars import ContextVar
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from .querylog import RequestStats, request_stats
+from .utils import now_utc
+
+
+ADMIN_EMAILS = frozenset(
+    email.strip().lower()
+    for email in os.getenv("PROFILE_ADMIN_EMAILS", "").split(",")
+    if email.strip()
+)
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "2")) / 1000
+KEEP = int(os.getenv("PROFILE_KEEP", "50"))
+HOT_SPOTS = 25
+
+PROFILE_HEADER = b"x-profile"
+DOWNLOAD_PREFIX = "/debug/profiles/"
+DOWNLOAD_PATH = re.compile(r"^/debug/profiles/([0-9a-f]{32})(\.folded)?$")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IDLE_FILES = ("selectors.py", "threading.py", "queue.py")
+SERIALIZATION_FUNCTIONS = {"serialize_response", "jsonable_encoder", "render"}
+
+active_profile = ContextVar("active_profile", default=None)
+
+
+def is_admin(email, admins=None):
+    return bool(email) and email.lower() in (ADMIN_EMAILS if admins is None else admins)
+
+
+# Worker thread ident -> the profile it is currently working for.
+_owners = {}
+
+
+def claim_thread():
+    profile = active_profile.get()
+    if profile is not None:
+        ident = threading.get_ident()
+        profile.threads.add(ident)
+        _owners[ident] = profile
+    elif _owners:
+        _owners.pop(threading.get_ident(), None)
+
+
+class Sampler(threading.Thread):
+    def __init__(self, profile, interval):
+        super().__init__(name="request-profiler", daemon=True)
+        self.profile = profile
+        self.interval = interval
+        self.rounds = 0
+        self.stacks = {}
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in self.profile.sampled_threads():
+                frame = frames.get(thread_id)
+                stack = []
+                while frame is not None:
+                    stack.append(frame.f_code)
+                    frame = frame.f_back
+                if stack:
+                    key = tuple(reversed(stack))
+                    self.stacks[key] = self.stacks.get(key, 0) + 1
+            self.rounds += 1
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+
+def _short(filename):
+    if "site-packages" in filename:
+        return filename.rsplit("site-packages" + os.sep, 1)[-1]
+    if filename.startswith(ROOT):
+        return os.path.relpath(filename, ROOT)
+    return os.path.basename(filename)
+
+
+def _label(code):
+    return f"{code.co_name} ({_short(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _idle(code):
+    return os.path.basename(code.co_filename) in IDLE_FILES
+
+
+def _serializing(stack):
+    """Response validation/serialization frames, excluding request parsing."""
+    names = {code.co_name for code in stack}
+    if "solve_dependencies" in names:
+        return False
+    for code in stack:
+        if code.co_name in SERIALIZATION_FUNCTIONS and (
+            "fastapi" in code.co_filename or "starlette" in code.co_filename
+        ):
+            return True
+        if code.co_name == "validate" and "fastapi" in code.co_filename:
+            return True
+    return False
+
+
+class Profile:
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.started_at = now_utc()
+        self.loop_thread = threading.get_ident()
+        self.threads = {self.loop_thread}
+        self.sampler = Sampler(self, SAMPLE_INTERVAL)
+
+    def sampled_threads(self):
+        return [
+            ident
+            for ident in tuple(self.threads)
+            if ident == self.loop_thread or _owners.get(ident) is self
+        ]
+
+    def release_threads(self):
+        for ident in tuple(self.threads):
+            if _owners.get(ident) is self:
+                del _owners[ident]
+        self.threads.clear()
+
+    def report(self, scope, status_code, wall, queries, query_seconds):
+        sampler = self.sampler
+        per_sample = wall / max(sampler.rounds, 1)
+        folded = {}
+        hot = {}
+        serialization = 0
+        for stack, count in sampler.stacks.items():
+            if _idle(stack[-1]):
+                continue
+            labels = [_label(code) for code in stack]
+            line = ";".join(labels)
+            folded[line] = folded.get(line, 0) + count
+            for label in set(labels):
+                hot.setdefault(label, [0, 0])[1] += count
+            hot[labels[-1]][0] += count
+            if _serializing(stack):
+                serialization += count
+        hot_spots = sorted(hot.items(), key=lambda item: item[1], reverse=True)
+        route = scope.get("route")
+        report = {
+            "id": self.id,
+            "started_at": self.started_at.isoformat(),
+            "method": scope["method"],
+            "path": scope["path"],
+            "query_string": scope.get("query_string", b"").decode("latin-1"),
+            "route": getattr(route, "path", None),
+            "status": status_code,
+            "wall_ms": round(wall * 1000, 3),
+            "sql": {"queries": queries, "ms": round(query_seconds * 1000, 3)},
+            "serialization_ms": round(serialization * per_sample * 1000, 3),
+            "samples": sampler.rounds,
+            "sample_interval_ms": round(per_sample * 1000, 3),
+            "threads": len(self.threads),
+            "hot_spots": [
+                {
+                    "function": label,
+                    "self_ms": round(own * per_sample * 1000, 3),
+                    "total_ms": round(total * per_sample * 1000, 3),
+                }
+                for label, (own, total) in hot_spots[:HOT_SPOTS]
+            ],
+        }
+        lines = [f"{line} {count}" for line, count in sorted(folded.items())]
+        return report, "\n".join(lines) + "\n"
+
+
+def _store(profile_dir, report, folded):
+    os.makedirs(profile_dir, exist_ok=True)
+    base = os.path.join(profile_dir, report["id"])
+    with open(base + ".json", "w") as f:
+        json.dump(report, f, indent=1)
+    with open(base + ".folded", "w") as f:
+        f.write(folded)
+    reports = sorted(
+        (entry for entry in os.scandir(profile_dir) if entry.name.endswith(".json")),
+        key=lambda entry: entry.stat().st_mtime,
+    )
+    for entry in reports[:-KEEP] if KEEP else []:
+        for suffix in (".json", ".folded"):
+            path = entry.path[: -len(".json")] + suffix
+            if os.path.exists(path):
+                os.remove(path)
+
+
+async def _respond(send, status_code, body, content_type=b"application/json"):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", content_type),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class ProfilingMiddleware:
+    def __init__(self, app, decode_token, admins=ADMIN_EMAILS, profile_dir=None):
+        self.app = app
+        self.decode_token = decode_token
+        self.admins = admins
+        self.profile_dir = profile_dir or PROFILE_DIR
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        download = scope["path"].startswith(DOWNLOAD_PREFIX)
+        requested = False
+        if not download:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    requested = value not in (b"", b"0")
+                    break
+            if not requested:
+                await self.app(scope, receive, send)
+                return
+        if not self._is_admin(scope):
+            body = json.dumps({"detail": "Profiling requires an admin token"})
+            await _respond(send, 403, body.encode())
+            return
+        if download:
+            await self._download(scope, send)
+        else:
+            await self._profile(scope, receive, send)
+
+    def _is_admin(self, scope):
+        authorization = dict(scope["headers"]).get(b"authorization", b"")
+        scheme, _, token = authorization.decode("latin-1").partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            return False
+        try:
+            email = self.decode_token(token)
+        except HTTPException:
+            return False
+        return is_admin(email, self.admins)
+
+    async def _download(self, scope, send):
+        match = DOWNLOAD_PATH.match(scope["path"])
+        path = None
+        if match:
+            suffix = ".folded" if match.group(2) else ".json"
+            path = os.path.join(self.profile_dir, match.group(1) + suffix)
+        if path is None or not os.path.exists(path):
+            await _respond(send, 404, b'{"detail":"Profile not found"}')
+            return
+        body = await run_in_threadpool(_read, path)
+        if match.group(2):
+            await _respond(send, 200, body, b"text/plain; charset=utf-8")
+        else:
+            await _respond(send, 200, body)
+
+    async def _profile(self, scope, receive, send):
+        profile = Profile()
+        stats = request_stats.get()
+        stats_token = None
+        if stats is None:
+            stats = RequestStats(scope)
+            stats_token = request_stats.set(stats)
+        queries, query_seconds = stats.queries, stats.query_seconds
+        token = active_profile.set(profile)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", profile.id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        profile.sampler.start()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            wall = time.perf_counter() - start
+            profile.sampler.stop()
+            active_profile.reset(token)
+            if stats_token is not None:
+                request_stats.reset(stats_token)
+            report, folded = profile.report(
+                scope,
+                status_code,
+                wall,
+                stats.queries - queries,
+                stats.query_seconds - query_seconds,
+            )
+            profile.release_threads()
+            await run_in_threadpool(_store, self.profile_dir, report, folded)
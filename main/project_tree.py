@@ -0,0 +1,195 @@
+from sqlalchemy import func, or_, select
+
+from main import models
+
+
+CLOSED_ISSUE_STATUSES = ("Closed", "Resolved")
+MAX_DEPTH = 5
+
+# Columns returned per level; the key and parent columns are always kept.
+LEVELS = {
+    "deliverables": (
+        ["deliverable_id"],
+        [
+            "deliverable_name",
+            "deliverable_description",
+            "priority",
+            "baseline_start_date",
+            "baseline_end_date",
+            "planned_start_date",
+            "planned_end_date",
+        ],
+    ),
+    "tasks": (
+        ["task_id", "deliverable_id"],
+        [
+            "task_name",
+            "task_description",
+            "task_type_id",
+            "priority",
+            "baseline_start_date",
+            "baseline_end_date",
+            "planned_start_date",
+            "planned_end_date",
+            "effort_estimated_in_hours",
+            "assignee_id",
+            "reviewer_id",
+        ],
+    ),
+    "latest_status": (
+        ["task_status_id", "task_id"],
+        ["action_date", "hours_spent", "progress", "remarks"],
+    ),
+    "open_issues": (
+        ["issue_id", "task_id"],
+        [
+            "issue_title",
+            "issue_description",
+            "action_owner_id",
+            "issue_priority",
+            "issue_status",
+        ],
+    ),
+    "recent_activities": (
+        ["issue_activity_id", "issue_id"],
+        ["comment_by", "comment_at", "comment"],
+    ),
+}
+
+FIELDS = {field for _, fields in LEVELS.values() for field in fields}
+
+
+def _columns(model, level, fields):
+    keys, defaults = LEVELS[level]
+    chosen = defaults if fields is None else [f for f in defaults if f in fields]
+    return [getattr(model, name) for name in keys + chosen]
+
+
+def _rows(db, statement):
+    return [dict(row._mapping) for row in db.execute(statement)]
+
+
+def _latest(db, model, level, fields, parents, order_by, limit, *criteria):
+    """The first `limit` active rows per parent by `order_by`, in one query.
+
+    ROW_NUMBER() over the parent's rows walks the (parent, date) index once,
+    where the NOT EXISTS form used by vw_task_status_latest re-probes it for
+    every candidate row.
+    """
+    parent = getattr(model, LEVELS[level][0][1])
+    rank = func.row_number().over(partition_by=parent, order_by=order_by)
+    ranked = (
+        select(*_columns(model, level, fields), rank.label("rank"))
+        .where(parents, model.entity_status == "Active", *criteria)
+        .subquery()
+    )
+    columns = [column for column in ranked.c if column.key != "rank"]
+    return _rows(
+        db,
+        select(*columns)
+        .where(ranked.c.rank <= limit)
+        .order_by(ranked.c[parent.key], ranked.c.rank),
+    )
+
+
+def project_tree(db, project_id, depth=MAX_DEPTH, fields=None, activities=5):
+    """Deliverables -> tasks -> latest status -> open issues -> recent activity.
+
+    Each level is one query keyed by the ids of the level above, so the
+    tree costs at most 1 + depth statements whatever its size. `fields`
+    limits the non-key columns returned at every level.
+    """
+    project = db.execute(
+        select(models.Project.project_id, models.Project.project_name).where(
+            models.Project.project_id == project_id
+        )
+    ).first()
+    if project is None:
+        return None
+    tree = {**project._mapping, "depth": depth, "deliverables": []}
+
+    deliverables = _rows(
+        db,
+        select(*_columns(models.Deliverable, "deliverables", fields))
+        .where(
+            models.Deliverable.project_id == project_id,
+            models.Deliverable.entity_status == "Active",
+        )
+        .order_by(models.Deliverable.deliverable_id),
+    )
+    tree["deliverables"] = deliverables
+    if depth < 2 or not deliverables:
+        return tree
+
+    tasks = _rows(
+        db,
+        select(*_columns(models.Task, "tasks", fields))
+        .where(
+            models.Task.deliverable_id.in_([d["deliverable_id"] for d in deliverables]),
+            models.Task.entity_status == "Active",
+        )
+        .order_by(models.Task.task_id),
+    )
+    by_deliverable = {d["deliverable_id"]: d for d in deliverables}
+    for deliverable in deliverables:
+        deliverable["tasks"] = []
+    for task in tasks:
+        by_deliverable[task["deliverable_id"]]["tasks"].append(task)
+    if depth < 3 or not tasks:
+        return tree
+
+    task_ids = [task["task_id"] for task in tasks]
+    by_task = {task["task_id"]: task for task in tasks}
+    for task in tasks:
+        task["latest_status"] = None
+    for row in _latest(
+        db,
+        models.TaskStatus,
+        "latest_status",
+        fields,
+        models.TaskStatus.task_id.in_(task_ids),
+        (models.TaskStatus.action_date.desc(), models.TaskStatus.task_status_id.desc()),
+        1,
+        models.TaskStatus.action_date.isnot(None),
+    ):
+        by_task[row["task_id"]]["latest_status"] = row
+    if depth < 4:
+        return tree
+
+    issues = _rows(
+        db,
+        select(*_columns(models.Issue, "open_issues", fields))
+        .where(
+            models.Issue.task_id.in_(task_ids),
+            models.Issue.entity_status == "Active",
+            or_(
+                models.Issue.issue_status.is_(None),
+                models.Issue.issue_status.notin_(CLOSED_ISSUE_STATUSES),
+            ),
+        )
+        .order_by(models.Issue.issue_id),
+    )
+    for task in tasks:
+        task["open_issues"] = []
+    for issue in issues:
+        by_task[issue["task_id"]]["open_issues"].append(issue)
+    if depth < 5 or not issues or not activities:
+        return tree
+
+    by_issue = {issue["issue_id"]: issue for issue in issues}
+    for issue in issues:
+        issue["recent_activities"] = []
+    for activity in _latest(
+        db,
+        models.IssueActivity,
+        "recent_activities",
+        fields,
+        models.IssueActivity.issue_id.in_(list(by_issue)),
+        (
+            models.IssueActivity.comment_at.desc(),
+            models.IssueActivity.issue_activity_id.desc(),
+        ),
+        activities,
+    ):
+        by_issue[activity["issue_id"]]["recent_activities"].append(activity)
+    return tree
@@ -0,0 +1,126 @@
+import logging
+import os
+from contextvars import ContextVar
+from functools import wraps
+from inspect import iscoroutinefunction
+
+
+logger = logging.getLogger("delivery_tracker.sql")
+
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "500"))
+STRICT = os.getenv("QUERY_BUDGET_STRICT", "0") == "1"
+TRACK_STATEMENTS = STRICT or os.getenv("SQL_INSTRUMENTATION", "0") == "1"
+REPEAT_THRESHOLD = int(os.getenv("SQL_REPEAT_THRESHOLD", "5"))
+
+request_stats = ContextVar("request_stats", default=None)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+class RequestStats:
+    __slots__ = ("scope", "queries", "query_seconds", "statements")
+
+    def __init__(self, scope=None):
+        self.scope = scope
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.statements = {} if TRACK_STATEMENTS else None
+
+
+def route_label(scope):
+    if scope is None:
+        return "-"
+    route = scope.get("route")
+    return f"{scope.get('method')} {getattr(route, 'path', scope.get('path'))}"
+
+
+def _shape(value):
+    if isinstance(value, dict):
+        return {key: _shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_shape(item) for item in value]
+    return type(value).__name__
+
+
+def parameter_shape(parameters, many):
+    """Types of the bound parameters, never their values."""
+    if many:
+        return f"{len(parameters)} x {_shape(parameters[0]) if parameters else []}"
+    return str(_shape(parameters))
+
+
+def observe(statement, parameters, many, elapsed):
+    stats = request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.query_seconds += elapsed
+    if elapsed * 1000 >= SLOW_QUERY_MS:
+        logger.warning(
+            "slow query (%.1f ms) in %s: %s params=%s",
+            elapsed * 1000,
+            route_label(stats and stats.scope),
+            statement,
+            parameter_shape(parameters, many),
+        )
+    if stats is not None and stats.statements is not None:
+        count = stats.statements.get(statement, 0) + 1
+        stats.statements[statement] = count
+        if count == REPEAT_THRESHOLD:
+            logger.warning(
+                "statement repeated %d times in %s (possible N+1): %s params=%s",
+                count,
+                route_label(stats.scope),
+                statement,
+                parameter_shape(parameters, many),
+            )
+
+
+def _check_budget(endpoint, budget, stats, start):
+    used = stats.queries - start
+    if used <= budget:
+        return
+    message = (
+        f"{route_label(stats.scope)} ran {used} queries, "
+        f"over the budget of {budget} declared on {endpoint.__qualname__}"
+    )
+    if STRICT:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
+
+
+def query_budget(max_queries):
+    """Declare how many SQL statements an endpoint may run.
+
+    Overruns are logged; with QUERY_BUDGET_STRICT=1 (test runs) they raise
+    QueryBudgetExceeded instead.
+    """
+
+    def decorate(endpoint):
+        if iscoroutinefunction(endpoint):
+
+            @wraps(endpoint)
+            async def wrapper(*args, **kwargs):
+                stats = request_stats.get()
+                start = stats.queries if stats is not None else 0
+                result = await endpoint(*args, **kwargs)
+                if stats is not None:
+                    _check_budget(endpoint, max_queries, stats, start)
+                return result
+
+        else:
+
+            @wraps(endpoint)
+            def wrapper(*args, **kwargs):
+                stats = request_stats.get()
+                start = stats.queries if stats is not None else 0
+                result = endpoint(*args, **kwargs)
+                if stats is not None:
+                    _check_budget(endpoint, max_queries, stats, start)
+                return result
+
+        wrapper.query_budget = max_queries
+        return wrapper
+
+    return decorate
@@ -0,0 +1,164 @@
+import os
+import threading
+import time
+
+from main import models
+
+from .entities import canonical_entity_type
+
+
+TTL_SECONDS = float(os.getenv("REFERENCE_CACHE_TTL", "60"))
+USE_FOR_LISTS = os.getenv("REFERENCE_CACHE_LISTS", "0") == "1"
+
+LOADERS = {
+    "Employee": lambda db: {
+        employee_id: name
+        for employee_id, name in db.query(
+            models.Employee.employee_id, models.Employee.employee_full_name
+        )
+    },
+    "BusinessUnit": lambda db: {
+        row[0]: row[1:]
+        for row in db.query(
+            models.BusinessUnit.business_unit_id,
+            models.BusinessUnit.business_unit_name,
+            models.BusinessUnit.business_unit_head_id,
+        )
+    },
+    "Project": lambda db: {
+        row[0]: row[1:]
+        for row in db.query(
+            models.Project.project_id,
+            models.Project.project_name,
+            models.Project.business_unit_id,
+            models.Project.delivery_manager_id,
+        )
+    },
+    "Deliverable": lambda db: {
+        row[0]: row[1:]
+        for row in db.query(
+            models.Deliverable.deliverable_id,
+            models.Deliverable.deliverable_name,
+            models.Deliverable.project_id,
+        )
+    },
+    "TaskType": lambda db: {
+        task_type_id: name
+        for task_type_id, name in db.query(
+            models.TaskType.task_type_id, models.TaskType.task_type_Name
+        )
+    },
+}
+
+_NO_PAIR = (None, None)
+_NO_TRIPLE = (None, None, None)
+
+
+class ReferenceCache:
+    """id -> name maps for the small tables the vw_* views join for names.
+
+    Each map is loaded on first use, dropped when a session commits a write
+    to its table (see crud.invalidate_on_commit), and reloaded after
+    TTL_SECONDS so changes made by other worker processes are picked up.
+    """
+
+    def __init__(self):
+        self._maps = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, db, name):
+        entry = self._maps.get(name)
+        if entry is not None and time.monotonic() - entry[1] < TTL_SECONDS:
+            self.hits += 1
+            return entry[0]
+        with self._lock:
+            entry = self._maps.get(name)
+            if entry is not None and time.monotonic() - entry[1] < TTL_SECONDS:
+                return entry[0]
+            self.misses += 1
+            data = LOADERS[name](db)
+            self._maps[name] = (data, time.monotonic())
+        return data
+
+    def invalidate(self, entity_type=None):
+        with self._lock:
+            if entity_type is None:
+                self._maps.clear()
+            else:
+                self._maps.pop(canonical_entity_type(entity_type), None)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        now = time.monotonic()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "age_seconds": {
+                name: round(now - loaded_at, 1)
+                for name, (_, loaded_at) in list(self._maps.items())
+            },
+        }
+
+    def prime(self, db):
+        for name in LOADERS:
+            self.get(db, name)
+
+
+cache = ReferenceCache()
+
+
+def enrich_tasks(db, tasks):
+    employees = cache.get(db, "Employee")
+    business_units = cache.get(db, "BusinessUnit")
+    projects = cache.get(db, "Project")
+    deliverables = cache.get(db, "Deliverable")
+    task_types = cache.get(db, "TaskType")
+    rows = []
+    for task in tasks:
+        deliverable_name, project_id = deliverables.get(task.deliverable_id, _NO_PAIR)
+        project_name, business_unit_id, delivery_manager_id = projects.get(
+            project_id, _NO_TRIPLE
+        )
+        business_unit_name, business_unit_head_id = business_units.get(
+            business_unit_id, _NO_PAIR
+        )
+        rows.append(
+            {
+                "business_unit_id": business_unit_id,
+                "business_unit_name": business_unit_name,
+                "business_unit_head_id": business_unit_head_id,
+                "business_unit_head_name": employees.get(business_unit_head_id),
+                "project_id": project_id,
+                "project_name": project_name,
+                "delivery_manager_id": delivery_manager_id,
+                "delivery_manager_name": employees.get(delivery_manager_id),
+                "deliverable_id": task.deliverable_id,
+                "deliverable_name": deliverable_name,
+                "task_id": task.task_id,
+                "task_name": task.task_name,
+                "task_description": task.task_description,
+                "task_type_id": task.task_type_id,
+                "task_type_name": task_types.get(task.task_type_id),
+                "priority": task.priority,
+                "baseline_start_date": task.baseline_start_date,
+                "baseline_end_date": task.baseline_end_date,
+                "planned_start_date": task.planned_start_date,
+                "planned_end_date": task.planned_end_date,
+                "effort_estimated_in_hours": task.effort_estimated_in_hours,
+                "assignee_id": task.assignee_id,
+                "assignee_name": employees.get(task.assignee_id),
+                "reviewer_id": task.reviewer_id,
+                "reviewer_name": employees.get(task.reviewer_id),
+                "created_at": task.created_at,
+                "created_by": task.created_by,
+                "created_by_name": employees.get(task.created_by),
+                "updated_at": task.updated_at,
+                "updated_by": task.updated_by,
+                "updated_by_name": employees.get(task.updated_by),
+                "entity_status": task.entity_status,
+            }
+        )
+    return rows
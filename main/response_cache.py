@@ -0,0 +1,260 @@
+"""Serialized responses for hot list endpoints.
+
+A cached GET returns the stored bytes, gzip- or brotli-compressed when the
+client accepts it, without touching the database or pydantic. Entries are
+keyed by path and query string. An entry is dropped when a session commits
+a write to any table behind the endpoint's view (see
+crud.invalidate_on_commit), or after RESPONSE_CACHE_TTL seconds, which
+covers writes made by other processes. Once the stored bytes pass
+RESPONSE_CACHE_MAX_BYTES, the least recently used entries are evicted.
+"""
+
+import gzip
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import brotli
+from sqlalchemy.sql.util import find_tables
+from starlette.concurrency import run_in_threadpool
+
+from .entities import ENTITIES, ENTITY_BY_TABLE, canonical_entity_type
+from .views import VIEWS
+
+
+MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL", "60"))
+MIN_COMPRESS_BYTES = 500
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+STORED_HEADERS = {b"content-type"}
+
+
+def _dependencies():
+    """Entity type -> every entity type whose table its view reads."""
+    dependencies = {}
+    for name, entity in ENTITIES.items():
+        tables = find_tables(VIEWS[entity.view.__tablename__](), include_aliases=True)
+        dependencies[name] = frozenset(
+            ENTITY_BY_TABLE[table.name]
+            for table in (getattr(t, "element", t) for t in tables)
+            if table.name in ENTITY_BY_TABLE
+        )
+    return dependencies
+
+
+DEPENDENCIES = _dependencies()
+
+
+def accepted_encodings(headers):
+    """Encodings the client accepts with q > 0, from Accept-Encoding."""
+    accepted = set()
+    wildcard = False
+    for name, value in headers:
+        if name != b"accept-encoding":
+            continue
+        for item in value.decode("latin-1").split(","):
+            coding, _, params = item.strip().lower().partition(";")
+            q = params.strip()
+            if q.startswith("q="):
+                try:
+                    if float(q[2:]) <= 0:
+                        continue
+                except ValueError:
+                    continue
+            if coding == "*":
+                wildcard = True
+            elif coding:
+                accepted.add(coding)
+    if wildcard:
+        accepted.update(("br", "gzip"))
+    return accepted
+
+
+class Entry:
+    __slots__ = ("headers", "bodies", "tables", "route", "stored_at", "size")
+
+    def __init__(self, headers, body, tables, route):
+        self.headers = headers
+        self.bodies = {"identity": body}
+        if len(body) >= MIN_COMPRESS_BYTES:
+            self.bodies["gzip"] = gzip.compress(body, compresslevel=GZIP_LEVEL)
+            self.bodies["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        self.tables = tables
+        self.route = route
+        self.stored_at = time.monotonic()
+        self.size = sum(len(variant) for variant in self.bodies.values())
+
+    def choose(self, accepted):
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.bodies:
+                return encoding, self.bodies[encoding]
+        return "identity", self.bodies["identity"]
+
+
+class ResponseCache:
+    def __init__(self, max_bytes=MAX_BYTES, ttl=TTL_SECONDS):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if time.monotonic() - entry.stored_at >= self.ttl:
+                self._drop(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def generation(self, tables):
+        """Snapshot taken before a miss is computed; see put()."""
+        with self._lock:
+            return tuple(self._generations.get(table, 0) for table in sorted(tables))
+
+    def put(self, key, entry, generation):
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            # A write that landed while the response was being built has
+            # already invalidated; storing it now would bring it back stale.
+            current = tuple(
+                self._generations.get(table, 0) for table in sorted(entry.tables)
+            )
+            if current != generation:
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _drop(self, key):
+        self.size -= self._entries.pop(key).size
+
+    def invalidate(self, entity_type=None):
+        entity_type = entity_type and canonical_entity_type(entity_type)
+        with self._lock:
+            if entity_type not in ENTITIES:
+                for name in ENTITIES:
+                    self._generations[name] = self._generations.get(name, 0) + 1
+                self._entries.clear()
+                self.size = 0
+                return
+            self._generations[entity_type] = self._generations.get(entity_type, 0) + 1
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entity_type in entry.tables
+            ]:
+                self._drop(key)
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+        }
+
+
+cache = ResponseCache()
+
+
+class ResponseCacheMiddleware:
+    """Serve GETs on `paths` (path -> entity type) from `cache`.
+
+    Requests carrying `Cache-Control: no-cache` or `X-Profile` skip the
+    lookup but still refresh the entry.
+    """
+
+    def __init__(self, app, paths, cache=cache):
+        self.app = app
+        self.paths = paths
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        entity_type = self.paths.get(scope["path"]) if scope["type"] == "http" else None
+        if entity_type is None or scope["method"] != "GET" or not self.cache.max_bytes:
+            await self.app(scope, receive, send)
+            return
+        key = (scope["path"], scope.get("query_string", b""))
+        headers = scope["headers"]
+        bypass = any(
+            (name == b"cache-control" and b"no-cache" in value) or name == b"x-profile"
+            for name, value in headers
+        )
+        entry = None if bypass else self.cache.get(key)
+        if entry is not None:
+            if entry.route is not None:
+                scope["route"] = entry.route
+            await self._send(send, entry, accepted_encodings(headers), b"HIT")
+            return
+
+        tables = DEPENDENCIES[entity_type]
+        generation = self.cache.generation(tables)
+        start = None
+        chunks = []
+        passthrough = False
+
+        async def buffer(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start = message
+                if message["status"] != 200:
+                    passthrough = True
+                    await send(message)
+            else:
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, buffer)
+        if passthrough or start is None:
+            return
+        # Compressing a large list is too slow to do on the event loop.
+        entry = await run_in_threadpool(
+            Entry,
+            [
+                (name, value)
+                for name, value in start["headers"]
+                if name in STORED_HEADERS
+            ],
+            b"".join(chunks),
+            tables,
+            scope.get("route"),
+        )
+        self.cache.put(key, entry, generation)
+        await self._send(send, entry, accepted_encodings(headers), b"MISS")
+
+    async def _send(self, send, entry, accepted, status):
+        encoding, body = entry.choose(accepted)
+        headers = list(entry.headers)
+        if encoding != "identity":
+            headers.append((b"content-encoding", encoding.encode()))
+        headers += [
+            (b"content-length", str(len(body)).encode()),
+            (b"vary", b"Accept-Encoding"),
+            (b"x-cache", status),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
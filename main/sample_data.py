@@ -0,0 +1,472 @@
+"""Generate a referentially consistent delivery-tracker dataset.
+
+    python main/sample_data.py --scale 10
+    python main/sample_data.py --tasks 200000 --task-statuses 2000000 --skew 1.2
+
+Rows are built in FK order (employees, business units and memberships,
+task types, projects, deliverables, then tasks with their statuses,
+issues and issue activities) and written with executemany in batches of
+--batch-size. How children are spread over parents (tasks per
+deliverable, statuses per task, work per assignee) follows a Zipf-like
+distribution whose exponent is --skew; 0 spreads them evenly.
+
+The target is --database-url, else DATABASE_URL, else a local
+sample_data.db. Anything other than SQLite needs --yes-really, so the
+loader never fills a shared database by accident.
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+
+from main import models  # noqa: E402
+
+
+DEFAULT_SIZES = {
+    "employees": 200,
+    "business_units": 10,
+    "projects": 50,
+    "deliverables": 400,
+    "tasks": 10000,
+    "task_statuses": 50000,
+    "issues": 2000,
+    "issue_activities": 6000,
+}
+
+ID_FORMATS = {
+    "employees": "E{:06}",
+    "business_units": "B{:04}",
+    "projects": "P{:06}",
+    "deliverables": "D{:07}",
+    "tasks": "T{:08}",
+    "task_statuses": "S{:09}",
+    "issues": "I{:07}",
+    "issue_activities": "A{:08}",
+}
+
+TASK_TYPES = [
+    ("TT0", "Development", "Build and unit test a change"),
+    ("TT1", "Testing", "Functional and regression testing"),
+    ("TT2", "Code Review", "Peer review of a change"),
+    ("TT3", "Design", "Solution and interface design"),
+    ("TT4", "Documentation", "User and technical documentation"),
+    ("TT5", "Deployment", "Release and environment work"),
+    ("TT6", "Support", "Production support and fixes"),
+    ("TT7", "Research", "Spikes and investigation"),
+]
+
+FIRST_NAMES = (
+    "Aarav Priya Karthik Divya Arjun Meera Rahul Ananya "
+    "Vikram Lakshmi Suresh Kavya Nikhil Deepa Ravi Sneha"
+).split()
+LAST_NAMES = (
+    "Kumar Raman Iyer Sharma Nair Reddy Menon Pillai "
+    "Gupta Rao Subramanian Krishnan Das Patel Shah Joshi"
+).split()
+UNIT_NAMES = (
+    "Banking Insurance Retail Healthcare Telecom Energy "
+    "Logistics Utilities Media Manufacturing"
+).split()
+PRIORITIES = ["High", "Medium", "Low"]
+ISSUE_STATUSES = ["Open", "In Progress", "Resolved", "Closed"]
+REMARKS = [
+    "Progress update",
+    "Blocked waiting on review",
+    "Completed the planned subtasks",
+    "Fixed review comments",
+    "Picked up after handover",
+]
+COMMENTS = [
+    "Looked into this today",
+    "Raised with the client team",
+    "Workaround shared, fix pending",
+    "Verified in the test environment",
+]
+
+FLUSH_ORDER = [
+    "employees",
+    "business_units",
+    "employee_business_units",
+    "task_types",
+    "projects",
+    "deliverables",
+    "tasks",
+    "task_statuses",
+    "issues",
+    "issue_activities",
+]
+
+TABLES = {
+    "employees": models.Employee.__table__,
+    "business_units": models.BusinessUnit.__table__,
+    "employee_business_units": models.EmployeeBusinessUnit.__table__,
+    "task_types": models.TaskType.__table__,
+    "projects": models.Project.__table__,
+    "deliverables": models.Deliverable.__table__,
+    "tasks": models.Task.__table__,
+    "task_statuses": models.TaskStatus.__table__,
+    "issues": models.Issue.__table__,
+    "issue_activities": models.IssueActivity.__table__,
+}
+
+
+def ids(sizes, name):
+    return [ID_FORMATS[name].format(i) for i in range(sizes[name])]
+
+
+def zipf_weights(n, skew, rng):
+    weights = [1.0 / (rank**skew) for rank in range(1, n + 1)]
+    rng.shuffle(weights)
+    return weights
+
+
+def spread(total, parents, skew, rng):
+    """Split `total` children over `parents` following zipf_weights."""
+    if parents == 0:
+        return []
+    weights = zipf_weights(parents, skew, rng)
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for index in rng.choices(range(parents), weights=weights, k=total - sum(counts)):
+        counts[index] += 1
+    return counts
+
+
+class Loader:
+    """Buffers rows per table and writes them with executemany.
+
+    When any buffer reaches batch_size every buffer is flushed in FK order,
+    so a child row is never written before its parent.
+    """
+
+    def __init__(self, conn, batch_size):
+        self.conn = conn
+        self.batch_size = batch_size
+        self.buffers = {name: [] for name in FLUSH_ORDER}
+        self.counts = dict.fromkeys(FLUSH_ORDER, 0)
+
+    def add(self, name, row):
+        buffer = self.buffers[name]
+        buffer.append(row)
+        if len(buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        for name in FLUSH_ORDER:
+            rows = self.buffers[name]
+            if rows:
+                self.conn.execute(insert(TABLES[name]), rows)
+                self.counts[name] += len(rows)
+                self.buffers[name] = []
+
+
+def _audit(creator, at):
+    return {
+        "created_at": at,
+        "created_by": creator,
+        "updated_at": at,
+        "updated_by": creator,
+        "entity_status": "Active",
+    }
+
+
+def generate(
+    engine,
+    sizes=None,
+    skew=1.0,
+    seed=42,
+    batch_size=10000,
+    password_hash="",
+    start=None,
+):
+    sizes = {**DEFAULT_SIZES, **(sizes or {})}
+    rng = random.Random(seed)
+    start = start or datetime(2026, 1, 1)
+    admin = ID_FORMATS["employees"].format(0)
+
+    employees = ids(sizes, "employees")
+    bus = ids(sizes, "business_units")
+    projects = ids(sizes, "projects")
+    employee_weights = zipf_weights(len(employees), skew, rng)
+    employee_cum = []
+    running = 0.0
+    for weight in employee_weights:
+        running += weight
+        employee_cum.append(running)
+
+    def pick_employee():
+        return rng.choices(employees, cum_weights=employee_cum)[0]
+
+    with engine.begin() as conn:
+        if conn.dialect.name == "sqlite":
+            conn.exec_driver_sql("PRAGMA synchronous = OFF")
+        loader = Loader(conn, batch_size)
+        for i, employee_id in enumerate(employees):
+            loader.add(
+                "employees",
+                {
+                    "employee_id": employee_id,
+                    "employee_full_name": f"{FIRST_NAMES[i % len(FIRST_NAMES)]} "
+                    f"{LAST_NAMES[(i // len(FIRST_NAMES)) % len(LAST_NAMES)]}",
+                    "employee_email_address": f"{employee_id.lower()}@example.com",
+                    "password": password_hash,
+                    **_audit(admin, start),
+                },
+            )
+        for i, business_unit_id in enumerate(bus):
+            loader.add(
+                "business_units",
+                {
+                    "business_unit_id": business_unit_id,
+                    "business_unit_name": f"{UNIT_NAMES[i % len(UNIT_NAMES)]} "
+                    f"{i // len(UNIT_NAMES) + 1}",
+                    "business_unit_head_id": rng.choice(employees),
+                    "business_unit_description": "Delivery unit",
+                    **_audit(admin, start),
+                },
+            )
+        for employee_id in employees:
+            loader.add(
+                "employee_business_units",
+                {
+                    "employee_id": employee_id,
+                    "business_unit_id": rng.choice(bus),
+                    **_audit(admin, start),
+                },
+            )
+        for task_type_id, name, description in TASK_TYPES:
+            loader.add(
+                "task_types",
+                {
+                    "task_type_id": task_type_id,
+                    "task_type_Name": name,
+                    "task_type_description": description,
+                    **_audit(admin, start),
+                },
+            )
+
+        project_windows = []
+        for i, project_id in enumerate(projects):
+            begin = start + timedelta(days=rng.randrange(0, 180))
+            end = begin + timedelta(days=rng.randrange(90, 365))
+            project_windows.append((begin, end))
+            loader.add(
+                "projects",
+                {
+                    "project_id": project_id,
+                    "business_unit_id": bus[i % len(bus)],
+                    "project_name": f"Project {project_id}",
+                    "project_description": "Client delivery programme",
+                    "delivery_manager_id": pick_employee(),
+                    "baseline_start_date": begin,
+                    "baseline_end_date": end,
+                    "planned_start_date": begin,
+                    "planned_end_date": end,
+                    **_audit(admin, begin),
+                },
+            )
+
+        deliverable_windows = []
+        deliverable_counts = spread(sizes["deliverables"], len(projects), skew, rng)
+        for project_index, count in enumerate(deliverable_counts):
+            begin, end = project_windows[project_index]
+            span = max((end - begin).days, 1)
+            for _ in range(count):
+                deliverable_id = ID_FORMATS["deliverables"].format(
+                    len(deliverable_windows)
+                )
+                d_begin = begin + timedelta(days=rng.randrange(span))
+                d_end = min(d_begin + timedelta(days=rng.randrange(14, 90)), end)
+                deliverable_windows.append((d_begin, d_end))
+                loader.add(
+                    "deliverables",
+                    {
+                        "deliverable_id": deliverable_id,
+                        "project_id": projects[project_index],
+                        "deliverable_name": f"Deliverable {deliverable_id}",
+                        "deliverable_description": "Milestone scope",
+                        "priority": rng.choice(PRIORITIES),
+                        "baseline_start_date": d_begin,
+                        "baseline_end_date": d_end,
+                        "planned_start_date": d_begin,
+                        "planned_end_date": d_end,
+                        **_audit(admin, d_begin),
+                    },
+                )
+
+        task_counts = spread(sizes["tasks"], len(deliverable_windows), skew, rng)
+        status_counts = spread(sizes["task_statuses"], sizes["tasks"], skew, rng)
+        issue_counts = spread(sizes["issues"], sizes["tasks"], skew, rng)
+        activity_counts = spread(sizes["issue_activities"], sizes["issues"], skew, rng)
+        task_index = 0
+        status_index = 0
+        issue_index = 0
+        activity_index = 0
+        for deliverable_index, count in enumerate(task_counts):
+            d_begin, d_end = deliverable_windows[deliverable_index]
+            deliverable_id = ID_FORMATS["deliverables"].format(deliverable_index)
+            d_span = max((d_end - d_begin).days, 1)
+            for _ in range(count):
+                task_id = ID_FORMATS["tasks"].format(task_index)
+                t_begin = d_begin + timedelta(days=rng.randrange(d_span))
+                t_end = min(t_begin + timedelta(days=rng.randrange(1, 15)), d_end)
+                assignee = pick_employee()
+                loader.add(
+                    "tasks",
+                    {
+                        "task_id": task_id,
+                        "deliverable_id": deliverable_id,
+                        "task_name": f"Task {task_id}",
+                        "task_description": "Implement, test and hand over the change",
+                        "task_type_id": rng.choice(TASK_TYPES)[0],
+                        "priority": rng.choice(PRIORITIES),
+                        "baseline_start_date": t_begin,
+                        "baseline_end_date": t_end,
+                        "planned_start_date": t_begin,
+                        "planned_end_date": t_end,
+                        "effort_estimated_in_hours": str(
+                            rng.choice((2, 4, 8, 16, 24, 40))
+                        ),
+                        "assignee_id": assignee,
+                        "reviewer_id": pick_employee(),
+                        **_audit(admin, t_begin),
+                    },
+                )
+                statuses = status_counts[task_index]
+                t_span = max((t_end - t_begin).days, 1)
+                progress = 0
+                days = sorted(rng.randrange(t_span + 1) for _ in range(statuses))
+                for day in days:
+                    progress = min(100, progress + rng.randrange(0, 41, 10))
+                    at = t_begin + timedelta(days=day)
+                    loader.add(
+                        "task_statuses",
+                        {
+                            "task_status_id": ID_FORMATS["task_statuses"].format(
+                                status_index
+                            ),
+                            "task_id": task_id,
+                            "action_date": at.date(),
+                            "hours_spent": str(rng.randrange(1, 9)),
+                            "progress": str(progress),
+                            "remarks": rng.choice(REMARKS),
+                            **_audit(assignee, at),
+                        },
+                    )
+                    status_index += 1
+                for _ in range(issue_counts[task_index]):
+                    issue_id = ID_FORMATS["issues"].format(issue_index)
+                    loader.add(
+                        "issues",
+                        {
+                            "issue_id": issue_id,
+                            "task_id": task_id,
+                            "issue_title": f"Issue on {task_id}",
+                            "issue_description": "Blocked on an upstream dependency",
+                            "action_owner_id": pick_employee(),
+                            "issue_priority": rng.choice(PRIORITIES),
+                            "issue_status": rng.choice(ISSUE_STATUSES),
+                            **_audit(assignee, t_begin),
+                        },
+                    )
+                    for _ in range(activity_counts[issue_index]):
+                        at = t_begin + timedelta(hours=rng.randrange(1, 24 * t_span))
+                        loader.add(
+                            "issue_activities",
+                            {
+                                "issue_activity_id": ID_FORMATS[
+                                    "issue_activities"
+                                ].format(activity_index),
+                                "issue_id": issue_id,
+                                "comment_by": pick_employee(),
+                                "comment_at": at,
+                                "comment": rng.choice(COMMENTS),
+                                **_audit(admin, at),
+                            },
+                        )
+                        activity_index += 1
+                    issue_index += 1
+                task_index += 1
+        loader.flush()
+    return loader.counts
+
+
+DEFAULT_URL = "sqlite:///sample_data.db"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url",
+        default=os.getenv("DATABASE_URL") or DEFAULT_URL,
+        help=f"target database (default: DATABASE_URL, else {DEFAULT_URL})",
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiplies every default size"
+    )
+    for name in DEFAULT_SIZES:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int)
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--password", default="password")
+    parser.add_argument(
+        "--create-schema",
+        action="store_true",
+        help="run the alembic migrations before loading",
+    )
+    parser.add_argument(
+        "--yes-really",
+        action="store_true",
+        help="allow loading into a database that is not SQLite",
+    )
+    args = parser.parse_args()
+
+    url = args.database_url
+    if make_url(url).get_backend_name() != "sqlite" and not args.yes_really:
+        parser.error(
+            f"refusing to load synthetic rows into {make_url(url)!r}; "
+            "pass --yes-really to target a non-SQLite database"
+        )
+
+    from routers.login import hash_password
+
+    sizes = {}
+    for name, default in DEFAULT_SIZES.items():
+        value = getattr(args, name)
+        sizes[name] = value if value is not None else max(int(default * args.scale), 1)
+    if args.create_schema:
+        from alembic import command
+        from alembic.config import Config
+
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        config = Config(os.path.join(root, "alembic.ini"))
+        config.attributes["url"] = url
+        command.upgrade(config, "head")
+
+    engine = create_engine(url)
+    started = datetime.now()
+    counts = generate(
+        engine,
+        sizes,
+        skew=args.skew,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        password_hash=hash_password(args.password),
+    )
+    elapsed = (datetime.now() - started).total_seconds()
+    total = sum(counts.values())
+    print(", ".join(f"{name}={count}" for name, count in counts.items()))
+    print(f"{total} rows in {elapsed:.1f} s ({total / max(elapsed, 1e-9):.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
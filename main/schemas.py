@@ -1,11 +1,17 @@
-from datetime import datetime
-from typing import Optional
+import os
+from datetime import date, datetime
+from typing import Any, Dict, Generic, List, Optional, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from .utils import now_utc
 
 
+ViewT = TypeVar("ViewT")
+
+MAX_BATCH_IDS = int(os.getenv("MAX_BATCH_IDS", "500"))
+
+
 class EmployeeBusinessUnitBase(BaseModel):
     employee_id: str
     business_unit_id: str
@@ -90,7 +96,19 @@ class EmployeeUpdate(BaseModel):
 
 
 class EmployeePatch(BaseModel):
-    entity_status: str
+    model_config = {"extra": "forbid"}
+
+    employee_full_name: Optional[str] = None
+    employee_email_address: Optional[str] = None
+    password: Optional[str] = None
+
+    @field_validator("password")
+    @classmethod
+    def password_not_null(cls, value):
+        # Leaving the field out keeps the password; null would erase it.
+        if value is None:
+            raise ValueError("password cannot be null")
+        return value
 
 
 class BusinessUnitBase(BaseModel):
@@ -134,7 +152,11 @@ class BusinessUnitUpdate(BaseModel):
 
 
 class BusinessUnitPatch(BaseModel):
-    entity_status: str
+    model_config = {"extra": "forbid"}
+
+    business_unit_name: Optional[str] = None
+    business_unit_description: Optional[str] = None
+    business_unit_head_id: Optional[str] = None
 
 
 class BusinessUnitRead(BusinessUnitViewBase):
@@ -211,8 +233,17 @@ class ProjectRead(ProjectViewBase):
         from_attributes = True
 
 
-class ProjectPatch(ProjectBase):
-    pass
+class ProjectPatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    business_unit_id: Optional[str] = None
+    project_name: Optional[str] = None
+    project_description: Optional[str] = None
+    delivery_manager_id: Optional[str] = None
+    baseline_start_date: Optional[datetime] = None
+    baseline_end_date: Optional[datetime] = None
+    planned_start_date: Optional[datetime] = None
+    planned_end_date: Optional[datetime] = None
 
 
 class DeliverableBase(BaseModel):
@@ -290,8 +321,17 @@ class DeliverableRead(DeliverableViewBase):
         from_attributes = True
 
 
-class DeliverablePatch(DeliverableBase):
-    pass
+class DeliverablePatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    project_id: Optional[str] = None
+    deliverable_name: Optional[str] = None
+    deliverable_description: Optional[str] = None
+    priority: Optional[str] = None
+    baseline_start_date: Optional[datetime] = None
+    baseline_end_date: Optional[datetime] = None
+    planned_start_date: Optional[datetime] = None
+    planned_end_date: Optional[datetime] = None
 
 
 class TaskBase(BaseModel):
@@ -389,8 +429,21 @@ class TaskRead(TaskViewBase):
         from_attributes = True
 
 
-class TaskPatch(TaskBase):
-    pass
+class TaskPatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    deliverable_id: Optional[str] = None
+    task_name: Optional[str] = None
+    task_description: Optional[str] = None
+    task_type_id: Optional[str] = None
+    priority: Optional[str] = None
+    baseline_start_date: Optional[datetime] = None
+    baseline_end_date: Optional[datetime] = None
+    planned_start_date: Optional[datetime] = None
+    planned_end_date: Optional[datetime] = None
+    effort_estimated_in_hours: Optional[str] = None
+    assignee_id: Optional[str] = None
+    reviewer_id: Optional[str] = None
 
 
 class TaskTypeBase(BaseModel):
@@ -434,8 +487,11 @@ class TaskTypeRead(TaskTypeViewBase):
         from_attributes = True
 
 
-class TaskTypePatch(TaskTypeBase):
-    pass
+class TaskTypePatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    task_type_Name: Optional[str] = None
+    task_type_description: Optional[str] = None
 
 
 class TaskStatusBase(BaseModel):
@@ -515,8 +571,14 @@ class TaskStatusRead(TaskStatusViewBase):
         from_attributes = True
 
 
-class TaskStatusPatch(TaskStatusBase):
-    pass
+class TaskStatusPatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    task_id: Optional[str] = None
+    action_date: Optional[date] = None
+    hours_spent: Optional[str] = None
+    progress: Optional[str] = None
+    remarks: Optional[str] = None
 
 
 class IssueBase(BaseModel):
@@ -597,8 +659,15 @@ class IssueRead(IssueViewBase):
         from_attributes = True
 
 
-class IssuePatch(IssueBase):
-    pass
+class IssuePatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    task_id: Optional[str] = None
+    issue_title: Optional[str] = None
+    issue_description: Optional[str] = None
+    action_owner_id: Optional[str] = None
+    issue_priority: Optional[str] = None
+    issue_status: Optional[str] = None
 
 
 class IssueActivityBase(BaseModel):
@@ -660,38 +729,149 @@ class IssueActivityRead(IssueActivityViewBase):
         from_attributes = True
 
 
-class IssueActivityPatch(IssueActivityBase):
-    pass
+class IssueActivityPatch(BaseModel):
+    model_config = {"extra": "forbid"}
+
+    issue_id: Optional[str] = None
+    comment_by: Optional[str] = None
+    comment_at: Optional[datetime] = None
+    comment: Optional[str] = None
 
 
 class AuditLogBase(BaseModel):
     audit_id: str
-    entity_type: str
-    entity_id: str
-    action: str
-    action_date: datetime = Field(default_factory=now_utc())
-    action: str
+    entity_type: Optional[str] = None
+    entity_id: Optional[str] = None
+    action: Optional[str] = None
+    field_changed: Optional[str] = None
     old_value: Optional[str] = None
     new_value: Optional[str] = None
+    changed_by: Optional[str] = None
+    changed_at: Optional[datetime] = None
+
+
+class AuditLogRead(AuditLogBase):
+    class Config:
+        from_attributes = True
+
+
+class AuditLogPage(BaseModel):
+    items: List[AuditLogRead]
+    next_cursor: Optional[str] = None
+
+
+class WorkloadBucket(BaseModel):
+    bucket_start: date
+    bucket_end: date
+    allocated_hours: float
+    capacity_hours: float
+    over_capacity: bool
+
+
+class EmployeeWorkload(BaseModel):
+    employee_id: str
+    employee_full_name: Optional[str] = None
+    total_allocated_hours: float
+    over_capacity: bool
+    buckets: List[WorkloadBucket]
+
 
+class TaskStatusHistoryEntry(BaseModel):
+    task_status_id: str
+    task_id: str
+    action_date: date
+    hours_spent: Optional[str] = None
+    progress: Optional[str] = None
+    remarks: Optional[str] = None
+    cumulative_hours_spent: float
+    created_at: Optional[datetime] = None
+    created_by: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    updated_by: Optional[str] = None
+
+
+class TaskStatusHistoryPage(BaseModel):
+    task_id: str
+    items: List[TaskStatusHistoryEntry]
+    next_cursor: Optional[str] = None
+
+
+class BurndownPoint(BaseModel):
+    day: date
+    completed_effort: float
+    remaining_effort: float
+
+
+class BurndownSeries(BaseModel):
+    scope: str
+    scope_id: str
+    total_effort: float
+    points: List[BurndownPoint]
+
+
+class ProjectTree(BaseModel):
+    project_id: str
+    project_name: Optional[str] = None
+    depth: int
+    deliverables: List[Dict[str, Any]]
 
-class AuditLogCreate(BaseModel):
+
+class DashboardStatusEntry(BaseModel):
+    task_status_id: str
+    task_id: str
+    task_name: Optional[str] = None
+    action_date: Optional[date] = None
+    hours_spent: Optional[str] = None
+    progress: Optional[str] = None
+    remarks: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class MyDashboard(BaseModel):
+    employee_id: str
+    employee_full_name: Optional[str] = None
+    assigned_tasks: List[TaskViewBase]
+    review_tasks: List[TaskViewBase]
+    owned_issues: List[IssueViewBase]
+    recent_statuses: List[DashboardStatusEntry]
+    timings_ms: Dict[str, float]
+
+
+class SearchHit(BaseModel):
+    entity_type: str
+    entity_id: str
+    parent_id: Optional[str] = None
+    title: Optional[str] = None
+    snippet: str
+    score: float
+
+
+class ChangeEntry(BaseModel):
     entity_type: str
     entity_id: str
     action: str
-    action: str
-    old_value: Optional[str] = None
-    new_value: Optional[str] = None
+    changed_at: datetime
+    changed_by: Optional[str] = None
+    row: Optional[Dict[str, Any]] = None
 
 
-class AuditLogRead(AuditLogBase):
-    class Config:
-        from_attributes = True
+class ChangeFeedPage(BaseModel):
+    entries: List[ChangeEntry]
+    next_cursor: Optional[str] = None
+    has_more: bool
 
 
-class AuditLogPatch(BaseModel):
-    entity_type: Optional[str] = None
-    entity_id: Optional[str] = None
-    action: Optional[str] = None
-    old_value: Optional[str] = None
-    new_value: Optional[str] = None
+class ViewDelta(BaseModel, Generic[ViewT]):
+    items: List[ViewT]
+    archived_ids: List[str]
+    watermark: datetime
+    next_cursor: Optional[str] = None
+
+
+class BatchIds(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class ViewBatch(BaseModel, Generic[ViewT]):
+    items: List[ViewT]
+    missing_ids: List[str]
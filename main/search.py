@@ -0,0 +1,180 @@
+import re
+
+from sqlalchemy import text
+
+
+SNIPPET_RADIUS = 60
+
+SEARCH_ENTITIES = {
+    "Task": {
+        "table": "task",
+        "pk": "task_id",
+        "parent": "deliverable_id",
+        "title": "task_name",
+        "columns": ["task_name", "task_description"],
+    },
+    "Issue": {
+        "table": "issue",
+        "pk": "issue_id",
+        "parent": "task_id",
+        "title": "issue_title",
+        "columns": ["issue_title", "issue_description"],
+    },
+    "TaskStatus": {
+        "table": "task_status",
+        "pk": "task_status_id",
+        "parent": "task_id",
+        "title": None,
+        "columns": ["remarks"],
+    },
+    "IssueActivity": {
+        "table": "issue_activity",
+        "pk": "issue_activity_id",
+        "parent": "issue_id",
+        "title": None,
+        "columns": ["comment"],
+    },
+}
+
+
+def search_terms(q: str):
+    return re.findall(r"\w+", q or "")
+
+
+def make_snippet(body, terms):
+    if not body:
+        return ""
+    match = re.search("|".join(re.escape(t) for t in terms), body, re.IGNORECASE)
+    if not match:
+        return body[: SNIPPET_RADIUS * 2]
+    start = max(match.start() - SNIPPET_RADIUS, 0)
+    end = min(match.end() + SNIPPET_RADIUS, len(body))
+    snippet = (
+        body[start : match.start()]
+        + "<mark>"
+        + match.group(0)
+        + "</mark>"
+        + body[match.end() : end]
+    )
+    return ("…" if start else "") + snippet + ("…" if end < len(body) else "")
+
+
+def _sqlite_match_expression(terms):
+    quoted = ['"%s"' % term for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _search_sqlite(db, entity_type, spec, terms, limit):
+    fts = spec["table"] + "_fts"
+    title = "t." + spec["title"] if spec["title"] else "NULL"
+    rows = db.execute(
+        text(
+            f"SELECT t.{spec['pk']}, t.{spec['parent']}, {title}, "
+            f"snippet({fts}, -1, '<mark>', '</mark>', '…', 16), "
+            f"-bm25({fts}) AS score "
+            f"FROM {fts} JOIN {spec['table']} t ON t.rowid = {fts}.rowid "
+            f"WHERE {fts} MATCH :q AND t.entity_status = 'Active' "
+            f"ORDER BY bm25({fts}) LIMIT :limit"
+        ),
+        {"q": _sqlite_match_expression(terms), "limit": limit},
+    )
+    return [
+        (entity_type, pk, parent, title, snippet, score)
+        for pk, parent, title, snippet, score in rows
+    ]
+
+
+def _search_mysql(db, entity_type, spec, terms, limit):
+    columns = ", ".join(spec["columns"])
+    title = spec["title"] or "NULL"
+    body = "CONCAT_WS(' ', %s)" % columns
+    rows = db.execute(
+        text(
+            f"SELECT {spec['pk']}, {spec['parent']}, {title}, {body}, "
+            f"MATCH({columns}) AGAINST (:q IN NATURAL LANGUAGE MODE) AS score "
+            f"FROM {spec['table']} "
+            f"WHERE MATCH({columns}) AGAINST (:q IN NATURAL LANGUAGE MODE) "
+            f"AND entity_status = 'Active' "
+            f"ORDER BY score DESC LIMIT :limit"
+        ),
+        {"q": " ".join(terms), "limit": limit},
+    )
+    return [
+        (entity_type, pk, parent, title, make_snippet(body, terms), float(score))
+        for pk, parent, title, body, score in rows
+    ]
+
+
+def _search_like(db, entity_type, spec, terms, limit):
+    columns = spec["columns"]
+    title = spec["title"] or "NULL"
+    params = {"limit": limit}
+    clauses = []
+    for i, term in enumerate(terms):
+        params[f"term{i}"] = f"%{term}%"
+        clauses.append(
+            "(" + " OR ".join(f"{column} LIKE :term{i}" for column in columns) + ")"
+        )
+    rows = db.execute(
+        text(
+            f"SELECT {spec['pk']}, {spec['parent']}, {title}, {', '.join(columns)} "
+            f"FROM {spec['table']} "
+            f"WHERE {' AND '.join(clauses)} AND entity_status = 'Active' "
+            f"LIMIT :limit"
+        ),
+        params,
+    )
+    hits = []
+    for pk, parent, title, *bodies in rows:
+        body = " ".join(value for value in bodies if value)
+        hits.append((entity_type, pk, parent, title, make_snippet(body, terms), 1.0))
+    return hits
+
+
+def _normalise(hits):
+    """Scale one source's scores to (0, 1] by its best hit.
+
+    bm25 and MATCH ... AGAINST scores depend on the table's size and term
+    statistics, so raw scores from different tables are not comparable.
+    """
+    best = max((hit[5] for hit in hits), default=0)
+    if best <= 0:
+        return [hit[:5] + (1.0,) for hit in hits]
+    return [hit[:5] + (hit[5] / best,) for hit in hits]
+
+
+def search(db, q, entity_types=None, limit=20):
+    terms = search_terms(q)
+    if not terms:
+        return []
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        backend = _search_mysql
+    elif dialect == "sqlite":
+        backend = _search_sqlite
+    else:
+        backend = _search_like
+    hits = []
+    for entity_type, spec in SEARCH_ENTITIES.items():
+        if entity_types and entity_type not in entity_types:
+            continue
+        hits.extend(
+            (-hit[5], rank, hit)
+            for rank, hit in enumerate(
+                _normalise(backend(db, entity_type, spec, terms, limit))
+            )
+        )
+    # Equal normalised scores interleave the sources by rank.
+    hits = [hit for _, _, hit in sorted(hits, key=lambda item: item[:2])]
+    return [
+        {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "parent_id": parent_id,
+            "title": title,
+            "snippet": snippet,
+            "score": round(score, 6),
+        }
+        for entity_type, entity_id, parent_id, title, snippet, score in hits[:limit]
+    ]
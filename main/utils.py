@@ -1,3 +1,5 @@
+import base64
+import json
 from datetime import datetime, timezone
 
 from fastapi import HTTPException, status
@@ -9,6 +11,40 @@ def now_utc():
     return datetime.now(timezone.utc)
 
 
+def as_naive_utc(value):
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def parse_hours(value):
+    if value is None:
+        return 0.0
+    try:
+        return float(str(value).strip().rstrip("%"))
+    except ValueError:
+        return 0.0
+
+
+def encode_cursor(*values):
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        )
+    return values
+
+
 def handle_db_error(db: Session, e: Exception, operation: str):
     try:
         db.rollback()
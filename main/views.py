@@ -0,0 +1,405 @@
+from sqlalchemy import and_, exists, inspect, literal_column, or_, select
+
+from main import models
+
+
+employee = models.Employee.__table__
+business_unit = models.BusinessUnit.__table__
+employee_business_unit = models.EmployeeBusinessUnit.__table__
+project = models.Project.__table__
+deliverable = models.Deliverable.__table__
+task = models.Task.__table__
+task_type = models.TaskType.__table__
+task_status = models.TaskStatus.__table__
+issue = models.Issue.__table__
+issue_activity = models.IssueActivity.__table__
+
+
+def _person(alias, id_column, label):
+    person = employee.alias(alias)
+    return (
+        person,
+        person.c.employee_id == id_column,
+        person.c.employee_full_name.label(label),
+    )
+
+
+def _audit(base):
+    creator, on_creator, created_by_name = _person(
+        "creator", base.c.created_by, "created_by_name"
+    )
+    updater, on_updater, updated_by_name = _person(
+        "updater", base.c.updated_by, "updated_by_name"
+    )
+    columns = [
+        base.c.created_at,
+        base.c.created_by,
+        created_by_name,
+        base.c.updated_at,
+        base.c.updated_by,
+        updated_by_name,
+        base.c.entity_status,
+    ]
+    return columns, [(creator, on_creator), (updater, on_updater)]
+
+
+def _business_unit_columns(bu):
+    head, on_head, head_name = _person(
+        "bu_head", bu.c.business_unit_head_id, "business_unit_head_name"
+    )
+    columns = [
+        bu.c.business_unit_id,
+        bu.c.business_unit_name,
+        bu.c.business_unit_head_id,
+        head_name,
+    ]
+    return columns, [(head, on_head)]
+
+
+def _project_columns(pr):
+    manager, on_manager, manager_name = _person(
+        "delivery_manager", pr.c.delivery_manager_id, "delivery_manager_name"
+    )
+    columns = [
+        pr.c.project_id,
+        pr.c.project_name,
+        pr.c.delivery_manager_id,
+        manager_name,
+    ]
+    return columns, [(manager, on_manager)]
+
+
+def _hierarchy():
+    """BU / project / delivery manager / deliverable columns shared by views.
+
+    The joins start from `deliverable`, which the caller must already have
+    joined in.
+    """
+    bu_columns, bu_joins = _business_unit_columns(business_unit)
+    pr_columns, pr_joins = _project_columns(project)
+    columns = (
+        bu_columns
+        + pr_columns
+        + [deliverable.c.deliverable_id, deliverable.c.deliverable_name]
+    )
+    joins = [
+        (project, project.c.project_id == deliverable.c.project_id),
+        (business_unit, business_unit.c.business_unit_id == project.c.business_unit_id),
+    ]
+    return columns, joins + bu_joins + pr_joins
+
+
+def _build(base, columns, joins):
+    from_clause = base
+    for target, onclause in joins:
+        from_clause = from_clause.outerjoin(target, onclause)
+    return select(*columns).select_from(from_clause)
+
+
+def employee_view():
+    columns, joins = _audit(employee)
+    return _build(
+        employee,
+        [
+            employee.c.employee_id,
+            employee.c.employee_full_name,
+            employee.c.employee_email_address,
+        ]
+        + columns,
+        joins,
+    )
+
+
+def business_unit_view():
+    bu_columns, bu_joins = _business_unit_columns(business_unit)
+    columns, joins = _audit(business_unit)
+    return _build(
+        business_unit,
+        bu_columns[:2]
+        + [business_unit.c.business_unit_description]
+        + bu_columns[2:]
+        + columns,
+        bu_joins + joins,
+    )
+
+
+def employee_business_unit_view():
+    bu_columns, bu_joins = _business_unit_columns(business_unit)
+    columns, joins = _audit(employee_business_unit)
+    member = employee.alias("member")
+    return _build(
+        employee_business_unit,
+        bu_columns
+        + [
+            employee_business_unit.c.employee_id,
+            member.c.employee_full_name,
+            member.c.employee_email_address,
+        ]
+        + columns,
+        [
+            (
+                business_unit,
+                business_unit.c.business_unit_id
+                == employee_business_unit.c.business_unit_id,
+            ),
+            (member, member.c.employee_id == employee_business_unit.c.employee_id),
+        ]
+        + bu_joins
+        + joins,
+    )
+
+
+def project_view():
+    bu_columns, bu_joins = _business_unit_columns(business_unit)
+    pr_columns, pr_joins = _project_columns(project)
+    columns, joins = _audit(project)
+    return _build(
+        project,
+        bu_columns
+        + pr_columns[:2]
+        + [project.c.project_description]
+        + pr_columns[2:]
+        + [
+            project.c.baseline_start_date,
+            project.c.baseline_end_date,
+            project.c.planned_start_date,
+            project.c.planned_end_date,
+        ]
+        + columns,
+        [
+            (
+                business_unit,
+                business_unit.c.business_unit_id == project.c.business_unit_id,
+            )
+        ]
+        + bu_joins
+        + pr_joins
+        + joins,
+    )
+
+
+def deliverable_view():
+    hierarchy, hierarchy_joins = _hierarchy()
+    columns, joins = _audit(deliverable)
+    return _build(
+        deliverable,
+        hierarchy
+        + [
+            deliverable.c.deliverable_description,
+            deliverable.c.priority,
+            deliverable.c.baseline_start_date,
+            deliverable.c.baseline_end_date,
+            deliverable.c.planned_start_date,
+            deliverable.c.planned_end_date,
+        ]
+        + columns,
+        hierarchy_joins + joins,
+    )
+
+
+def task_view():
+    hierarchy, hierarchy_joins = _hierarchy()
+    columns, joins = _audit(task)
+    assignee, on_assignee, assignee_name = _person(
+        "assignee", task.c.assignee_id, "assignee_name"
+    )
+    reviewer, on_reviewer, reviewer_name = _person(
+        "reviewer", task.c.reviewer_id, "reviewer_name"
+    )
+    return _build(
+        task,
+        hierarchy
+        + [
+            task.c.task_id,
+            task.c.task_name,
+            task.c.task_description,
+            task.c.task_type_id,
+            task_type.c.task_type_Name.label("task_type_name"),
+            task.c.priority,
+            task.c.baseline_start_date,
+            task.c.baseline_end_date,
+            task.c.planned_start_date,
+            task.c.planned_end_date,
+            task.c.effort_estimated_in_hours,
+            task.c.assignee_id,
+            assignee_name,
+            task.c.reviewer_id,
+            reviewer_name,
+        ]
+        + columns,
+        [(deliverable, deliverable.c.deliverable_id == task.c.deliverable_id)]
+        + hierarchy_joins
+        + [
+            (task_type, task_type.c.task_type_id == task.c.task_type_id),
+            (assignee, on_assignee),
+            (reviewer, on_reviewer),
+        ]
+        + joins,
+    )
+
+
+def task_type_view():
+    columns, joins = _audit(task_type)
+    return _build(
+        task_type,
+        [
+            task_type.c.task_type_id,
+            task_type.c.task_type_Name,
+            task_type.c.task_type_description,
+        ]
+        + columns,
+        joins,
+    )
+
+
+def task_status_latest_view():
+    """Latest active status per task as an anti-join on (task_id, action_date).
+
+    A row is the latest when no other active row of the same task has a later
+    (action_date, task_status_id). The NOT EXISTS probe is a range seek on
+    ix_task_status_task_id_action_date, and unlike a ROW_NUMBER() derived
+    table it keeps the view mergeable, so `WHERE task_status_id = :id` or
+    `WHERE task_id IN (...)` on the view stay index lookups.
+    """
+    hierarchy, hierarchy_joins = _hierarchy()
+    columns, joins = _audit(task_status)
+    newer = task_status.alias("newer")
+    is_latest = ~exists().where(
+        newer.c.task_id == task_status.c.task_id,
+        newer.c.entity_status == literal_column("'Active'"),
+        or_(
+            newer.c.action_date > task_status.c.action_date,
+            and_(
+                newer.c.action_date == task_status.c.action_date,
+                newer.c.task_status_id > task_status.c.task_status_id,
+            ),
+        ),
+    )
+    return _build(
+        task_status,
+        hierarchy
+        + [
+            task.c.task_id,
+            task.c.task_name,
+            task_status.c.task_status_id,
+            task_status.c.action_date,
+            task_status.c.hours_spent,
+            task_status.c.progress,
+            task_status.c.remarks,
+        ]
+        + columns,
+        [
+            (task, task.c.task_id == task_status.c.task_id),
+            (deliverable, deliverable.c.deliverable_id == task.c.deliverable_id),
+        ]
+        + hierarchy_joins
+        + joins,
+    ).where(
+        task_status.c.entity_status == literal_column("'Active'"),
+        task_status.c.action_date.isnot(None),
+        is_latest,
+    )
+
+
+def issue_view():
+    hierarchy, hierarchy_joins = _hierarchy()
+    columns, joins = _audit(issue)
+    owner, on_owner, owner_name = _person(
+        "action_owner", issue.c.action_owner_id, "action_owner_name"
+    )
+    return _build(
+        issue,
+        hierarchy
+        + [
+            task.c.task_id,
+            task.c.task_name,
+            issue.c.issue_id,
+            issue.c.issue_title,
+            issue.c.issue_description,
+            issue.c.issue_priority,
+            issue.c.issue_status,
+            issue.c.action_owner_id,
+            owner_name,
+        ]
+        + columns,
+        [
+            (task, task.c.task_id == issue.c.task_id),
+            (deliverable, deliverable.c.deliverable_id == task.c.deliverable_id),
+        ]
+        + hierarchy_joins
+        + [(owner, on_owner)]
+        + joins,
+    )
+
+
+def issue_activity_view():
+    hierarchy, hierarchy_joins = _hierarchy()
+    columns, joins = _audit(issue_activity)
+    commenter, on_commenter, commenter_name = _person(
+        "commenter", issue_activity.c.comment_by, "comment_by_name"
+    )
+    return _build(
+        issue_activity,
+        hierarchy
+        + [
+            task.c.task_id,
+            task.c.task_name,
+            issue_activity.c.issue_id,
+            issue_activity.c.issue_activity_id,
+            issue_activity.c.comment_by,
+            commenter_name,
+            issue_activity.c.comment_at,
+            issue_activity.c.comment,
+        ]
+        + columns,
+        [
+            (issue, issue.c.issue_id == issue_activity.c.issue_id),
+            (task, task.c.task_id == issue.c.task_id),
+            (deliverable, deliverable.c.deliverable_id == task.c.deliverable_id),
+        ]
+        + hierarchy_joins
+        + [(commenter, on_commenter)]
+        + joins,
+    )
+
+
+VIEWS = {
+    models.EmployeeView.__tablename__: employee_view,
+    models.BusinessUnitView.__tablename__: business_unit_view,
+    models.EmployeeBusinessUnitView.__tablename__: employee_business_unit_view,
+    models.ProjectView.__tablename__: project_view,
+    models.DeliverableView.__tablename__: deliverable_view,
+    models.TaskView.__tablename__: task_view,
+    models.TaskTypeView.__tablename__: task_type_view,
+    models.TaskStatusView.__tablename__: task_status_latest_view,
+    models.IssueView.__tablename__: issue_view,
+    models.IssueActivityView.__tablename__: issue_activity_view,
+}
+
+
+def view_sql(name, dialect):
+    return str(
+        VIEWS[name]().compile(dialect=dialect, compile_kwargs={"literal_binds": True})
+    )
+
+
+def create_views(connection, replace=False):
+    """Create the views; returns the names that did not exist before."""
+    existing = set(inspect(connection).get_view_names())
+    created = []
+    for name in VIEWS:
+        if name in existing:
+            if not replace:
+                continue
+            connection.exec_driver_sql(f"DROP VIEW {name}")
+        else:
+            created.append(name)
+        connection.exec_driver_sql(
+            f"CREATE VIEW {name} AS {view_sql(name, connection.dialect)}"
+        )
+    return created
+
+
+def drop_views(connection, names=None):
+    for name in VIEWS if names is None else names:
+        connection.exec_driver_sql(f"DROP VIEW IF EXISTS {name}")
@@ -0,0 +1,106 @@
+import logging
+import os
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import text
+
+from main import schemas
+
+from .refcache import cache
+
+
+logger = logging.getLogger("delivery_tracker.startup")
+
+WARMUP_CONNECTIONS = int(os.getenv("WARMUP_CONNECTIONS", "5"))
+
+VIEW_SCHEMAS = [
+    schema
+    for name, schema in vars(schemas).items()
+    if name.endswith("ViewBase") and isinstance(schema, type)
+]
+
+
+class Warmup:
+    """Startup work done before the app reports ready.
+
+    run() executes in a worker thread from the lifespan hook; until it
+    finishes, /ready answers 503 so the load balancer keeps traffic on
+    warm instances.
+    """
+
+    def __init__(self, engine, session_factory, hash_password, import_seconds=None):
+        self.engine = engine
+        self.session_factory = session_factory
+        self.hash_password = hash_password
+        self.import_seconds = import_seconds
+        self.ready = False
+        self.error = None
+        self.timings = {}
+
+    def _step(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.timings[name] = round(time.perf_counter() - start, 4)
+        return result
+
+    def open_connections(self, count):
+        size = getattr(self.engine.pool, "size", None)
+        if size is not None:
+            count = min(count, size())
+        connections = []
+        try:
+            for _ in range(count):
+                connection = self.engine.connect()
+                connections.append(connection)
+                connection.execute(text("SELECT 1"))
+        finally:
+            for connection in connections:
+                connection.close()
+        return len(connections)
+
+    def build_validators(self):
+        for schema in VIEW_SCHEMAS:
+            adapter = TypeAdapter(List[schema])
+            adapter.dump_json(adapter.validate_python([]))
+            schema.model_json_schema()
+
+    def prime_caches(self):
+        db = self.session_factory()
+        try:
+            cache.prime(db)
+        finally:
+            db.close()
+
+    def run(self, app):
+        start = time.perf_counter()
+        try:
+            self._step("connections", self.open_connections, WARMUP_CONNECTIONS)
+            self._step("validators", self.build_validators)
+            self._step("openapi", app.openapi)
+            self._step("password_hasher", self.hash_password, "warmup")
+            self._step("reference_cache", self.prime_caches)
+        except Exception as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
+            logger.exception("startup warmup failed")
+            return
+        self.timings["total"] = round(time.perf_counter() - start, 4)
+        self.ready = True
+        logger.info(
+            "ready: imports %.3f s, warmup %s", self.import_seconds or 0, self.timings
+        )
+
+    def status(self):
+        if self.ready:
+            state = "ready"
+        elif self.error:
+            state = "failed"
+        else:
+            state = "warming_up"
+        return {
+            "status": state,
+            "error": self.error,
+            "import_seconds": self.import_seconds,
+            "warmup_seconds": self.timings,
+        }
@@ -0,0 +1,114 @@
+from datetime import date, datetime, timedelta
+
+from .utils import parse_hours
+
+
+def as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def count_workdays(start: date, end: date):
+    if end < start:
+        return 0
+    weeks, extra = divmod((end - start).days + 1, 7)
+    count = weeks * 5
+    weekday = start.weekday()
+    for offset in range(extra):
+        if (weekday + offset) % 7 < 5:
+            count += 1
+    return count
+
+
+def bucket_ranges(window_start: date, window_end: date, granularity: str):
+    if granularity == "day":
+        return [
+            (window_start + timedelta(days=i), window_start + timedelta(days=i))
+            for i in range((window_end - window_start).days + 1)
+        ]
+    ranges = []
+    cursor = window_start
+    while cursor <= window_end:
+        week_end = cursor + timedelta(days=6 - cursor.weekday())
+        ranges.append((cursor, min(week_end, window_end)))
+        cursor = week_end + timedelta(days=1)
+    return ranges
+
+
+def allocate_workload(
+    tasks, window_start: date, window_end: date, granularity: str, capacity_per_day
+):
+    """Spread task effort over working days with a per-employee difference array.
+
+    `tasks` yields (assignee_id, planned_start, planned_end, effort_hours).
+    Each task costs O(1) regardless of its length; the prefix-sum pass costs
+    O(days) per employee, so the total is O(tasks + employees * days).
+    Tasks whose whole span falls on a weekend are spread over calendar days.
+    """
+    n_days = (window_end - window_start).days + 1
+    weekday_diff = {}
+    anyday_diff = {}
+
+    for assignee_id, planned_start, planned_end, effort in tasks:
+        start = as_date(planned_start)
+        end = as_date(planned_end)
+        hours = parse_hours(effort)
+        if not assignee_id or start is None or end is None or hours <= 0:
+            continue
+        if end < start:
+            start, end = end, start
+        if end < window_start or start > window_end:
+            continue
+
+        workdays = count_workdays(start, end)
+        if workdays:
+            diffs = weekday_diff
+            rate = hours / workdays
+        else:
+            diffs = anyday_diff
+            rate = hours / ((end - start).days + 1)
+
+        diff = diffs.get(assignee_id)
+        if diff is None:
+            diff = diffs[assignee_id] = [0.0] * (n_days + 1)
+        diff[(max(start, window_start) - window_start).days] += rate
+        diff[(min(end, window_end) - window_start).days + 1] -= rate
+
+    first_weekday = window_start.weekday()
+    ranges = bucket_ranges(window_start, window_end, granularity)
+    result = {}
+    for assignee_id in set(weekday_diff) | set(anyday_diff):
+        weekday = weekday_diff.get(assignee_id)
+        anyday = anyday_diff.get(assignee_id)
+        daily = [0.0] * n_days
+        weekday_rate = 0.0
+        anyday_rate = 0.0
+        for i in range(n_days):
+            if weekday is not None:
+                weekday_rate += weekday[i]
+                if (first_weekday + i) % 7 < 5:
+                    daily[i] += weekday_rate
+            if anyday is not None:
+                anyday_rate += anyday[i]
+                daily[i] += anyday_rate
+
+        buckets = []
+        for bucket_start, bucket_end in ranges:
+            first = (bucket_start - window_start).days
+            last = (bucket_end - window_start).days
+            allocated = round(sum(daily[first : last + 1]), 2)
+            capacity = round(
+                capacity_per_day * count_workdays(bucket_start, bucket_end), 2
+            )
+            buckets.append(
+                {
+                    "bucket_start": bucket_start,
+                    "bucket_end": bucket_end,
+                    "allocated_hours": allocated,
+                    "capacity_hours": capacity,
+                    "over_capacity": allocated > capacity,
+                }
+            )
+        result[assignee_id] = buckets
+    return result
@@ -0,0 +1,154 @@
+"""Baseline tables
+
+Creates the base tables when they are missing so a fresh (e.g. local SQLite)
+database can be brought to head. Existing deployments already have these
+tables and are left untouched.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _id(name, primary_key=False):
+    return sa.Column(name, sa.String(10), primary_key=primary_key)
+
+
+def _audit_columns():
+    return [
+        sa.Column("created_at", sa.DateTime),
+        _id("created_by"),
+        sa.Column("updated_at", sa.DateTime),
+        _id("updated_by"),
+        sa.Column("entity_status", sa.String(10)),
+    ]
+
+
+TABLES = {
+    "employee": lambda: [
+        _id("employee_id", primary_key=True),
+        sa.Column("employee_full_name", sa.String(100)),
+        sa.Column("employee_email_address", sa.String(100)),
+        sa.Column("password", sa.String(100)),
+        *_audit_columns(),
+    ],
+    "business_unit": lambda: [
+        _id("business_unit_id", primary_key=True),
+        sa.Column("business_unit_name", sa.String(100)),
+        _id("business_unit_head_id"),
+        sa.Column("business_unit_description", sa.String(4000)),
+        *_audit_columns(),
+    ],
+    "employee_business_unit": lambda: [
+        _id("employee_id", primary_key=True),
+        _id("business_unit_id"),
+        *_audit_columns(),
+    ],
+    "project": lambda: [
+        _id("project_id", primary_key=True),
+        _id("business_unit_id"),
+        sa.Column("project_name", sa.String(100)),
+        sa.Column("project_description", sa.String(4000)),
+        _id("delivery_manager_id"),
+        sa.Column("baseline_start_date", sa.DateTime),
+        sa.Column("baseline_end_date", sa.DateTime),
+        sa.Column("planned_start_date", sa.DateTime),
+        sa.Column("planned_end_date", sa.DateTime),
+        *_audit_columns(),
+    ],
+    "deliverable": lambda: [
+        _id("deliverable_id", primary_key=True),
+        _id("project_id"),
+        sa.Column("deliverable_name", sa.String(100)),
+        sa.Column("deliverable_description", sa.String(4000)),
+        sa.Column("priority", sa.String(100)),
+        sa.Column("baseline_start_date", sa.DateTime),
+        sa.Column("baseline_end_date", sa.DateTime),
+        sa.Column("planned_start_date", sa.DateTime),
+        sa.Column("planned_end_date", sa.DateTime),
+        *_audit_columns(),
+    ],
+    "task": lambda: [
+        _id("task_id", primary_key=True),
+        _id("deliverable_id"),
+        sa.Column("task_name", sa.String(100)),
+        sa.Column("task_description", sa.String(4000)),
+        _id("task_type_id"),
+        sa.Column("priority", sa.String(100)),
+        sa.Column("baseline_start_date", sa.DateTime),
+        sa.Column("baseline_end_date", sa.DateTime),
+        sa.Column("planned_start_date", sa.DateTime),
+        sa.Column("planned_end_date", sa.DateTime),
+        sa.Column("effort_estimated_in_hours", sa.String(10)),
+        _id("assignee_id"),
+        _id("reviewer_id"),
+        *_audit_columns(),
+    ],
+    "task_type": lambda: [
+        _id("task_type_id", primary_key=True),
+        sa.Column("task_type_Name", sa.String(100)),
+        sa.Column("task_type_description", sa.String(4000)),
+        *_audit_columns(),
+    ],
+    "task_status": lambda: [
+        _id("task_status_id", primary_key=True),
+        _id("task_id"),
+        sa.Column("action_date", sa.Date),
+        sa.Column("hours_spent", sa.String(10)),
+        sa.Column("progress", sa.String(10)),
+        sa.Column("remarks", sa.String(4000)),
+        *_audit_columns(),
+    ],
+    "issue": lambda: [
+        _id("issue_id", primary_key=True),
+        _id("task_id"),
+        sa.Column("issue_title", sa.String(100)),
+        sa.Column("issue_description", sa.String(4000)),
+        _id("action_owner_id"),
+        sa.Column("issue_priority", sa.String(100)),
+        sa.Column("issue_status", sa.String(100)),
+        *_audit_columns(),
+    ],
+    "issue_activity": lambda: [
+        _id("issue_activity_id", primary_key=True),
+        _id("issue_id"),
+        _id("comment_by"),
+        sa.Column("comment_at", sa.DateTime),
+        sa.Column("comment", sa.String(4000)),
+        *_audit_columns(),
+    ],
+    "audit_log": lambda: [
+        sa.Column("audit_id", sa.String(36), primary_key=True),
+        sa.Column("entity_type", sa.String(100)),
+        _id("entity_id"),
+        sa.Column("action", sa.String(100)),
+        sa.Column("field_changed", sa.String(100)),
+        sa.Column("old_value", sa.String(1000)),
+        sa.Column("new_value", sa.String(1000)),
+        _id("changed_by"),
+        sa.Column("changed_at", sa.DateTime),
+    ],
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for name, columns in TABLES.items():
+        if not inspector.has_table(name):
+            op.create_table(name, *columns())
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,29 @@
+"""Index task_status by (task_id, action_date) for per-task history
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_task_status_task_id_action_date",
+        "task_status",
+        ["task_id", "action_date"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_task_status_task_id_action_date", table_name="task_status")
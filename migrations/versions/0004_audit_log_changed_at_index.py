@@ -0,0 +1,27 @@
+"""Index audit_log by (changed_at, audit_id) for the change feed
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_audit_log_changed_at_audit_id", "audit_log", ["changed_at", "audit_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_log_changed_at_audit_id", table_name="audit_log")
@@ -0,0 +1,41 @@
+"""Index updated_at on base tables for updated_since delta queries
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = [
+    "employee",
+    "business_unit",
+    "employee_business_unit",
+    "project",
+    "deliverable",
+    "task",
+    "task_type",
+    "task_status",
+    "issue",
+    "issue_activity",
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.create_index(f"ix_{table}_updated_at", table, ["updated_at"])
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_updated_at", table_name=table)
@@ -0,0 +1,56 @@
+"""Create the vw_* views from main.views
+
+Views that already exist are kept unless the upgrade is run with
+`alembic -x replace_views=true upgrade head`, so deployed definitions are
+only replaced deliberately.
+
+The views this revision creates are listed in CREATED_VIEWS_TABLE, and
+downgrade drops only those. Views that existed before the upgrade,
+including ones it replaced, stay in place. A database upgraded before
+the list was kept has no record, so its downgrade drops no views.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+from main.views import create_views, drop_views
+
+
+revision: str = "0006"
+down_revision: Union[str, Sequence[str], None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CREATED_VIEWS_TABLE = "alembic_0006_created_views"
+
+
+def upgrade() -> None:
+    replace = context.get_x_argument(as_dictionary=True).get("replace_views")
+    created = create_views(op.get_bind(), replace=replace == "true")
+    table = op.create_table(
+        CREATED_VIEWS_TABLE, sa.Column("view_name", sa.String(64), primary_key=True)
+    )
+    if created:
+        op.bulk_insert(table, [{"view_name": name} for name in created])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table(CREATED_VIEWS_TABLE):
+        return
+    created = [
+        name
+        for (name,) in bind.execute(
+            sa.text(f"SELECT view_name FROM {CREATED_VIEWS_TABLE}")
+        )
+    ]
+    drop_views(bind, created)
+    op.drop_table(CREATED_VIEWS_TABLE)
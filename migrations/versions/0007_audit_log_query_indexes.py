@@ -0,0 +1,44 @@
+"""Index audit_log for the entity, entity type and author history queries
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "0007"
+down_revision: Union[str, Sequence[str], None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_audit_log_entity_id_changed_at": ["entity_id", "changed_at", "audit_id"],
+    "ix_audit_log_entity_type_changed_at": ["entity_type", "changed_at", "audit_id"],
+    "ix_audit_log_changed_by_changed_at": ["changed_by", "changed_at", "audit_id"],
+}
+
+
+def upgrade() -> None:
+    # audit ids are uuid4 strings; older schemas declared the key as VARCHAR(10).
+    if op.get_bind().dialect.name != "sqlite":
+        op.alter_column(
+            "audit_log",
+            "audit_id",
+            existing_type=sa.String(10),
+            type_=sa.String(36),
+            existing_nullable=False,
+        )
+    for name, columns in INDEXES.items():
+        op.create_index(name, "audit_log", columns)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="audit_log")
@@ -0,0 +1,38 @@
+"""Index the parent keys walked by the project tree
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0008"
+down_revision: Union[str, Sequence[str], None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_deliverable_project_id": ("deliverable", ["project_id"]),
+    "ix_task_deliverable_id": ("task", ["deliverable_id"]),
+    "ix_issue_task_id": ("issue", ["task_id"]),
+    "ix_issue_activity_issue_id_comment_at": (
+        "issue_activity",
+        ["issue_id", "comment_at"],
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
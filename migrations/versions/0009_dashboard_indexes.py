@@ -0,0 +1,38 @@
+"""Index the per-employee columns behind the dashboard
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0009"
+down_revision: Union[str, Sequence[str], None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_task_assignee_id": ("task", ["assignee_id"]),
+    "ix_task_reviewer_id": ("task", ["reviewer_id"]),
+    "ix_issue_action_owner_id": ("issue", ["action_owner_id"]),
+    "ix_task_status_created_by_action_date": (
+        "task_status",
+        ["created_by", "action_date"],
+    ),
+}
+
+
+def upgrade() -> None:
+    for name, (table, columns) in INDEXES.items():
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, (table, _) in INDEXES.items():
+        op.drop_index(name, table_name=table)
@@ -1,87 +1,139 @@
-from typing import List
+from datetime import datetime
+from itertools import islice
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import DBAPIError, OperationalError
 from sqlalchemy.orm import Session
 
-from main import models, schemas
+from main import audit_archive, models, schemas
 from main.database import get_db
+from main.entities import audit_names, canonical_entity_type
+from main.querylog import query_budget
+from main.utils import as_naive_utc, decode_cursor, encode_cursor
 
 
 router = APIRouter()
 
 
-def handle_db_error(db: Session, e: Exception, operation: str):
-    try:
-        db.rollback()
-    except Exception:
-        pass
-
-    if isinstance(e, IntegrityError):
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=f"{operation} failed due to a data constraint violation.",
-        )
-    if isinstance(e, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"{operation} failed: Database operational error. Check the SQL syntax or connection.",
-        )
-    elif isinstance(e, DBAPIError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"{operation} failed: A database connection or query execution error occurred.",
-        )
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"An unexpected error occurred during the {operation} operation.",
-        )
-
-
-@router.post(
-    "/",
-    response_model=schemas.AuditLogRead,
-    summary="Create a new Audit Log record",
-    status_code=status.HTTP_201_CREATED,
-)
-def create_audit_log(payload: schemas.AuditLogCreate, db: Session = Depends(get_db)):
-    try:
-        obj = models.AuditLog(**payload.model_dump(exclude_unset=True))
-
-        db.add(obj)
-        db.commit()
-        db.refresh(obj)
-        return obj
-
-    except (IntegrityError, DBAPIError, OperationalError) as e:
-        handle_db_error(db, e, "Audit Log creation")
-    except Exception as e:
-        handle_db_error(db, e, "Audit Log creation (unexpected)")
-
-
+# Audit rows are only ever written by crud.audit_log; this router reads them.
 @router.get(
-    "/", response_model=List[schemas.AuditLogRead], summary="Get all Audit Log records"
+    "/",
+    response_model=schemas.AuditLogPage,
+    summary="Query Audit Log records",
 )
+@query_budget(1)
 def list_audit_logs(
-    limit: int = Query(100, ge=1), offset: int = 0, db: Session = Depends(get_db)
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    changed_by: Optional[str] = None,
+    changed_from: Optional[datetime] = None,
+    changed_to: Optional[datetime] = None,
+    descending: bool = False,
+    include_archived: bool = False,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
 ):
-    try:
-        return db.query(models.AuditLog).limit(limit).offset(offset).all()
+    changed_from = as_naive_utc(changed_from)
+    changed_to = as_naive_utc(changed_to)
+    query = db.query(models.AuditLog)
+    if entity_type:
+        names = audit_names(canonical_entity_type(entity_type))
+        query = query.filter(models.AuditLog.entity_type.in_(names))
+    if entity_id:
+        query = query.filter(models.AuditLog.entity_id == entity_id)
+    if changed_by:
+        query = query.filter(models.AuditLog.changed_by == changed_by)
+    if changed_from:
+        query = query.filter(models.AuditLog.changed_at >= changed_from)
+    if changed_to:
+        query = query.filter(models.AuditLog.changed_at < changed_to)
+    after = None
+    if cursor:
+        after_at, after_id, descending = decode_cursor(cursor, 3)
+        try:
+            after = (datetime.fromisoformat(after_at), after_id)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor.",
+            )
+        if descending:
+            query = query.filter(
+                or_(
+                    models.AuditLog.changed_at < after[0],
+                    and_(
+                        models.AuditLog.changed_at == after[0],
+                        models.AuditLog.audit_id < after[1],
+                    ),
+                )
+            )
+        else:
+            query = query.filter(
+                or_(
+                    models.AuditLog.changed_at > after[0],
+                    and_(
+                        models.AuditLog.changed_at == after[0],
+                        models.AuditLog.audit_id > after[1],
+                    ),
+                )
+            )
+    if descending:
+        order = (models.AuditLog.changed_at.desc(), models.AuditLog.audit_id.desc())
+    else:
+        order = (models.AuditLog.changed_at, models.AuditLog.audit_id)
+
+    def archived(count):
+        # Archived rows all sort before the hot table, so they come first in
+        # ascending pages and after it in descending ones.
+        if not include_archived:
+            return []
+        archive_key = audit_archive.watermark(audit_archive.load_manifest())
+        if archive_key is None or (
+            after is not None and not descending and after >= archive_key
+        ):
+            return []
+        rows = audit_archive.read_archived(
+            entity_type=entity_type,
+            entity_id=entity_id,
+            changed_by=changed_by,
+            changed_from=changed_from,
+            changed_to=changed_to,
+            after=after,
+            descending=descending,
+        )
+        return list(islice(rows, count))
 
+    try:
+        rows = [] if descending else archived(limit + 1)
+        if len(rows) <= limit:
+            rows += query.order_by(*order).limit(limit + 1 - len(rows)).all()
+        if descending and len(rows) <= limit:
+            rows += archived(limit + 1 - len(rows))
     except (DBAPIError, OperationalError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database error while fetching Audit Logs.",
         )
-    except Exception:
+    except (OSError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An unexpected error occurred while listing Audit Logs.",
+            detail="Error while reading archived Audit Logs.",
+        )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = schemas.AuditLogRead.model_validate(rows[-1])
+        next_cursor = encode_cursor(
+            last.changed_at.isoformat(), last.audit_id, bool(descending)
         )
+    return {"items": rows, "next_cursor": next_cursor}
 
 
 @router.get("/{id}", response_model=schemas.AuditLogRead, summary="Get Audit Log by ID")
+@query_budget(1)
 def get_audit_log(id: str, db: Session = Depends(get_db)):
     try:
         obj = db.query(models.AuditLog).filter(models.AuditLog.audit_id == id).first()
@@ -104,42 +156,3 @@ def get_audit_log(id: str, db: Session = Depends(get_db)):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred while fetching Audit Log.",
         )
-
-
-@router.put(
-    "/{id}", response_model=schemas.AuditLogRead, summary="Update Audit Log record"
-)
-def update_audit_log(
-    id: str, payload: schemas.AuditLogCreate, db: Session = Depends(get_db)
-):
-    try:
-        obj = db.query(models.AuditLog).filter(models.AuditLog.audit_id == id).first()
-        if not obj:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Audit Log record not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while retrieving Audit Log for update.",
-        )
-
-    try:
-        for k, v in payload.model_dump(exclude_unset=True).items():
-            setattr(obj, k, v)
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
-        )
-
-    try:
-        db.commit()
-        db.refresh(obj)
-        return obj
-
-    except (IntegrityError, DBAPIError, OperationalError) as e:
-        handle_db_error(db, e, "Audit Log update")
-    except Exception as e:
-        handle_db_error(db, e, "Audit Log update (unexpected)")
@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,30 @@ def create_business_unit(
         )
 
 
-@router.get("/", response_model=List[schemas.BusinessUnitViewBase])
-def list_business_units(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.BusinessUnitViewBase],
+        schemas.ViewDelta[schemas.BusinessUnitViewBase],
+    ],
+)
+@query_budget(1)
+def list_business_units(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.BusinessUnitView,
+                models.BusinessUnitView.business_unit_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         business_unit_view = (
             db.query(models.BusinessUnitView)
             .filter(models.BusinessUnitView.entity_status == "Active")
@@ -84,7 +107,25 @@ def list_business_units(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.BusinessUnitViewBase])
+@query_budget(1)
+def get_business_units_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db,
+            models.BusinessUnitView,
+            models.BusinessUnit.business_unit_id,
+            payload.ids,
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Business Unit batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.BusinessUnitViewBase)
+@query_budget(1)
 def get_business_unit(id: str, db: Session = Depends(get_db)):
     try:
         business_unit_view = (
@@ -110,52 +151,22 @@ def update_business_unit(
     current_employee: models.Employee = Depends(get_current_employee),
 ):
     try:
-        business_unit = (
-            db.query(models.BusinessUnit)
-            .filter(models.BusinessUnit.business_unit_id == id)
-            .first()
-        )
-        if not business_unit:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Business Unit not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Business Unit for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(business_unit, key):
-                continue
-            setattr(business_unit, key, value)
-        business_unit.updated_at = now_utc()
-        business_unit.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.BusinessUnit.business_unit_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "BusinessUnit",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(business_unit)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Business Unit update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="BusinessUnit",
-            entity_id=business_unit.business_unit_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business Unit not found",
         )
-    except Exception:
-        pass
     try:
         business_unit_view = (
             db.query(models.BusinessUnitView)
@@ -170,6 +181,34 @@ def update_business_unit(
         )
 
 
+@router.patch("/{id}", response_model=schemas.BusinessUnitViewBase)
+def patch_business_unit(
+    id: str,
+    payload: schemas.BusinessUnitPatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        business_unit_view = crud.patch_entity(
+            db,
+            models.BusinessUnitView,
+            models.BusinessUnit.business_unit_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "BusinessUnit",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Business Unit update")
+    if business_unit_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Business Unit not found",
+        )
+    return business_unit_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.BusinessUnitViewBase])
 def archive_business_unit(
     id: str,
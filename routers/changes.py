@@ -0,0 +1,129 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+
+from main import crud, models, schemas
+from main.database import get_db
+from main.entities import ENTITIES, audit_names, canonical_entity_type, row_to_dict
+from main.querylog import query_budget
+from main.utils import as_naive_utc, decode_cursor, encode_cursor, now_utc
+
+
+router = APIRouter()
+
+
+def parse_timestamp(value: str):
+    # fromisoformat only takes a trailing "Z" from Python 3.11 on.
+    if value[-1:] in ("Z", "z"):
+        value = value[:-1] + "+00:00"
+    return as_naive_utc(datetime.fromisoformat(value))
+
+
+def parse_since(since: str):
+    try:
+        changed_at, audit_id = decode_cursor(since, 2)
+        if isinstance(changed_at, str) and isinstance(audit_id, str):
+            return parse_timestamp(changed_at), audit_id
+    except (HTTPException, ValueError):
+        pass
+    try:
+        return parse_timestamp(since), None
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="since must be a change feed cursor or an ISO-8601 timestamp.",
+        )
+
+
+def current_rows(db: Session, entity_type: str, entity_ids):
+    entity = ENTITIES.get(entity_type)
+    if entity is None:
+        return {}
+    pk = getattr(entity.view, entity.pk)
+    rows = {}
+    for row in db.query(entity.view).filter(pk.in_(entity_ids)).all():
+        rows.setdefault(getattr(row, entity.pk), row_to_dict(row))
+    return rows
+
+
+@router.get("/", response_model=schemas.ChangeFeedPage)
+@query_budget(1 + len(ENTITIES))
+def list_changes(
+    since: Optional[str] = None,
+    entity_types: Optional[str] = None,
+    limit: int = Query(500, ge=1, le=5000),
+    include_rows: bool = True,
+    db: Session = Depends(get_db),
+):
+    # changed_at is stamped before the writing transaction commits, so a
+    # row can appear behind a cursor that has already passed it. Rows are
+    # only served once they are older than the overlap crud.view_delta
+    # allows for the same reason.
+    settled = as_naive_utc(now_utc() - crud.WATERMARK_OVERLAP)
+    query = db.query(models.AuditLog).filter(models.AuditLog.changed_at <= settled)
+    if entity_types:
+        types = {name.strip() for name in entity_types.split(",") if name.strip()}
+        unknown = types - set(ENTITIES)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported entity types: {', '.join(sorted(unknown))}",
+            )
+        names = [name for entity_type in types for name in audit_names(entity_type)]
+        query = query.filter(models.AuditLog.entity_type.in_(names))
+    if since:
+        changed_at, audit_id = parse_since(since)
+        if audit_id is None:
+            query = query.filter(models.AuditLog.changed_at > changed_at)
+        else:
+            query = query.filter(
+                or_(
+                    models.AuditLog.changed_at > changed_at,
+                    and_(
+                        models.AuditLog.changed_at == changed_at,
+                        models.AuditLog.audit_id > audit_id,
+                    ),
+                )
+            )
+    try:
+        logs = (
+            query.order_by(models.AuditLog.changed_at, models.AuditLog.audit_id)
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(logs) > limit
+        logs = logs[:limit]
+        rows = {}
+        if include_rows:
+            changed = defaultdict(set)
+            for log in logs:
+                changed[canonical_entity_type(log.entity_type)].add(log.entity_id)
+            for entity_type, entity_ids in changed.items():
+                rows[entity_type] = current_rows(db, entity_type, list(entity_ids))
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching the change feed.",
+        )
+    entries = []
+    for log in logs:
+        entity_type = canonical_entity_type(log.entity_type)
+        entries.append(
+            {
+                "entity_type": entity_type,
+                "entity_id": log.entity_id,
+                "action": log.action,
+                "changed_at": log.changed_at,
+                "changed_by": log.changed_by,
+                "row": rows.get(entity_type, {}).get(log.entity_id),
+            }
+        )
+    next_cursor = since
+    if logs:
+        next_cursor = encode_cursor(logs[-1].changed_at.isoformat(), logs[-1].audit_id)
+    return {"entries": entries, "next_cursor": next_cursor, "has_more": has_more}
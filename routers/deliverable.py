@@ -1,11 +1,14 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
+from main.burndown import burndown_series
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +71,30 @@ def create_deliverable(
         )
 
 
-@router.get("/", response_model=List[schemas.DeliverableViewBase])
-def list_deliverables(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.DeliverableViewBase],
+        schemas.ViewDelta[schemas.DeliverableViewBase],
+    ],
+)
+@query_budget(1)
+def list_deliverables(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.DeliverableView,
+                models.DeliverableView.deliverable_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         deliverable_view = (
             db.query(models.DeliverableView)
             .filter(models.DeliverableView.entity_status == "Active")
@@ -84,7 +108,22 @@ def list_deliverables(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.DeliverableViewBase])
+@query_budget(1)
+def get_deliverables_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.DeliverableView, models.Deliverable.deliverable_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Deliverable batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.DeliverableViewBase)
+@query_budget(1)
 def get_deliverable(id: str, db: Session = Depends(get_db)):
     try:
         deliverable_view = (
@@ -102,60 +141,52 @@ def get_deliverable(id: str, db: Session = Depends(get_db)):
         )
 
 
-@router.put("/{id}", response_model=schemas.DeliverableViewBase)
-def update_deliverable(
-    id: str,
-    payload: schemas.DeliverableUpdate,
-    db: Session = Depends(get_db),
-    current_employee: models.Employee = Depends(get_current_employee),
-):
+@router.get("/{id}/burndown", response_model=schemas.BurndownSeries)
+@query_budget(5)
+def get_deliverable_burndown(id: str, db: Session = Depends(get_db)):
     try:
         deliverable = (
-            db.query(models.Deliverable)
+            db.query(models.Deliverable.deliverable_id)
             .filter(models.Deliverable.deliverable_id == id)
             .first()
         )
         if not deliverable:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Deliverable not found",
-            )
+            raise HTTPException(status_code=404, detail="Deliverable not found")
+        series = burndown_series(
+            db, "Deliverable", id, [models.Task.deliverable_id == id]
+        )
+        return series
     except (DBAPIError, OperationalError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Deliverable for update.",
+            detail="Database error while computing Deliverable burndown.",
         )
+
+
+@router.put("/{id}", response_model=schemas.DeliverableViewBase)
+def update_deliverable(
+    id: str,
+    payload: schemas.DeliverableUpdate,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
     try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(deliverable, key):
-                continue
-            setattr(deliverable, key, value)
-        deliverable.updated_at = now_utc()
-        deliverable.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.Deliverable.deliverable_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "Deliverable",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(deliverable)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Deliverable update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="Deliverable",
-            entity_id=deliverable.deliverable_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deliverable not found",
         )
-    except Exception:
-        pass
     try:
         deliverable_view = (
             db.query(models.DeliverableView)
@@ -170,6 +201,34 @@ def update_deliverable(
         )
 
 
+@router.patch("/{id}", response_model=schemas.DeliverableViewBase)
+def patch_deliverable(
+    id: str,
+    payload: schemas.DeliverablePatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        deliverable_view = crud.patch_entity(
+            db,
+            models.DeliverableView,
+            models.Deliverable.deliverable_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "Deliverable",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Deliverable update")
+    if deliverable_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Deliverable not found",
+        )
+    return deliverable_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.DeliverableViewBase])
 def archive_deliverable(
     id: str,
@@ -179,7 +238,7 @@ def archive_deliverable(
     try:
         deliverable = (
             db.query(models.Deliverable)
-            .filter(models.Deliverable.deliverable == id)
+            .filter(models.Deliverable.deliverable_id == id)
             .first()
         )
         if not deliverable:
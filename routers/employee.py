@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .login import get_current_employee, hash_password
@@ -71,9 +73,29 @@ def create_employee(
         )
 
 
-@router.get("/", response_model=List[schemas.EmployeeViewBase])
-def list_employees(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.EmployeeViewBase], schemas.ViewDelta[schemas.EmployeeViewBase]
+    ],
+)
+@query_budget(1)
+def list_employees(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.EmployeeView,
+                models.EmployeeView.employee_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         employee_view = (
             db.query(models.EmployeeView)
             .filter(models.EmployeeView.entity_status == "Active")
@@ -87,7 +109,22 @@ def list_employees(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.EmployeeViewBase])
+@query_budget(1)
+def get_employees_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.EmployeeView, models.Employee.employee_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Employee batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.EmployeeViewBase)
+@query_budget(1)
 def get_employee(id: str, db: Session = Depends(get_db)):
     try:
         employee_view = (
@@ -112,54 +149,26 @@ def update_employee(
     db: Session = Depends(get_db),
     current_employee: models.Employee = Depends(get_current_employee),
 ):
+    update_data = payload.model_dump(exclude_none=True)
+    if "password" in update_data:
+        update_data["password"] = hash_password(update_data["password"])
     try:
-        employee = (
-            db.query(models.Employee).filter(models.Employee.employee_id == id).first()
-        )
-        if not employee:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Employee not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Employee for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(employee, key):
-                continue
-            if key == "password":
-                setattr(employee, key, hash_password(value))
-            else:
-                setattr(employee, key, value)
-        employee.updated_at = now_utc()
-        employee.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.Employee.employee_id,
+            id,
+            update_data,
+            "Employee",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(employee)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Employee update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="Employee",
-            entity_id=employee.employee_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
         )
-    except Exception:
-        pass
     try:
         employee_view = (
             db.query(models.EmployeeView)
@@ -174,6 +183,37 @@ def update_employee(
         )
 
 
+@router.patch("/{id}", response_model=schemas.EmployeeViewBase)
+def patch_employee(
+    id: str,
+    payload: schemas.EmployeePatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    changes = payload.model_dump(exclude_unset=True)
+    if "password" in changes:
+        changes["password"] = hash_password(changes["password"])
+    try:
+        employee_view = crud.patch_entity(
+            db,
+            models.EmployeeView,
+            models.Employee.employee_id,
+            id,
+            changes,
+            "Employee",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Employee update")
+    if employee_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found",
+        )
+    return employee_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.EmployeeViewBase])
 def archive_employee(
     id: str,
@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,30 @@ def create_employee_business_unit(
         )
 
 
-@router.get("/", response_model=List[schemas.EmployeeBusinessUnitViewBase])
-def list_employee_business_units(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.EmployeeBusinessUnitViewBase],
+        schemas.ViewDelta[schemas.EmployeeBusinessUnitViewBase],
+    ],
+)
+@query_budget(1)
+def list_employee_business_units(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.EmployeeBusinessUnitView,
+                models.EmployeeBusinessUnitView.business_unit_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         employee_business_unit_view = (
             db.query(models.EmployeeBusinessUnitView)
             .filter(models.EmployeeBusinessUnitView.entity_status == "Active")
@@ -85,6 +108,7 @@ def list_employee_business_units(db: Session = Depends(get_db)):
 
 
 @router.get("/{id}", response_model=schemas.EmployeeBusinessUnitViewBase)
+@query_budget(1)
 def get_employee_business_unit(id: str, db: Session = Depends(get_db)):
     try:
         employee_business_unit_view = (
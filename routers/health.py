@@ -0,0 +1,93 @@
+import os
+
+import anyio.to_thread
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import JSONResponse
+
+from main.admission import control as admission
+from main.events import broker
+from main.metrics import registry
+from main.profiling import is_admin
+from main.refcache import cache
+from main.response_cache import cache as response_cache
+
+from .login import decode_access_token, oauth2_scheme
+
+
+router = APIRouter()
+
+# Share of the pool or thread pool in use above which /health/ready fails.
+SATURATION_THRESHOLD = float(os.getenv("HEALTH_SATURATION_THRESHOLD", "1.0"))
+
+
+def thread_pool_stats():
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    return {
+        "size": limiter.total_tokens,
+        "busy": limiter.borrowed_tokens,
+        "waiting": limiter.statistics().tasks_waiting,
+        "saturation": round(limiter.borrowed_tokens / limiter.total_tokens, 4),
+    }
+
+
+def pool_saturation(pool):
+    capacity = pool.get("capacity")
+    if not capacity or "checkedout" not in pool:
+        return None
+    return round(pool["checkedout"] / capacity, 4)
+
+
+# The probes are async so they answer from the event loop even when every
+# worker thread is busy.
+@router.get("/health/live")
+async def live():
+    return {"status": "ok"}
+
+
+@router.get("/health/ready")
+async def ready(request: Request):
+    warmup = request.app.state.warmup
+    pool = registry.pool_stats()
+    threads = thread_pool_stats()
+    reasons = []
+    if not warmup.ready:
+        reasons.append(f"warmup {warmup.status()['status']}")
+    saturation = pool_saturation(pool)
+    if saturation is not None and saturation >= SATURATION_THRESHOLD:
+        reasons.append(f"db pool saturated ({pool['checkedout']}/{pool['capacity']})")
+    if threads["saturation"] >= SATURATION_THRESHOLD and threads["waiting"]:
+        reasons.append(
+            f"thread pool saturated ({threads['busy']}/{threads['size']}, "
+            f"{threads['waiting']} waiting)"
+        )
+    body = {
+        "status": "unavailable" if reasons else "ready",
+        "reasons": reasons,
+        "db_pool_saturation": saturation,
+        "thread_pool_saturation": threads["saturation"],
+    }
+    return JSONResponse(body, status_code=503 if reasons else 200)
+
+
+def require_admin(token: str = Depends(oauth2_scheme)):
+    """The profiler's admin check: a bearer token for PROFILE_ADMIN_EMAILS."""
+    if not is_admin(decode_access_token(token)):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Runtime stats require an admin token",
+        )
+
+
+@router.get("/debug/stats", dependencies=[Depends(require_admin)])
+async def stats(request: Request):
+    pool = registry.pool_stats()
+    pool["saturation"] = pool_saturation(pool)
+    return {
+        "ready": request.app.state.warmup.ready,
+        "db_pool": pool,
+        "thread_pool": thread_pool_stats(),
+        "reference_cache": cache.stats(),
+        "response_cache": response_cache.stats(),
+        "event_subscribers": broker.subscriber_count,
+        "admission": admission.stats(),
+    }
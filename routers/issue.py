@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,29 @@ def create_issue(
         )
 
 
-@router.get("/", response_model=List[schemas.IssueViewBase])
-def list_issues(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.IssueViewBase], schemas.ViewDelta[schemas.IssueViewBase]
+    ],
+)
+@query_budget(1)
+def list_issues(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.IssueView,
+                models.IssueView.issue_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         issue_view = (
             db.query(models.IssueView)
             .filter(models.IssueView.entity_status == "Active")
@@ -84,7 +106,22 @@ def list_issues(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.IssueViewBase])
+@query_budget(1)
+def get_issues_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.IssueView, models.Issue.issue_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Issue batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.IssueViewBase)
+@query_budget(1)
 def get_issue(id: str, db: Session = Depends(get_db)):
     try:
         issue_view = (
@@ -108,48 +145,22 @@ def update_issue(
     current_employee: models.Employee = Depends(get_current_employee),
 ):
     try:
-        issue = db.query(models.Issue).filter(models.Issue.issue_id == id).first()
-        if not issue:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Issue not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Issue for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(issue, key):
-                continue
-            setattr(issue, key, value)
-        issue.updated_at = now_utc()
-        issue.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.Issue.issue_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "Issue",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(issue)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Issue update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="Issue",
-            entity_id=issue.issue_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found",
         )
-    except Exception:
-        pass
     try:
         issue_view = (
             db.query(models.IssueView).filter(models.IssueView.issue_id == id).first()
@@ -162,6 +173,34 @@ def update_issue(
         )
 
 
+@router.patch("/{id}", response_model=schemas.IssueViewBase)
+def patch_issue(
+    id: str,
+    payload: schemas.IssuePatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        issue_view = crud.patch_entity(
+            db,
+            models.IssueView,
+            models.Issue.issue_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "Issue",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Issue update")
+    if issue_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue not found",
+        )
+    return issue_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.IssueViewBase])
 def archive_issue(
     id: str,
@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,30 @@ def create_issue_activity(
         )
 
 
-@router.get("/", response_model=List[schemas.IssueActivityViewBase])
-def list_issue_activities(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.IssueActivityViewBase],
+        schemas.ViewDelta[schemas.IssueActivityViewBase],
+    ],
+)
+@query_budget(1)
+def list_issue_activities(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.IssueActivityView,
+                models.IssueActivityView.issue_activity_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         issue_activity_view = (
             db.query(models.IssueActivityView)
             .filter(models.IssueActivityView.entity_status == "Active")
@@ -84,7 +107,27 @@ def list_issue_activities(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.IssueActivityViewBase])
+@query_budget(1)
+def get_issue_activities_batch(
+    payload: schemas.BatchIds, db: Session = Depends(get_db)
+):
+    try:
+        return crud.fetch_by_ids(
+            db,
+            models.IssueActivityView,
+            models.IssueActivity.issue_activity_id,
+            payload.ids,
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Issue Activity batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.IssueActivityViewBase)
+@query_budget(1)
 def get_issue_activity(id: str, db: Session = Depends(get_db)):
     try:
         issue_activity_view = (
@@ -110,52 +153,22 @@ def update_issue_activity(
     current_employee: models.Employee = Depends(get_current_employee),
 ):
     try:
-        issue_activity = (
-            db.query(models.IssueActivity)
-            .filter(models.IssueActivity.issue_activity_id == id)
-            .first()
-        )
-        if not issue_activity:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Issue Activity not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Issue Activity for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(issue_activity, key):
-                continue
-            setattr(issue_activity, key, value)
-        issue_activity.updated_at = now_utc()
-        issue_activity.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.IssueActivity.issue_activity_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "IssueActivity",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(issue_activity)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Issue Activity update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="IssueActivity",
-            entity_id=issue_activity.issue_activity_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue Activity not found",
         )
-    except Exception:
-        pass
     try:
         issue_activity_view = (
             db.query(models.IssueActivityView)
@@ -170,6 +183,34 @@ def update_issue_activity(
         )
 
 
+@router.patch("/{id}", response_model=schemas.IssueActivityViewBase)
+def patch_issue_activity(
+    id: str,
+    payload: schemas.IssueActivityPatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        issue_activity_view = crud.patch_entity(
+            db,
+            models.IssueActivityView,
+            models.IssueActivity.issue_activity_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "IssueActivity",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Issue Activity update")
+    if issue_activity_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Issue Activity not found",
+        )
+    return issue_activity_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.IssueActivityViewBase])
 def archive_issue_activity(
     id: str,
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from main import models, schemas
+from main.dashboard import SECTIONS, load_dashboard
+from main.database import SessionLocal, get_db
+from main.querylog import query_budget
+
+from .employee import get_current_employee
+
+
+router = APIRouter()
+
+
+@router.get("/dashboard", response_model=schemas.MyDashboard)
+@query_budget(1 + len(SECTIONS))
+async def get_my_dashboard(
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    if current_employee is None:
+        raise HTTPException(status_code=401, detail="Employee not found")
+    employee_id = current_employee.employee_id
+    employee_full_name = current_employee.employee_full_name
+    # The sections run on their own sessions; hand the auth session's
+    # connection back to the pool before taking theirs.
+    await run_in_threadpool(db.close)
+    try:
+        dashboard = await load_dashboard(SessionLocal, employee_id, limit)
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while loading the dashboard.",
+        )
+    return {
+        "employee_id": employee_id,
+        "employee_full_name": employee_full_name,
+        **dashboard,
+    }
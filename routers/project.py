@@ -1,11 +1,15 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
+from main.burndown import burndown_series
 from main.database import get_db
+from main.project_tree import FIELDS, MAX_DEPTH, project_tree
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +72,29 @@ def create_project(
         )
 
 
-@router.get("/", response_model=List[schemas.ProjectViewBase])
-def list_projects(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.ProjectViewBase], schemas.ViewDelta[schemas.ProjectViewBase]
+    ],
+)
+@query_budget(1)
+def list_projects(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.ProjectView,
+                models.ProjectView.project_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         project_view = (
             db.query(models.ProjectView)
             .filter(models.ProjectView.entity_status == "Active")
@@ -84,7 +108,22 @@ def list_projects(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.ProjectViewBase])
+@query_budget(1)
+def get_projects_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.ProjectView, models.Project.project_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Project batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.ProjectViewBase)
+@query_budget(1)
 def get_project_by_id(id: str, db: Session = Depends(get_db)):
     try:
         project_view = (
@@ -102,60 +141,89 @@ def get_project_by_id(id: str, db: Session = Depends(get_db)):
         )
 
 
-@router.put("/{id}", response_model=schemas.ProjectViewBase)
-def update_project(
-    id: str,
-    payload: schemas.ProjectUpdate,
-    db: Session = Depends(get_db),
-    current_employee: models.Employee = Depends(get_current_employee),
-):
-
+@router.get("/{id}/burndown", response_model=schemas.BurndownSeries)
+@query_budget(5)
+def get_project_burndown(id: str, db: Session = Depends(get_db)):
     try:
         project = (
-            db.query(models.Project).filter(models.Project.project_id == id).first()
+            db.query(models.Project.project_id)
+            .filter(models.Project.project_id == id)
+            .first()
         )
-
         if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Project not found",
-            )
+            raise HTTPException(status_code=404, detail="Project not found")
+        deliverable_ids = db.query(models.Deliverable.deliverable_id).filter(
+            models.Deliverable.project_id == id,
+            models.Deliverable.entity_status == "Active",
+        )
+        series = burndown_series(
+            db,
+            "Project",
+            id,
+            [models.Task.deliverable_id.in_(deliverable_ids.scalar_subquery())],
+        )
+        return series
     except (DBAPIError, OperationalError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Project for update.",
+            detail="Database error while computing Project burndown.",
         )
+
+
+@router.get("/{id}/tree", response_model=schemas.ProjectTree)
+@query_budget(1 + MAX_DEPTH)
+def get_project_tree(
+    id: str,
+    depth: int = Query(MAX_DEPTH, ge=1, le=MAX_DEPTH),
+    fields: Optional[str] = None,
+    activities: int = Query(5, ge=0, le=50),
+    db: Session = Depends(get_db),
+):
+    selected = None
+    if fields is not None:
+        selected = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = selected - FIELDS
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported fields: {', '.join(sorted(unknown))}",
+            )
     try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(project, key):
-                continue
-            setattr(project, key, value)
-        project.updated_at = now_utc()
-        project.updated_by = current_employee.employee_id
-    except Exception as e:
+        tree = project_tree(db, id, depth, selected, activities)
+    except (DBAPIError, OperationalError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+            detail="Database error while fetching Project tree.",
         )
+    if tree is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return tree
+
+
+@router.put("/{id}", response_model=schemas.ProjectViewBase)
+def update_project(
+    id: str,
+    payload: schemas.ProjectUpdate,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
     try:
-        db.commit()
-        db.refresh(project)
+        updated = crud.update_entity(
+            db,
+            models.Project.project_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "Project",
+            current_employee.employee_id,
+        )
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Project update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="Project",
-            entity_id=project.project_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
         )
-    except Exception:
-        pass
     try:
         project_view = (
             db.query(models.ProjectView)
@@ -170,6 +238,34 @@ def update_project(
         )
 
 
+@router.patch("/{id}", response_model=schemas.ProjectViewBase)
+def patch_project(
+    id: str,
+    payload: schemas.ProjectPatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        project_view = crud.patch_entity(
+            db,
+            models.ProjectView,
+            models.Project.project_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "Project",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Project update")
+    if project_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return project_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.ProjectViewBase])
 def archive_project(
     id: str,
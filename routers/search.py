@@ -0,0 +1,39 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+
+from main import schemas
+from main.database import get_db
+from main.querylog import query_budget
+from main.search import SEARCH_ENTITIES, search
+
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[schemas.SearchHit])
+@query_budget(len(SEARCH_ENTITIES))
+def search_text(
+    q: str = Query(..., min_length=2, max_length=200),
+    entity_types: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    types = None
+    if entity_types:
+        types = {name.strip() for name in entity_types.split(",") if name.strip()}
+        unknown = types - set(SEARCH_ENTITIES)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported entity types: {', '.join(sorted(unknown))}",
+            )
+    try:
+        return search(db, q, types, limit)
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while searching.",
+        )
@@ -1,12 +1,21 @@
-from typing import List
+from datetime import date, datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
-from main import crud, models, schemas
+from main import crud, models, refcache, schemas
 from main.database import get_db
-from main.utils import handle_db_error, now_utc
+from main.querylog import query_budget
+from main.utils import (
+    decode_cursor,
+    encode_cursor,
+    handle_db_error,
+    now_utc,
+    parse_hours,
+)
 
 from .employee import get_current_employee
 
@@ -68,9 +77,36 @@ def create_task(
         )
 
 
-@router.get("/", response_model=List[schemas.TaskViewBase])
-def list_tasks(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.TaskViewBase], schemas.ViewDelta[schemas.TaskViewBase]
+    ],
+)
+@query_budget(1 + len(refcache.LOADERS))
+def list_tasks(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.TaskView,
+                models.TaskView.task_id,
+                updated_since,
+                cursor,
+                limit,
+            )
+        if refcache.USE_FOR_LISTS:
+            tasks = (
+                db.query(models.Task)
+                .filter(models.Task.entity_status == "Active")
+                .all()
+            )
+            return refcache.enrich_tasks(db, tasks)
         task_view = (
             db.query(models.TaskView)
             .filter(models.TaskView.entity_status == "Active")
@@ -84,7 +120,20 @@ def list_tasks(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.TaskViewBase])
+@query_budget(1)
+def get_tasks_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(db, models.TaskView, models.Task.task_id, payload.ids)
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Task batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.TaskViewBase)
+@query_budget(1)
 def get_task(id: str, db: Session = Depends(get_db)):
     try:
         task_view = (
@@ -100,56 +149,107 @@ def get_task(id: str, db: Session = Depends(get_db)):
         )
 
 
-@router.put("/{id}", response_model=schemas.TaskViewBase)
-def update_task(
+@router.get("/{id}/status-history", response_model=schemas.TaskStatusHistoryPage)
+@query_budget(2)
+def get_task_status_history(
     id: str,
-    payload: schemas.TaskUpdate,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
     db: Session = Depends(get_db),
-    current_employee: models.Employee = Depends(get_current_employee),
 ):
-    try:
-        task = db.query(models.Task).filter(models.Task.task_id == id).first()
-        if not task:
+    running_total = 0.0
+    query = db.query(models.TaskStatus).filter(
+        models.TaskStatus.task_id == id,
+        models.TaskStatus.entity_status == "Active",
+        models.TaskStatus.action_date.isnot(None),
+    )
+    if cursor:
+        after_date, after_id, running_total = decode_cursor(cursor, 3)
+        try:
+            after_date = date.fromisoformat(after_date)
+            running_total = float(running_total)
+        except (TypeError, ValueError):
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid pagination cursor.",
+            )
+        query = query.filter(
+            or_(
+                models.TaskStatus.action_date > after_date,
+                and_(
+                    models.TaskStatus.action_date == after_date,
+                    models.TaskStatus.task_status_id > after_id,
+                ),
             )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Task for update.",
         )
     try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(task, key):
-                continue
-            setattr(task, key, value)
-        task.updated_at = now_utc()
-        task.updated_by = current_employee.employee_id
-    except Exception as e:
+        if not cursor:
+            task = db.query(models.Task.task_id).filter(models.Task.task_id == id)
+            if not task.first():
+                raise HTTPException(status_code=404, detail="Task not found")
+        rows = (
+            query.order_by(
+                models.TaskStatus.action_date, models.TaskStatus.task_status_id
+            )
+            .limit(limit + 1)
+            .all()
+        )
+    except (DBAPIError, OperationalError):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+            detail="Database error while fetching Task Status history.",
         )
+    items = []
+    for row in rows[:limit]:
+        running_total += parse_hours(row.hours_spent)
+        items.append(
+            {
+                "task_status_id": row.task_status_id,
+                "task_id": row.task_id,
+                "action_date": row.action_date,
+                "hours_spent": row.hours_spent,
+                "progress": row.progress,
+                "remarks": row.remarks,
+                "cumulative_hours_spent": round(running_total, 2),
+                "created_at": row.created_at,
+                "created_by": row.created_by,
+                "updated_at": row.updated_at,
+                "updated_by": row.updated_by,
+            }
+        )
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_cursor = encode_cursor(
+            last.action_date.isoformat(), last.task_status_id, running_total
+        )
+    return {"task_id": id, "items": items, "next_cursor": next_cursor}
+
+
+@router.put("/{id}", response_model=schemas.TaskViewBase)
+def update_task(
+    id: str,
+    payload: schemas.TaskUpdate,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
     try:
-        db.commit()
-        db.refresh(task)
+        updated = crud.update_entity(
+            db,
+            models.Task.task_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "Task",
+            current_employee.employee_id,
+        )
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Task update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="Task",
-            entity_id=task.task_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
         )
-    except Exception:
-        pass
     try:
         task_view = (
             db.query(models.TaskView).filter(models.TaskView.task_id == id).first()
@@ -162,6 +262,34 @@ def update_task(
         )
 
 
+@router.patch("/{id}", response_model=schemas.TaskViewBase)
+def patch_task(
+    id: str,
+    payload: schemas.TaskPatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        task_view = crud.patch_entity(
+            db,
+            models.TaskView,
+            models.Task.task_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "Task",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Task update")
+    if task_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    return task_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.TaskViewBase])
 def archive_task(
     id: str,
@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,29 @@ def create_task_status(
         )
 
 
-@router.get("/", response_model=List[schemas.TaskStatusViewBase])
-def list_task_status(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.TaskStatusViewBase], schemas.ViewDelta[schemas.TaskStatusViewBase]
+    ],
+)
+@query_budget(1)
+def list_task_status(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.TaskStatusView,
+                models.TaskStatusView.task_status_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         task_status_view = (
             db.query(models.TaskStatusView)
             .filter(models.TaskStatusView.entity_status == "Active")
@@ -84,7 +106,22 @@ def list_task_status(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.TaskStatusViewBase])
+@query_budget(1)
+def get_task_statuses_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.TaskStatusView, models.TaskStatus.task_status_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Task Status batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.TaskStatusViewBase)
+@query_budget(1)
 def get_task_status(id: str, db: Session = Depends(get_db)):
     try:
         task_status_view = (
@@ -110,52 +147,22 @@ def update_task_status(
     current_employee: models.Employee = Depends(get_current_employee),
 ):
     try:
-        task_status = (
-            db.query(models.TaskStatus)
-            .filter(models.TaskStatus.task_status_id == id)
-            .first()
-        )
-        if not task_status:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task Status not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Task Status for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(task_status, key):
-                continue
-            setattr(task_status, key, value)
-        task_status.updated_at = now_utc()
-        task_status.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.TaskStatus.task_status_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "TaskStatus",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(task_status)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Task Status update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="TaskStatus",
-            entity_id=task_status.task_status_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task Status not found",
         )
-    except Exception:
-        pass
     try:
         task_status_view = (
             db.query(models.TaskStatusView)
@@ -170,6 +177,38 @@ def update_task_status(
         )
 
 
+@router.patch(
+    "/{id}",
+    response_model=Union[schemas.TaskStatusViewBase, schemas.TaskStatusBase],
+)
+def patch_task_status(
+    id: str,
+    payload: schemas.TaskStatusPatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        task_status = crud.patch_entity(
+            db,
+            models.TaskStatusView,
+            models.TaskStatus.task_status_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "TaskStatus",
+            current_employee.employee_id,
+            partial_view=True,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Task Status update")
+    if task_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task Status not found",
+        )
+    return task_status
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.TaskStatusViewBase])
 def archive_task_status(
     id: str,
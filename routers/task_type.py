@@ -1,11 +1,13 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.exc import DBAPIError, IntegrityError, OperationalError
 from sqlalchemy.orm import Session
 
 from main import crud, models, schemas
 from main.database import get_db
+from main.querylog import query_budget
 from main.utils import handle_db_error, now_utc
 
 from .employee import get_current_employee
@@ -68,9 +70,29 @@ def create_task_type(
         )
 
 
-@router.get("/", response_model=List[schemas.TaskTypeViewBase])
-def list_task_type(db: Session = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=Union[
+        List[schemas.TaskTypeViewBase], schemas.ViewDelta[schemas.TaskTypeViewBase]
+    ],
+)
+@query_budget(1)
+def list_task_type(
+    updated_since: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(crud.DELTA_PAGE_SIZE, ge=1, le=crud.MAX_DELTA_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
     try:
+        if updated_since is not None:
+            return crud.view_delta(
+                db,
+                models.TaskTypeView,
+                models.TaskTypeView.task_type_id,
+                updated_since,
+                cursor,
+                limit,
+            )
         task_type_view = (
             db.query(models.TaskTypeView)
             .filter(models.TaskTypeView.entity_status == "Active")
@@ -84,7 +106,22 @@ def list_task_type(db: Session = Depends(get_db)):
         )
 
 
+@router.post("/batch", response_model=schemas.ViewBatch[schemas.TaskTypeViewBase])
+@query_budget(1)
+def get_task_types_batch(payload: schemas.BatchIds, db: Session = Depends(get_db)):
+    try:
+        return crud.fetch_by_ids(
+            db, models.TaskTypeView, models.TaskType.task_type_id, payload.ids
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while fetching Task Type batch.",
+        )
+
+
 @router.get("/{id}", response_model=schemas.TaskTypeViewBase)
+@query_budget(1)
 def get_task_type(id: str, db: Session = Depends(get_db)):
     try:
         task_type_view = (
@@ -110,50 +147,22 @@ def update_task_type(
     current_employee: models.Employee = Depends(get_current_employee),
 ):
     try:
-        task_type = (
-            db.query(models.TaskType).filter(models.TaskType.task_type_id == id).first()
-        )
-        if not task_type:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task Type not found",
-            )
-    except (DBAPIError, OperationalError):
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Database error while fetching Task Type for update.",
-        )
-    try:
-        update_data = payload.model_dump()
-        for key, value in update_data.items():
-            if value is None:
-                continue
-            if not hasattr(task_type, key):
-                continue
-            setattr(task_type, key, value)
-        task_type.updated_at = now_utc()
-        task_type.updated_by = current_employee.employee_id
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to apply update payload: {e}",
+        updated = crud.update_entity(
+            db,
+            models.TaskType.task_type_id,
+            id,
+            payload.model_dump(exclude_none=True),
+            "TaskType",
+            current_employee.employee_id,
         )
-    try:
-        db.commit()
-        db.refresh(task_type)
     except (IntegrityError, DBAPIError, OperationalError) as e:
         db.rollback()
         handle_db_error(db, e, "Task Type update")
-    try:
-        crud.audit_log(
-            db,
-            entity_type="TaskType",
-            entity_id=task_type.task_type_id,
-            action="Update",
-            changed_by=current_employee.employee_id,
+    if not updated:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task Type not found",
         )
-    except Exception:
-        pass
     try:
         task_type_view = (
             db.query(models.TaskTypeView)
@@ -168,6 +177,34 @@ def update_task_type(
         )
 
 
+@router.patch("/{id}", response_model=schemas.TaskTypeViewBase)
+def patch_task_type(
+    id: str,
+    payload: schemas.TaskTypePatch,
+    db: Session = Depends(get_db),
+    current_employee: models.Employee = Depends(get_current_employee),
+):
+    try:
+        task_type_view = crud.patch_entity(
+            db,
+            models.TaskTypeView,
+            models.TaskType.task_type_id,
+            id,
+            payload.model_dump(exclude_unset=True),
+            "TaskType",
+            current_employee.employee_id,
+        )
+    except (IntegrityError, DBAPIError, OperationalError) as e:
+        db.rollback()
+        handle_db_error(db, e, "Task Type update")
+    if task_type_view is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task Type not found",
+        )
+    return task_type_view
+
+
 @router.patch("/{id}/archive", response_model=List[schemas.TaskTypeViewBase])
 def archive_task_type(
     id: str,
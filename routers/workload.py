@@ -0,0 +1,100 @@
+from datetime import date, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import or_
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+
+from main import models, schemas
+from main.database import get_db
+from main.querylog import query_budget
+from main.utils import now_utc
+from main.workload import allocate_workload
+
+
+router = APIRouter()
+
+MAX_WINDOW_DAYS = 366
+
+
+@router.get("/", response_model=List[schemas.EmployeeWorkload])
+@query_budget(2)
+def get_workload(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    granularity: str = Query("week", pattern="^(day|week)$"),
+    capacity_hours_per_day: float = Query(8.0, gt=0),
+    employee_id: Optional[str] = None,
+    over_capacity_only: bool = False,
+    db: Session = Depends(get_db),
+):
+    window_start = start_date or now_utc().date()
+    window_end = end_date or window_start + timedelta(days=27)
+    if window_end < window_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_date must not be before start_date",
+        )
+    if (window_end - window_start).days + 1 > MAX_WINDOW_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Workload window cannot exceed {MAX_WINDOW_DAYS} days",
+        )
+    try:
+        query = db.query(
+            models.Task.assignee_id,
+            models.Task.planned_start_date,
+            models.Task.planned_end_date,
+            models.Task.effort_estimated_in_hours,
+        ).filter(
+            models.Task.entity_status == "Active",
+            models.Task.assignee_id.isnot(None),
+            # Overlap on min/max of the two dates: allocate_workload swaps
+            # reversed start/end dates, so those tasks must not be dropped.
+            or_(
+                models.Task.planned_start_date < window_end + timedelta(days=1),
+                models.Task.planned_end_date < window_end + timedelta(days=1),
+            ),
+            or_(
+                models.Task.planned_start_date >= window_start,
+                models.Task.planned_end_date >= window_start,
+            ),
+        )
+        if employee_id:
+            query = query.filter(models.Task.assignee_id == employee_id)
+        allocation = allocate_workload(
+            query.all(),
+            window_start,
+            window_end,
+            granularity,
+            capacity_hours_per_day,
+        )
+        names = dict(
+            db.query(models.Employee.employee_id, models.Employee.employee_full_name)
+            .filter(models.Employee.employee_id.in_(list(allocation)))
+            .all()
+        )
+    except (DBAPIError, OperationalError):
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Database error while computing employee workload.",
+        )
+    workload = []
+    for assignee_id in sorted(allocation):
+        buckets = allocation[assignee_id]
+        over_capacity = any(bucket["over_capacity"] for bucket in buckets)
+        if over_capacity_only and not over_capacity:
+            continue
+        workload.append(
+            {
+                "employee_id": assignee_id,
+                "employee_full_name": names.get(assignee_id),
+                "total_allocated_hours": round(
+                    sum(bucket["allocated_hours"] for bucket in buckets), 2
+                ),
+                "over_capacity": over_capacity,
+                "buckets": buckets,
+            }
+        )
+    return workload
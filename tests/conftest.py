@@ -0,0 +1,99 @@
+"""Fixtures shared by the API tests.
+
+The whole run uses one SQLite database, migrated and filled by
+main/sample_data.py --create-schema. The engine, query budgets and
+admission limits are read when main/ is imported, so the environment is
+set here, before any test module imports it. QUERY_BUDGET_STRICT=1 turns
+a query-budget overrun into a server error, which TestClient re-raises in
+the test.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORK_DIR = tempfile.mkdtemp(prefix="delivery-tracker-tests-")
+DATABASE_URL = "sqlite:///" + os.path.join(WORK_DIR, "tests.db")
+ADMIN_EMAIL = "e000001@example.com"
+EMPLOYEE_EMAIL = "e000002@example.com"
+
+os.environ.update(
+    {
+        "DATABASE_URL": DATABASE_URL,
+        "QUERY_BUDGET_STRICT": "1",
+        "ADMISSION_RATE": "1000000",
+        "ADMISSION_BURST": "1000000",
+        "PROFILE_ADMIN_EMAILS": ADMIN_EMAIL,
+        "PROFILE_DIR": os.path.join(WORK_DIR, "profiles"),
+        "AUDIT_ARCHIVE_DIR": os.path.join(WORK_DIR, "audit_archive"),
+    }
+)
+
+
+@pytest.fixture(scope="session")
+def seeded():
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(ROOT, "main", "sample_data.py"),
+            "--create-schema",
+            "--database-url",
+            DATABASE_URL,
+            "--scale",
+            "0.05",
+        ],
+        cwd=ROOT,
+        check=True,
+        capture_output=True,
+    )
+    return DATABASE_URL
+
+
+@pytest.fixture(scope="session")
+def client(seeded):
+    from fastapi.testclient import TestClient
+
+    from main.main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def db(seeded):
+    from main.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+def bearer(email):
+    from routers.login import create_access_token
+
+    return {"Authorization": "Bearer " + create_access_token({"sub": email})}
+
+
+@pytest.fixture
+def auth():
+    return bearer(EMPLOYEE_EMAIL)
+
+
+@pytest.fixture
+def admin():
+    return bearer(ADMIN_EMAIL)
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    from main import refcache, response_cache
+
+    response_cache.cache.invalidate()
+    refcache.cache.invalidate()
@@ -0,0 +1,53 @@
+"""The audit-log change feed."""
+
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from main import crud, models
+from main.utils import now_utc
+
+
+def add_change(db, entity_id, age):
+    db.add(
+        models.AuditLog(
+            audit_id=str(uuid.uuid4()),
+            entity_type="Task",
+            entity_id=entity_id,
+            action="Update",
+            field_changed="All",
+            changed_by="E000001",
+            changed_at=now_utc() - age,
+        )
+    )
+    db.commit()
+
+
+def feed_ids(client, since):
+    response = client.get(
+        "/api/changes/", params={"since": since, "include_rows": False}
+    )
+    assert response.status_code == 200
+    return {entry["entity_id"] for entry in response.json()["entries"]}
+
+
+def test_recent_changes_wait_for_the_overlap(client, db):
+    since = (now_utc() - timedelta(minutes=1)).isoformat()
+    add_change(db, "settled", crud.WATERMARK_OVERLAP + timedelta(seconds=5))
+    add_change(db, "unsettled", timedelta(0))
+
+    ids = feed_ids(client, since)
+    assert "settled" in ids
+    assert "unsettled" not in ids
+
+
+def test_since_accepts_trailing_z(client):
+    since = (now_utc() - timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    assert feed_ids(client, since) == feed_ids(client, since[:-1] + "+00:00")
+
+
+@pytest.mark.parametrize("since", ["yesterday", "2024-13-45T00:00:00"])
+def test_bad_since_is_422(client, since):
+    response = client.get("/api/changes/", params={"since": since})
+    assert response.status_code == 422
@@ -0,0 +1,49 @@
+"""Alembic round trips on a scratch SQLite database."""
+
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, inspect
+
+from main.views import VIEWS, view_sql
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def alembic(url, *args):
+    subprocess.run(
+        [sys.executable, "-m", "alembic", *args],
+        cwd=ROOT,
+        env={**os.environ, "DATABASE_URL": url},
+        check=True,
+        capture_output=True,
+    )
+
+
+def view_names(url):
+    engine = create_engine(url)
+    try:
+        return set(inspect(engine).get_view_names())
+    finally:
+        engine.dispose()
+
+
+def test_downgrade_keeps_views_it_did_not_create(tmp_path):
+    url = "sqlite:///" + str(tmp_path / "migrations.db")
+    alembic(url, "upgrade", "0005")
+    kept = "vw_employee"
+    assert kept in VIEWS
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.exec_driver_sql(
+            f"CREATE VIEW {kept} AS {view_sql(kept, connection.dialect)}"
+        )
+    engine.dispose()
+
+    alembic(url, "upgrade", "head")
+    assert view_names(url) == set(VIEWS)
+
+    alembic(url, "downgrade", "0005")
+    assert view_names(url) == {kept}
@@ -0,0 +1,120 @@
+"""Keyset cursors and the updated_since delta lists."""
+
+from datetime import timedelta
+
+from sqlalchemy import func
+
+from main import crud, models
+from main.utils import now_utc
+
+
+def walk(client, path, params):
+    """Every page of a cursor-paged endpoint, as a list of page bodies."""
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(
+            path, params={**params, "cursor": cursor} if cursor else params
+        )
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_status_history_pages(client, db):
+    task_id, count = (
+        db.query(models.TaskStatus.task_id, func.count())
+        .filter(models.TaskStatus.entity_status == "Active")
+        .group_by(models.TaskStatus.task_id)
+        .order_by(func.count().desc())
+        .first()
+    )
+    assert count > 2
+    path = f"/api/Tasks/{task_id}/status-history"
+    whole = client.get(path, params={"limit": 1000}).json()["items"]
+
+    pages = walk(client, path, {"limit": 2})
+    paged = [item for page in pages for item in page["items"]]
+    assert len(pages) == (count + 1) // 2
+    assert paged == whole
+
+
+def test_status_history_rejects_bad_cursor(client, db):
+    task_id = db.query(models.TaskStatus.task_id).first().task_id
+    response = client.get(
+        f"/api/Tasks/{task_id}/status-history", params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+def test_audit_log_pages(client, db):
+    for _ in range(5):
+        crud.audit_log(db, "Task", "paging", "Update", changed_by="E000001")
+    created = [
+        row.audit_id
+        for row in db.query(models.AuditLog.audit_id).filter(
+            models.AuditLog.entity_id == "paging"
+        )
+    ]
+    params = {"entity_id": "paging", "limit": 2}
+
+    ascending = walk(client, "/api/AuditLogs/", params)
+    assert [len(page["items"]) for page in ascending] == [2, 2, 1]
+    ids = [item["audit_id"] for page in ascending for item in page["items"]]
+    assert sorted(ids) == sorted(created)
+
+    descending = walk(client, "/api/AuditLogs/", {**params, "descending": True})
+    assert [item["audit_id"] for page in descending for item in page["items"]] == (
+        ids[::-1]
+    )
+
+
+def test_delta_lists_archived_ids(client, db, auth):
+    since = (now_utc() - timedelta(seconds=1)).isoformat()
+    archived, patched = [
+        row.task_id
+        for row in db.query(models.Task.task_id)
+        .filter(models.Task.entity_status == "Active")
+        .order_by(models.Task.task_id.desc())
+        .limit(2)
+    ]
+    response = client.patch(f"/api/Tasks/{archived}/archive", headers=auth)
+    assert response.status_code == 200
+    response = client.patch(
+        f"/api/Tasks/{patched}", json={"priority": "Delta"}, headers=auth
+    )
+    assert response.status_code == 200
+
+    delta = client.get("/api/Tasks/", params={"updated_since": since}).json()
+    assert archived in delta["archived_ids"]
+    assert archived not in {item["task_id"] for item in delta["items"]}
+    assert patched in {item["task_id"] for item in delta["items"]}
+    assert delta["next_cursor"] is None
+
+
+def test_delta_pages(client, db):
+    total = db.query(models.TaskView).count()
+    pages = walk(
+        client,
+        "/api/Tasks/",
+        {"updated_since": "2000-01-01T00:00:00", "limit": 100},
+    )
+    ids = [
+        task_id
+        for page in pages
+        for task_id in [item["task_id"] for item in page["items"]]
+        + page["archived_ids"]
+    ]
+    assert len(pages) == -(-total // 100)
+    assert len(ids) == len(set(ids)) == total
+    assert len({page["watermark"] for page in pages}) == 1
+
+
+def test_delta_rejects_bad_cursor(client):
+    response = client.get(
+        "/api/Tasks/",
+        params={"updated_since": "2000-01-01T00:00:00", "cursor": "not-a-cursor"},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,79 @@
+"""Hot endpoints stay within their query budgets on seeded data."""
+
+import pytest
+
+from main import models, querylog
+from main.main import CACHED_LISTS
+
+
+@pytest.fixture(scope="module")
+def ids(seeded):
+    from main.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        task = db.query(models.Task).order_by(models.Task.task_id).first()
+        status = db.query(models.TaskStatus.task_id).first()
+        return {
+            "task": task.task_id,
+            "deliverable": task.deliverable_id,
+            "project": db.query(models.Deliverable)
+            .filter(models.Deliverable.deliverable_id == task.deliverable_id)
+            .one()
+            .project_id,
+            "status_task": status.task_id,
+        }
+    finally:
+        db.close()
+
+
+def test_budgets_are_strict():
+    assert querylog.STRICT
+
+
+@pytest.mark.parametrize("path", sorted(CACHED_LISTS))
+def test_list_endpoints(client, path):
+    response = client.get(path)
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/Tasks/{task}",
+        "/api/Tasks/{status_task}/status-history",
+        "/api/Projects/{project}",
+        "/api/Projects/{project}/tree",
+        "/api/Projects/{project}/burndown",
+        "/api/Deliverables/{deliverable}/burndown",
+        "/api/Workload/",
+        "/api/search/?q=Task",
+        "/api/changes/?since=2000-01-01T00:00:00",
+        "/api/AuditLogs/",
+    ],
+)
+def test_read_endpoints(client, ids, path):
+    response = client.get(path.format(**ids))
+    assert response.status_code == 200
+
+
+def test_batch(client, ids):
+    response = client.post(
+        "/api/Tasks/batch", json={"ids": [ids["task"], "missing", ids["task"]]}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert [item["task_id"] for item in body["items"]] == [ids["task"]]
+    assert body["missing_ids"] == ["missing"]
+
+
+def test_dashboard(client, auth):
+    response = client.get("/api/me/dashboard", headers=auth)
+    assert response.status_code == 200
+    assert set(response.json()["timings_ms"]) == {
+        "assigned_tasks",
+        "review_tasks",
+        "owned_issues",
+        "recent_statuses",
+    }
@@ -0,0 +1,182 @@
+"""Update paths and the caches they invalidate."""
+
+from sqlalchemy import func
+
+from main import models
+
+
+def first_task_id(db):
+    return (
+        db.query(models.Task.task_id)
+        .filter(models.Task.entity_status == "Active")
+        .order_by(models.Task.task_id)
+        .first()
+        .task_id
+    )
+
+
+def audit_count(db, entity_id):
+    return (
+        db.query(models.AuditLog).filter(models.AuditLog.entity_id == entity_id).count()
+    )
+
+
+def test_put_missing_row_is_404(client, db, auth):
+    before = db.query(models.AuditLog).count()
+    response = client.put(
+        "/api/Tasks/no-such-task",
+        json={
+            "task_id": None,
+            "task_type_id": None,
+            "business_unit_id": None,
+            "business_unit_head_id": None,
+            "priority": "High",
+        },
+        headers=auth,
+    )
+    assert response.status_code == 404
+    assert db.query(models.AuditLog).count() == before
+
+
+def test_patch_missing_row_is_404(client, auth):
+    response = client.patch(
+        "/api/Tasks/no-such-task", json={"priority": "High"}, headers=auth
+    )
+    assert response.status_code == 404
+
+
+def test_put_updates_row(client, db, auth):
+    task_id = first_task_id(db)
+    response = client.put(
+        f"/api/Tasks/{task_id}",
+        json={
+            "task_id": None,
+            "task_type_id": None,
+            "business_unit_id": None,
+            "business_unit_head_id": None,
+            "task_description": "rewritten by PUT",
+        },
+        headers=auth,
+    )
+    assert response.status_code == 200
+    assert response.json()["task_description"] == "rewritten by PUT"
+
+
+def test_patch_without_changes_writes_nothing(client, db, auth):
+    task_id = first_task_id(db)
+    current = client.get(f"/api/Tasks/{task_id}").json()
+    audits = audit_count(db, task_id)
+
+    response = client.patch(
+        f"/api/Tasks/{task_id}",
+        json={"priority": current["priority"], "task_name": current["task_name"]},
+        headers=auth,
+    )
+    assert response.status_code == 200
+    assert response.json()["updated_at"] == current["updated_at"]
+    assert audit_count(db, task_id) == audits
+
+
+def test_patch_writes_changed_columns(client, db, auth):
+    task_id = first_task_id(db)
+    audits = audit_count(db, task_id)
+
+    response = client.patch(
+        f"/api/Tasks/{task_id}", json={"task_name": "patched"}, headers=auth
+    )
+    assert response.status_code == 200
+    assert response.json()["task_name"] == "patched"
+    assert audit_count(db, task_id) == audits + 1
+
+
+def test_write_invalidates_cached_list(client, db, auth):
+    assert client.get("/api/Tasks/").headers["x-cache"] == "MISS"
+    assert client.get("/api/Tasks/").headers["x-cache"] == "HIT"
+
+    task_id = first_task_id(db)
+    client.patch(
+        f"/api/Tasks/{task_id}", json={"task_name": "seen after PATCH"}, headers=auth
+    )
+    response = client.get("/api/Tasks/")
+    assert response.headers["x-cache"] == "MISS"
+    names = {task["task_id"]: task["task_name"] for task in response.json()}
+    assert names[task_id] == "seen after PATCH"
+
+
+def test_commit_without_audit_row_invalidates(client, db):
+    client.get("/api/Tasks/")
+    assert client.get("/api/Tasks/").headers["x-cache"] == "HIT"
+
+    task = db.get(models.Task, first_task_id(db))
+    task.task_name = "written outside the routers"
+    db.commit()
+    assert client.get("/api/Tasks/").headers["x-cache"] == "MISS"
+
+
+def test_rollback_keeps_cached_list(client, db):
+    client.get("/api/Tasks/")
+    task = db.get(models.Task, first_task_id(db))
+    task.task_name = "never committed"
+    db.flush()
+    db.rollback()
+    assert client.get("/api/Tasks/").headers["x-cache"] == "HIT"
+
+
+def status_history(db):
+    """A task's active statuses, oldest first; the last one is in the view."""
+    task_id = (
+        db.query(models.TaskStatus.task_id)
+        .filter(models.TaskStatus.entity_status == "Active")
+        .group_by(models.TaskStatus.task_id)
+        .having(func.count() > 1)
+        .first()
+        .task_id
+    )
+    return (
+        db.query(models.TaskStatus)
+        .filter(
+            models.TaskStatus.task_id == task_id,
+            models.TaskStatus.entity_status == "Active",
+        )
+        .order_by(models.TaskStatus.action_date, models.TaskStatus.task_status_id)
+        .all()
+    )
+
+
+def test_patch_older_task_status(client, db, auth):
+    older, latest = status_history(db)[-2:]
+
+    response = client.patch(
+        f"/api/TaskStatus/{older.task_status_id}",
+        json={"remarks": "corrected history"},
+        headers=auth,
+    )
+    assert response.status_code == 200
+    assert response.json()["task_status_id"] == older.task_status_id
+    assert response.json()["remarks"] == "corrected history"
+    db.expire_all()
+    assert db.get(models.TaskStatus, older.task_status_id).remarks == (
+        "corrected history"
+    )
+
+    response = client.patch(
+        f"/api/TaskStatus/{latest.task_status_id}",
+        json={"remarks": latest.remarks},
+        headers=auth,
+    )
+    assert response.status_code == 200
+    assert response.json()["task_name"]
+
+
+def test_patch_employee_rejects_null_password(client, db, auth):
+    employee = db.query(models.Employee).order_by(models.Employee.employee_id).first()
+    password = employee.password
+
+    response = client.patch(
+        f"/api/Employees/{employee.employee_id}",
+        json={"password": None},
+        headers=auth,
+    )
+    assert response.status_code == 422
+    db.expire_all()
+    assert db.get(models.Employee, employee.employee_id).password == password